@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+from functools import partial
 from typing import Any, Dict, List
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -16,23 +17,59 @@ from .const import (
     CONF_SCAN_INTERVAL,
     CONF_UNIT_ID,
     CONF_CIRCUITS,
+    CONF_WRITE_BEHIND,
+    CONF_WRITE_VERIFY,
+    CONF_CONNECTION_MODE,
+    CONF_MAX_READ_GAP,
+    CONF_NORMAL_INTERVAL,
+    CONF_PIPELINING,
+    CONF_SLOW_INTERVAL,
+    CONF_STATIC_INTERVAL,
+    CONF_WRITE_BUDGET,
+    CONF_WRITE_BUDGET_POLICY,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DATA_PRESETS,
     DATA_REGISTERS,
+    DATA_SCHEDULE,
     DEFAULT_CIRCUITS,
+    DEFAULT_CONNECTION_MODE,
+    DEFAULT_MAX_READ_GAP,
+    DEFAULT_NORMAL_INTERVAL,
+    DEFAULT_PIPELINING,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_INTERVAL,
+    DEFAULT_STATIC_INTERVAL,
+    DEFAULT_WRITE_BEHIND,
+    DEFAULT_WRITE_BUDGET_PER_DAY,
+    DEFAULT_WRITE_BUDGET_POLICY,
+    DEFAULT_WRITE_VERIFY,
     DOMAIN,
     PLATFORMS,
+    PRESET_STORAGE_VERSION,
+    REGISTER_PACK_FILE,
+    SCHEDULE_STORAGE_VERSION,
+    WRITE_BEHIND_STORAGE_VERSION,
+    WRITE_BUDGET_STORAGE_VERSION,
+    WRITE_DEBOUNCE_SECONDS,
 )
 from .coordinator import KebaCoordinator
 from .modbus_client import KebaModbusClient
 from .models import ModbusRegister
+from .presets import PresetStore
+from .register_pack import load_register_pack
+from .schedule import SetpointSchedule
+from .services import async_setup_services, async_write_values
+from .write_behind import WriteBehindQueue
+from .write_budget import WriteBudget
+from .write_utils import DebounceScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up via YAML is not supported; config flow only."""
+    async_setup_services(hass)
     return True
 
 
@@ -51,6 +88,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         CONF_CIRCUITS,
         entry.data.get(CONF_CIRCUITS, DEFAULT_CIRCUITS),
     )
+    max_read_gap = entry.options.get(CONF_MAX_READ_GAP, DEFAULT_MAX_READ_GAP)
+    pipelining = entry.options.get(CONF_PIPELINING, DEFAULT_PIPELINING)
+    connection_mode = entry.options.get(CONF_CONNECTION_MODE, DEFAULT_CONNECTION_MODE)
+    tier_intervals = {
+        "normal": entry.options.get(CONF_NORMAL_INTERVAL, DEFAULT_NORMAL_INTERVAL),
+        "slow": entry.options.get(CONF_SLOW_INTERVAL, DEFAULT_SLOW_INTERVAL),
+        "static": entry.options.get(CONF_STATIC_INTERVAL, DEFAULT_STATIC_INTERVAL),
+    }
 
     # 🔁 Load registers in executor (no blocking I/O in event loop)
     registers = await _async_load_registers(hass)
@@ -75,25 +120,88 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         hass.loop.call_soon_threadsafe(_schedule_notification)
 
+    # Write counts and the remaining budget survive restarts.
+    write_budget = WriteBudget(
+        Store(
+            hass,
+            WRITE_BUDGET_STORAGE_VERSION,
+            f"{DOMAIN}.{entry.entry_id}.write_budget",
+        ),
+        per_day=entry.options.get(CONF_WRITE_BUDGET, DEFAULT_WRITE_BUDGET_PER_DAY),
+        policy=entry.options.get(
+            CONF_WRITE_BUDGET_POLICY, DEFAULT_WRITE_BUDGET_POLICY
+        ),
+    )
+    await write_budget.async_load()
+
+    write_behind: WriteBehindQueue | None = None
+    if entry.options.get(CONF_WRITE_BEHIND, DEFAULT_WRITE_BEHIND):
+        write_behind = WriteBehindQueue(
+            Store(
+                hass,
+                WRITE_BEHIND_STORAGE_VERSION,
+                f"{DOMAIN}.{entry.entry_id}.write_behind",
+            )
+        )
+        await write_behind.async_load(registers)
+
     client = KebaModbusClient(
-        host, port, unit_id, warning_callback=_notify_write_warning
+        host,
+        port,
+        unit_id,
+        warning_callback=_notify_write_warning,
+        max_read_gap=max_read_gap,
+        pipelining=pipelining,
+        connection_mode=connection_mode,
+        write_budget=write_budget,
+        write_behind=write_behind,
+        write_verify=entry.options.get(CONF_WRITE_VERIFY, DEFAULT_WRITE_VERIFY),
     )
+    # Coalesce the register list into block reads once, before the first poll.
+    client.plan_reads(registers)
 
     coordinator = KebaCoordinator(
         hass=hass,
         client=client,
         registers=registers,
         scan_interval=scan_interval,
+        tier_intervals=tier_intervals,
+    )
+    # Entity writes of this entry share one debounce timer and flush as a batch.
+    coordinator.write_scheduler = DebounceScheduler(
+        hass, coordinator, client, WRITE_DEBOUNCE_SECONDS
     )
 
     # First refresh to populate data
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Stop the background reconnect task; HA retries the whole setup.
+        await client.async_close()
+        raise
+
+    presets = PresetStore(
+        Store(hass, PRESET_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.presets")
+    )
+    await presets.async_load()
 
-    hass.data[DOMAIN][entry.entry_id] = {
+    entry_data: Dict[str, Any] = {
         DATA_CLIENT: client,
         DATA_COORDINATOR: coordinator,
         DATA_REGISTERS: registers,
+        DATA_PRESETS: presets,
     }
+    schedule = SetpointSchedule(
+        hass,
+        Store(hass, SCHEDULE_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.schedule"),
+        registers,
+        partial(async_write_values, entry_data, strict=False),
+        write_budget=write_budget,
+    )
+    await schedule.async_load()
+    schedule.async_start()
+    entry_data[DATA_SCHEDULE] = schedule
+    hass.data[DOMAIN][entry.entry_id] = entry_data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -106,52 +214,45 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     data = hass.data[DOMAIN].pop(entry.entry_id, None)
     if data is not None:
+        schedule: SetpointSchedule | None = data.get(DATA_SCHEDULE)
+        if schedule:
+            schedule.async_stop()
         client: KebaModbusClient = data.get(DATA_CLIENT)
         if client:
-            await hass.async_add_executor_job(client.close)
+            await client.async_close()
 
     return unload_ok
 
 
 async def _async_load_registers(hass: HomeAssistant) -> List[ModbusRegister]:
-    """Load Modbus register descriptions from JSON files in a worker thread."""
+    """Load Modbus register descriptions from JSON files in a worker thread.
+
+    The parsed registers are cached in a register pack next to the byte-code
+    cache and only rebuilt when the JSON files change.
+    """
     base_path = os.path.dirname(__file__)
     register_dir = os.path.join(base_path, "modbus_registers")
     json_path = os.path.join(base_path, "modbus_registers.json")
+    pack_path = os.path.join(base_path, "__pycache__", REGISTER_PACK_FILE)
 
     def _load() -> List[ModbusRegister]:
-        regs: List[ModbusRegister] = []
-
         if os.path.isdir(register_dir):
-            for file_name in sorted(os.listdir(register_dir)):
-                if not file_name.endswith(".json"):
-                    continue
-
-                file_path = os.path.join(register_dir, file_name)
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data: Dict[str, Any] = json.load(f)
-
-                for item in data.get("registers", []):
-                    regs.append(ModbusRegister(**item))
-
-                _LOGGER.debug(
-                    "Loaded %s Modbus registers from %s",
-                    len(data.get("registers", [])),
-                    file_path,
-                )
-            _LOGGER.info(
-                "Loaded %s Modbus registers from %s", len(regs), register_dir
-            )
+            source = register_dir
+            paths = [
+                os.path.join(register_dir, file_name)
+                for file_name in sorted(os.listdir(register_dir))
+                if file_name.endswith(".json")
+            ]
         else:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data: Dict[str, Any] = json.load(f)
+            source = json_path
+            paths = [json_path]
 
-            for item in data.get("registers", []):
-                regs.append(ModbusRegister(**item))
+        regs = load_register_pack(paths, pack_path)
+        _LOGGER.info("Loaded %s Modbus registers from %s", len(regs), source)
 
-            _LOGGER.info(
-                "Loaded %s Modbus registers from %s", len(regs), json_path
-            )
+        # Compile the register codecs here instead of on the first poll.
+        for reg in regs:
+            reg.codec  # noqa: B018
 
         return regs
 
@@ -41,7 +41,7 @@ class KebaBinarySensor(CoordinatorEntity[KebaCoordinator], BinarySensorEntity):
     def __init__(
         self, coordinator: KebaCoordinator, entry: ConfigEntry, reg: ModbusRegister
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({reg.unique_id}))
         self._entry = entry
         self._reg = reg
 
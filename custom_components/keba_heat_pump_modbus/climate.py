@@ -18,7 +18,12 @@ from .const import DATA_CLIENT, DATA_COORDINATOR, DATA_REGISTERS, DEVICE_NAME_MA
 from .coordinator import KebaCoordinator
 from .modbus_client import KebaModbusClient
 from .models import ModbusRegister
-from .write_utils import DebouncedRegisterWriter, values_equal
+from .write_utils import (
+    DebouncedRegisterWriter,
+    async_write_with_read_back,
+    pending_write_attributes,
+    values_equal,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -99,7 +104,16 @@ class KebaHeatingCircuitClimate(CoordinatorEntity[KebaCoordinator], ClimateEntit
         client: KebaModbusClient,
         device_key: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset(
+                {
+                    current_temp_reg.unique_id,
+                    target_temp_reg.unique_id,
+                    mode_reg.unique_id,
+                }
+            ),
+        )
         self._entry = entry
         self._current_temp_reg = current_temp_reg
         self._target_temp_reg = target_temp_reg
@@ -132,15 +146,8 @@ class KebaHeatingCircuitClimate(CoordinatorEntity[KebaCoordinator], ClimateEntit
         self._off_mode_value: int | None = None
         self._heat_mode_value: int | None = None
 
-        value_map = mode_reg.value_map or {}
-        for raw_key, raw_value in value_map.items():
-            if raw_value is None:
-                continue
-            try:
-                value = int(raw_key)
-            except (TypeError, ValueError):
-                continue
-            preset = str(raw_value)
+        for value, option in (mode_reg.codec.value_to_option or {}).items():
+            preset = str(option)
             self._value_to_preset[value] = preset
             self._preset_to_value[preset.lower()] = value
             self._preset_lookup[preset.lower()] = preset
@@ -155,11 +162,11 @@ class KebaHeatingCircuitClimate(CoordinatorEntity[KebaCoordinator], ClimateEntit
                         self._heat_mode_value = value
                         break
         self._debounced_writer = DebouncedRegisterWriter(
-            hass=coordinator.hass,
             coordinator=self.coordinator,
             client=self._client,
             reg=self._target_temp_reg,
             current_value=self._current_target_temperature,
+            scheduler=coordinator.write_scheduler,
         )
 
     @property
@@ -185,13 +192,20 @@ class KebaHeatingCircuitClimate(CoordinatorEntity[KebaCoordinator], ClimateEntit
 
     @property
     def target_temperature(self) -> float | None:
+        value = self.coordinator.value(self._target_temp_reg.unique_id)
+        return float(value) if value is not None else None
+
+    def _current_target_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
         value = self.coordinator.data.get(self._target_temp_reg.unique_id)
         return float(value) if value is not None else None
 
-    def _current_target_temperature(self) -> float | None:
-        return self.target_temperature
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return pending_write_attributes(
+            self.coordinator, self._target_temp_reg, self._mode_reg
+        )
 
     @property
     def hvac_mode(self) -> HVACMode | None:
@@ -211,9 +225,7 @@ class KebaHeatingCircuitClimate(CoordinatorEntity[KebaCoordinator], ClimateEntit
         return preset
 
     def _raw_mode_value(self) -> int | None:
-        if self.coordinator.data is None:
-            return None
-        raw_mode = self.coordinator.data.get(self._mode_reg.unique_id)
+        raw_mode = self.coordinator.value(self._mode_reg.unique_id)
         if raw_mode is None:
             return None
         if isinstance(raw_mode, str):
@@ -241,10 +253,7 @@ class KebaHeatingCircuitClimate(CoordinatorEntity[KebaCoordinator], ClimateEntit
         mode_value = self._preset_to_value[normalized]
         if values_equal(self._raw_mode_value(), mode_value, None):
             return
-        await self.hass.async_add_executor_job(
-            self._client.write_register, self._mode_reg, mode_value
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_write_mode(mode_value)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         if hvac_mode == HVACMode.OFF:
@@ -260,10 +269,16 @@ class KebaHeatingCircuitClimate(CoordinatorEntity[KebaCoordinator], ClimateEntit
 
         if values_equal(self._raw_mode_value(), mode_value, None):
             return
-        await self.hass.async_add_executor_job(
-            self._client.write_register, self._mode_reg, mode_value
+        await self._async_write_mode(mode_value)
+
+    async def _async_write_mode(self, mode_value: int) -> None:
+        await async_write_with_read_back(
+            self.coordinator,
+            self._client,
+            self._mode_reg,
+            mode_value,
+            (self._mode_reg.codec.value_to_option or {}).get(mode_value, mode_value),
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_will_remove_from_hass(self) -> None:
         self._debounced_writer.cancel()
@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import logging
+import math
+import struct
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TYPE_CHECKING
+
+from pymodbus.exceptions import ModbusException
+
+if TYPE_CHECKING:
+    from .models import ModbusRegister
+
+_LOGGER = logging.getLogger(__name__)
+
+_WORDS = struct.Struct(">HH")
+_INT32 = struct.Struct(">i")
+_FLOAT32 = struct.Struct(">f")
+_FLOAT32_MAX = 3.4028234663852886e38
+_WIDE_TYPES = ("int32", "uint32", "float32")
+
+RawDecoder = Callable[[Sequence[int]], Any]
+
+# Single-word registers convert through a memo keyed by the raw word. Sensor
+# values hover around a few hundred distinct words, so this stays small; the
+# cap only guards against noisy registers.
+_WORD_CACHE_SIZE = 4096
+_MISS = object()
+
+
+def _to_int16(v: int) -> int:
+    return v - 0x10000 if v & 0x8000 else v
+
+
+def _decode_int32(raw: Sequence[int]) -> int:
+    if len(raw) < 2:
+        return _to_int16(raw[0])
+    return _INT32.unpack(_WORDS.pack(raw[0], raw[1]))[0]
+
+
+def _decode_uint32(raw: Sequence[int]) -> int:
+    if len(raw) < 2:
+        return int(raw[0])
+    return (raw[0] << 16) | raw[1]
+
+
+def _decode_float32(raw: Sequence[int]) -> float | int:
+    if len(raw) < 2:
+        return int(raw[0])
+    return _FLOAT32.unpack(_WORDS.pack(raw[0], raw[1]))[0]
+
+
+_RAW_DECODERS: Dict[str, RawDecoder] = {
+    "int16": lambda raw: _to_int16(raw[0]),
+    "uint16": lambda raw: int(raw[0]),
+    "int32": _decode_int32,
+    "uint32": _decode_uint32,
+    "float32": _decode_float32,
+    "boolean": lambda raw: bool(raw[0]),
+}
+_SINGLE_WORD_TYPES = {"int16", "uint16", "boolean"}
+
+
+def _unknown_type(raw: Sequence[int]) -> int:
+    # Unknown type: just return the first raw register
+    return raw[0]
+
+
+def _bulk_layout(reg: ModbusRegister) -> Tuple[str, Callable[[Any], Any] | None]:
+    """Return the struct format covering ``reg.length`` words and a value fixup.
+
+    Mirrors the word decoders above: 32-bit types read from a single word fall
+    back to the 16-bit rule, surplus words are skipped as pad bytes.
+    """
+    length = reg.length
+    data_type = reg.data_type
+    if data_type in ("int32", "uint32", "float32") and length >= 2:
+        code = {"int32": "i", "uint32": "I", "float32": "f"}[data_type]
+        used = 2
+    else:
+        code = "h" if data_type in ("int16", "int32") else "H"
+        used = 1
+    pad = f"{2 * (length - used)}x" if length > used else ""
+    return code + pad, bool if data_type == "boolean" else None
+
+
+def _int_key(key: str) -> int | None:
+    """Return ``key`` as an int if it is the canonical spelling of one."""
+    try:
+        value = int(key)
+    except (TypeError, ValueError):
+        return None
+    return value if str(value) == key else None
+
+
+class RegisterCodec:
+    """Decoder/encoder pair compiled once from a ``ModbusRegister``.
+
+    Everything that only depends on the register description (the word
+    decoder, whether scaling applies, the value map keyed by raw int and its
+    reverse for writes, the write range) is resolved here, so ``decode`` and
+    ``encode`` do no string dispatch per call. Single-word registers are pure
+    functions of one 16-bit word, so their decoded values are memoised.
+
+    ``convert`` is the step after word decoding; ``struct_format`` and
+    ``prepare`` describe how ``BlockDecoder`` extracts the word value from a
+    packed block.
+    """
+
+    __slots__ = (
+        "convert",
+        "decode",
+        "struct_format",
+        "prepare",
+        "value_to_option",
+        "option_to_raw",
+        "_name",
+        "_scale",
+        "_offset",
+        "_write_error",
+        "_pack",
+    )
+
+    def __init__(self, reg: ModbusRegister) -> None:
+        self._name = reg.name
+        self._scale = reg.scale
+        self._offset = reg.offset
+
+        self.value_to_option: Dict[int, Any] | None = None
+        self.option_to_raw: Dict[Any, int] = {}
+        if reg.value_map is not None:
+            self.value_to_option = {}
+            for key, option in reg.value_map.items():
+                raw = _int_key(key)
+                if raw is None or option is None:
+                    continue
+                self.value_to_option.setdefault(raw, option)
+                self.option_to_raw.setdefault(option, raw)
+
+        self.convert = self._compile_converter(reg)
+        self.decode = self._compile_decoder(reg)
+        self.struct_format, self.prepare = _bulk_layout(reg)
+
+        self._write_error: str | None = None
+        # 32-bit types read from a single word decode as 16-bit values, so
+        # they are written back the same way.
+        words = 2 if reg.data_type in _WIDE_TYPES and reg.length >= 2 else 1
+        if reg.register_type != "holding":
+            self._write_error = "Only holding registers can be written"
+        elif reg.length != words:
+            self._write_error = (
+                f"Cannot write {reg.data_type} register {reg.name} "
+                f"spanning {reg.length} words"
+            )
+        self._pack = self._compile_packer(reg, words)
+
+    def _compile_decoder(
+        self, reg: ModbusRegister
+    ) -> Callable[[Sequence[int]], float | int | str | bool | None]:
+        raw_decoder = _RAW_DECODERS.get(reg.data_type, _unknown_type)
+        convert = self.convert
+
+        def decode(raw: Sequence[int]) -> float | int | str | bool | None:
+            if not raw:
+                return None
+            return convert(raw_decoder(raw))
+
+        return decode
+
+    def _compile_converter(
+        self, reg: ModbusRegister
+    ) -> Callable[[Any], float | int | str | bool]:
+        """Fuse scale/offset, value map and precision into one step."""
+        scale, offset = reg.scale, reg.offset
+        try:
+            float(1) * scale + offset
+            scaled = True
+        except Exception:  # noqa: BLE001
+            scaled = False
+        precision = reg.precision
+        value_map = self.value_to_option
+        mapped_any = reg.value_map is not None
+
+        def convert(val: Any) -> float | int | str | bool:
+            numeric = float(val) * scale + offset if scaled else val
+            if mapped_any:
+                mapped = value_map.get(int(val))
+                if mapped is not None:
+                    return mapped
+            if precision is not None and isinstance(numeric, float):
+                return round(numeric, precision)
+            return numeric
+
+        if reg.data_type in _SINGLE_WORD_TYPES or reg.data_type not in _RAW_DECODERS:
+            return self._memoise(convert)
+        return convert
+
+    @staticmethod
+    def _memoise(
+        convert: Callable[[Any], float | int | str | bool],
+    ) -> Callable[[Any], float | int | str | bool]:
+        cache: Dict[int, float | int | str | bool] = {}
+
+        def cached_convert(val: Any) -> float | int | str | bool:
+            value = cache.get(val, _MISS)
+            if value is _MISS:
+                value = convert(val)
+                if len(cache) < _WORD_CACHE_SIZE:
+                    cache[val] = value
+            return value
+
+        return cached_convert
+
+    def _compile_packer(
+        self, reg: ModbusRegister, words: int
+    ) -> Callable[[float], List[int]]:
+        """Build the step from an unscaled value to the words to write."""
+        name = reg.name
+        if words == 2 and reg.data_type == "float32":
+
+            def pack_float(scaled: float) -> List[int]:
+                if not math.isfinite(scaled) or abs(scaled) > _FLOAT32_MAX:
+                    raise ModbusException(
+                        f"Value {scaled} out of range for float32 register {name}"
+                    )
+                return list(_WORDS.unpack(_FLOAT32.pack(scaled)))
+
+            return pack_float
+
+        signed = reg.data_type in ("int16", "int32")
+        bits = 16 * words
+        if signed:
+            low, high = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+            kind = f"signed {bits}-bit"
+        else:
+            low, high = 0, (1 << bits) - 1
+            kind = f"{bits}-bit"
+        mask = (1 << bits) - 1
+
+        def pack_int(scaled: float) -> List[int]:
+            raw_value = int(round(scaled))
+            if raw_value < low or raw_value > high:
+                raise ModbusException(
+                    f"Value {raw_value} out of range for {kind} register {name}"
+                )
+            raw_value &= mask
+            if words == 1:
+                return [raw_value]
+            return [raw_value >> 16, raw_value & 0xFFFF]
+
+        return pack_int
+
+    def encode_words(self, value: float | int | bool) -> List[int]:
+        """Validate ``value`` and return the raw words to write, high word first."""
+        if self._write_error is not None:
+            raise ModbusException(self._write_error)
+
+        if not isinstance(value, (int, float)):
+            raise ModbusException("Unsupported value type for writing")
+        try:
+            scaled_value = (float(value) - self._offset) / self._scale
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error(
+                "Failed to scale value %s for %s: %s", value, self._name, err
+            )
+            raise
+        return self._pack(scaled_value)
+
+    def encode(self, value: float | int | bool) -> int:
+        """Validate ``value`` and return the raw 16-bit word to write."""
+        words = self.encode_words(value)
+        if len(words) != 1:
+            raise ModbusException(
+                f"Register {self._name} spans {len(words)} words; use encode_words"
+            )
+        return words[0]
+
+
+class BlockDecoder:
+    """Decode every register of one contiguous run of words in a single pass.
+
+    The registers are laid out as one big-endian ``struct`` format with pad
+    bytes for unused words, so a whole block response is unpacked by a single
+    C call before the per-register ``convert`` step. Registers that overlap an
+    earlier one (or poke past the run) cannot be expressed that way and are
+    decoded one by one.
+    """
+
+    __slots__ = (
+        "address",
+        "count",
+        "_registers",
+        "_words",
+        "_layout",
+        "_fields",
+        "_fallback",
+    )
+
+    def __init__(
+        self, address: int, count: int, registers: Sequence[ModbusRegister]
+    ) -> None:
+        self.address = address
+        self.count = count
+        self._registers = list(registers)
+        self._words = struct.Struct(f">{count}H")
+        self._fields: List[
+            Tuple[str, Callable[[Any], Any] | None, Callable[[Any], Any], str, int]
+        ] = []
+        self._fallback: List[ModbusRegister] = []
+
+        parts = [">"]
+        cursor = address
+        for reg in sorted(registers, key=lambda r: r.address):
+            end = reg.address + reg.length
+            if reg.length < 1 or reg.address < cursor or end > address + count:
+                self._fallback.append(reg)
+                continue
+            if reg.address > cursor:
+                parts.append(f"{2 * (reg.address - cursor)}x")
+            codec = reg.codec
+            parts.append(codec.struct_format)
+            self._fields.append(
+                (reg.unique_id, codec.prepare, codec.convert, reg.name, reg.address)
+            )
+            cursor = end
+        if cursor < address + count:
+            parts.append(f"{2 * (address + count - cursor)}x")
+        self._layout = struct.Struct("".join(parts))
+
+    def decode(self, words: Sequence[int]) -> Dict[str, float | int | str | bool | None]:
+        """Return unique_id -> value for ``words`` starting at ``address``."""
+        if len(words) < self.count:
+            return self._decode_each(words, self._registers)
+        if len(words) > self.count:
+            words = words[: self.count]
+        try:
+            values = self._layout.unpack(self._words.pack(*words))
+        except struct.error:
+            # Not 16-bit words; let the per-register decoders deal with it.
+            return self._decode_each(words, self._registers)
+        result: Dict[str, float | int | str | bool | None] = {}
+        for (unique_id, prepare, convert, name, address), val in zip(
+            self._fields, values
+        ):
+            try:
+                result[unique_id] = convert(prepare(val) if prepare else val)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.exception(
+                    "Exception decoding register %s (%s): %s", name, address, err
+                )
+                result[unique_id] = None
+
+        if self._fallback:
+            result.update(self._decode_each(words, self._fallback))
+        return result
+
+    def _decode_each(
+        self, words: Sequence[int], registers: Sequence[ModbusRegister]
+    ) -> Dict[str, float | int | str | bool | None]:
+        result: Dict[str, float | int | str | bool | None] = {}
+        for reg in registers:
+            start = reg.address - self.address
+            try:
+                value = reg.codec.decode(words[start : start + reg.length])
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.exception(
+                    "Exception decoding register %s (%s): %s",
+                    reg.name,
+                    reg.address,
+                    err,
+                )
+                value = None
+            result[reg.unique_id] = value
+        return result
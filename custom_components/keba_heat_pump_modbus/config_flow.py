@@ -14,10 +14,32 @@ from .const import (
     CONF_UNIT_ID,
     CONF_SCAN_INTERVAL,
     CONF_CIRCUITS,
+    CONF_CONNECTION_MODE,
+    CONF_MAX_READ_GAP,
+    CONF_NORMAL_INTERVAL,
+    CONF_PIPELINING,
+    CONF_SLOW_INTERVAL,
+    CONF_STATIC_INTERVAL,
+    CONF_WRITE_BEHIND,
+    CONF_WRITE_BUDGET,
+    CONF_WRITE_BUDGET_POLICY,
+    CONF_WRITE_VERIFY,
+    CONNECTION_MODES,
     DEFAULT_PORT,
     DEFAULT_UNIT_ID,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_CIRCUITS,
+    DEFAULT_CONNECTION_MODE,
+    DEFAULT_MAX_READ_GAP,
+    DEFAULT_NORMAL_INTERVAL,
+    DEFAULT_PIPELINING,
+    DEFAULT_SLOW_INTERVAL,
+    DEFAULT_STATIC_INTERVAL,
+    DEFAULT_WRITE_BEHIND,
+    DEFAULT_WRITE_BUDGET_PER_DAY,
+    DEFAULT_WRITE_BUDGET_POLICY,
+    DEFAULT_WRITE_VERIFY,
+    WRITE_BUDGET_POLICIES,
 )
 
 
@@ -92,7 +114,6 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         errors: Dict[str, str] = {}
 
         if user_input is not None:
-            # Only scan interval right now
             return self.async_create_entry(
                 title="",
                 data=user_input,
@@ -111,6 +132,36 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 DEFAULT_CIRCUITS,
             ),
         )
+        current_read_gap = self._entry.options.get(
+            CONF_MAX_READ_GAP, DEFAULT_MAX_READ_GAP
+        )
+        current_pipelining = self._entry.options.get(
+            CONF_PIPELINING, DEFAULT_PIPELINING
+        )
+        current_connection_mode = self._entry.options.get(
+            CONF_CONNECTION_MODE, DEFAULT_CONNECTION_MODE
+        )
+        current_normal = self._entry.options.get(
+            CONF_NORMAL_INTERVAL, DEFAULT_NORMAL_INTERVAL
+        )
+        current_slow = self._entry.options.get(
+            CONF_SLOW_INTERVAL, DEFAULT_SLOW_INTERVAL
+        )
+        current_static = self._entry.options.get(
+            CONF_STATIC_INTERVAL, DEFAULT_STATIC_INTERVAL
+        )
+        current_budget = self._entry.options.get(
+            CONF_WRITE_BUDGET, DEFAULT_WRITE_BUDGET_PER_DAY
+        )
+        current_budget_policy = self._entry.options.get(
+            CONF_WRITE_BUDGET_POLICY, DEFAULT_WRITE_BUDGET_POLICY
+        )
+        current_write_behind = self._entry.options.get(
+            CONF_WRITE_BEHIND, DEFAULT_WRITE_BEHIND
+        )
+        current_write_verify = self._entry.options.get(
+            CONF_WRITE_VERIFY, DEFAULT_WRITE_VERIFY
+        )
 
         data_schema = vol.Schema(
             {
@@ -120,6 +171,36 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(
                     CONF_CIRCUITS, default=current_circuits
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=4)),
+                vol.Required(
+                    CONF_NORMAL_INTERVAL, default=current_normal
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_SLOW_INTERVAL, default=current_slow
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_STATIC_INTERVAL, default=current_static
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_MAX_READ_GAP, default=current_read_gap
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=64)),
+                vol.Required(
+                    CONF_PIPELINING, default=current_pipelining
+                ): bool,
+                vol.Required(
+                    CONF_CONNECTION_MODE, default=current_connection_mode
+                ): vol.In(CONNECTION_MODES),
+                vol.Required(
+                    CONF_WRITE_BUDGET, default=current_budget
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Required(
+                    CONF_WRITE_BUDGET_POLICY, default=current_budget_policy
+                ): vol.In(WRITE_BUDGET_POLICIES),
+                vol.Required(
+                    CONF_WRITE_BEHIND, default=current_write_behind
+                ): bool,
+                vol.Required(
+                    CONF_WRITE_VERIFY, default=current_write_verify
+                ): bool,
             }
         )
 
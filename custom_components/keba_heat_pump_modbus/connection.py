@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import socket
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, List
+
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
+
+from .const import (
+    CONNECTION_MODE_PER_CYCLE,
+    DEFAULT_CONNECTION_MODE,
+    IDLE_PROBE_SECONDS,
+    RECONNECT_BACKOFF_MAX_SECONDS,
+    RECONNECT_BACKOFF_MIN_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CONNECTED = "connected"
+STATE_DISCONNECTED = "disconnected"
+STATE_BACKOFF = "backoff"
+CONNECTION_STATES = [STATE_CONNECTED, STATE_DISCONNECTED, STATE_BACKOFF]
+
+
+def is_connection_error(err: BaseException) -> bool:
+    """Return True for errors that mean the link itself is unusable."""
+    return isinstance(
+        err,
+        (
+            ConnectionException,
+            ModbusIOException,
+            ConnectionError,
+            OSError,
+            asyncio.TimeoutError,
+        ),
+    )
+
+
+def configure_socket(sock: socket.socket | None) -> None:
+    """Enable TCP keepalive and disable Nagle on a Modbus TCP socket."""
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Linux only: notice a dead peer after ~30 s instead of ~2 h.
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 10)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5)
+        if hasattr(socket, "TCP_KEEPCNT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4)
+    except OSError as err:
+        _LOGGER.debug("Unable to configure Modbus socket options: %s", err)
+
+
+class ConnectionManager:
+    """Own the lifecycle of the async Modbus connection.
+
+    Every async read or write runs inside ``session()``. A session fails right
+    away while the link is known to be down; a background task reconnects with
+    exponential backoff and jitter, independent of the poll schedule. Before a
+    session on a link that has been idle for a while, a cheap probe read
+    detects half-open sockets. In ``per_cycle`` mode the connection is opened
+    for each session and released afterwards, for controllers that only
+    accept a single client.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[None]],
+        disconnect: Callable[[], Awaitable[None]],
+        probe: Callable[[], Awaitable[None]],
+        is_connected: Callable[[], bool],
+        mode: str = DEFAULT_CONNECTION_MODE,
+        name: str = "",
+        idle_probe_seconds: float = IDLE_PROBE_SECONDS,
+        backoff_min: float = RECONNECT_BACKOFF_MIN_SECONDS,
+        backoff_max: float = RECONNECT_BACKOFF_MAX_SECONDS,
+    ) -> None:
+        self._connect = connect
+        self._disconnect = disconnect
+        self._probe = probe
+        self._is_connected = is_connected
+        self.mode = mode
+        self._name = name
+        self._idle_probe_seconds = idle_probe_seconds
+        self._backoff_min = backoff_min
+        self._backoff_max = backoff_max
+        self.state = STATE_DISCONNECTED
+        self.reconnect_count = 0
+        self.last_error: str | None = None
+        self._last_activity: float | None = None
+        self._users = 0
+        self._lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._listeners: List[Callable[[], None]] = []
+
+    # ------------------------------------------------------------------
+    #  Listeners (diagnostic entities)
+    # ------------------------------------------------------------------
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def _set_state(self, state: str) -> None:
+        if state == self.state:
+            return
+        _LOGGER.debug("Modbus connection %s: %s -> %s", self._name, self.state, state)
+        self.state = state
+        for listener in list(self._listeners):
+            listener()
+
+    # ------------------------------------------------------------------
+    #  Sessions
+    # ------------------------------------------------------------------
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[None]:
+        await self._acquire()
+        try:
+            yield
+        except Exception as err:
+            if is_connection_error(err):
+                await self.async_report_failure(err)
+            raise
+        else:
+            self.mark_activity()
+        finally:
+            await self._release()
+
+    def mark_activity(self) -> None:
+        self._last_activity = time.monotonic()
+
+    async def _acquire(self) -> None:
+        if self.state == STATE_BACKOFF:
+            raise ModbusException(
+                f"Modbus link to {self._name} is down ({self.last_error}); reconnecting"
+            )
+
+        async with self._lock:
+            self._users += 1
+            try:
+                if not self._is_connected():
+                    await self._connect()
+                    self._last_activity = None
+                elif (
+                    self._last_activity is not None
+                    and time.monotonic() - self._last_activity > self._idle_probe_seconds
+                ):
+                    await self._probe()
+                    self.mark_activity()
+                self._set_state(STATE_CONNECTED)
+            except Exception as err:
+                self._users -= 1
+                if is_connection_error(err) or isinstance(err, ModbusException):
+                    await self.async_report_failure(err)
+                raise
+
+    async def _release(self) -> None:
+        self._users = max(0, self._users - 1)
+        if (
+            self.mode == CONNECTION_MODE_PER_CYCLE
+            and self._users == 0
+            and self.state == STATE_CONNECTED
+        ):
+            await self._disconnect()
+            self._set_state(STATE_DISCONNECTED)
+
+    # ------------------------------------------------------------------
+    #  Failure handling and reconnect
+    # ------------------------------------------------------------------
+    async def async_report_failure(self, err: BaseException) -> None:
+        """Mark the link as down and start reconnecting in the background."""
+        self.last_error = str(err) or type(err).__name__
+        if self.state == STATE_BACKOFF:
+            return
+        _LOGGER.warning("Modbus link to %s lost: %s", self._name, self.last_error)
+        await self._disconnect()
+        self._set_state(STATE_BACKOFF)
+        self._reconnect_task = asyncio.get_running_loop().create_task(
+            self._reconnect_loop()
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = min(self._backoff_max, self._backoff_min * (2**attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _reconnect_loop(self) -> None:
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._backoff_delay(attempt))
+            try:
+                async with self._lock:
+                    await self._connect()
+                    await self._probe()
+            except Exception as err:  # noqa: BLE001
+                self.last_error = str(err) or type(err).__name__
+                attempt += 1
+                _LOGGER.debug(
+                    "Reconnect attempt %s to %s failed: %s", attempt, self._name, err
+                )
+                await self._disconnect()
+                continue
+
+            self.reconnect_count += 1
+            self.last_error = None
+            self.mark_activity()
+            _LOGGER.info("Modbus link to %s restored", self._name)
+            self._reconnect_task = None
+            if self.mode == CONNECTION_MODE_PER_CYCLE and self._users == 0:
+                await self._disconnect()
+                self._set_state(STATE_DISCONNECTED)
+            else:
+                self._set_state(STATE_CONNECTED)
+            return
+
+    async def async_stop(self) -> None:
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        await self._disconnect()
+        self._set_state(STATE_DISCONNECTED)
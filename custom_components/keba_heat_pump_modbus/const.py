@@ -18,18 +18,91 @@ CONF_PORT = "port"
 CONF_UNIT_ID = "unit_id"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_CIRCUITS = "heat_circuits_used"
+CONF_MAX_READ_GAP = "max_read_gap"
+CONF_PIPELINING = "pipelining"
+CONF_CONNECTION_MODE = "connection_mode"
+CONF_NORMAL_INTERVAL = "normal_interval"
+CONF_SLOW_INTERVAL = "slow_interval"
+CONF_STATIC_INTERVAL = "static_interval"
+CONF_WRITE_BUDGET = "write_budget_per_day"
+CONF_WRITE_BUDGET_POLICY = "write_budget_policy"
+CONF_WRITE_BEHIND = "write_behind"
+CONF_WRITE_VERIFY = "write_verify"
 
 DEFAULT_PORT = 502
 DEFAULT_UNIT_ID = 1
-DEFAULT_SCAN_INTERVAL = 30  # seconds
+DEFAULT_SCAN_INTERVAL = 30  # seconds, also the interval of the "realtime" tier
+DEFAULT_NORMAL_INTERVAL = 60  # seconds
+DEFAULT_SLOW_INTERVAL = 600  # seconds
+DEFAULT_STATIC_INTERVAL = 3600  # seconds
 DEFAULT_CIRCUITS = 1
+DEFAULT_MAX_READ_GAP = 8  # unused words tolerated between registers of one block read
+MAX_READ_BLOCK_SIZE = 125  # Modbus PDU limit for a single register read
+MAX_CACHED_READ_PLANS = 32
+# Share of the coordinator tick a poll may spend reading before the remaining
+# registers are carried over to the next cycle.
+POLL_BUDGET_FRACTION = 0.8
+DEFAULT_PIPELINING = False
+DEFAULT_PIPELINE_MAX_WINDOW = 8  # upper bound for the in-flight request probe
+MODBUS_TIMEOUT_SECONDS = 3.0
+CONNECTION_MODE_PERSISTENT = "persistent"
+CONNECTION_MODE_PER_CYCLE = "per_cycle"
+CONNECTION_MODES = [CONNECTION_MODE_PERSISTENT, CONNECTION_MODE_PER_CYCLE]
+DEFAULT_CONNECTION_MODE = CONNECTION_MODE_PERSISTENT
+IDLE_PROBE_SECONDS = 20  # probe the link before a cycle after this much idle time
+RECONNECT_BACKOFF_MIN_SECONDS = 1.0
+RECONNECT_BACKOFF_MAX_SECONDS = 300.0
 WRITE_DEBOUNCE_SECONDS = 0.5
+WRITE_COALESCE_SECONDS = 0.05  # collect writes this long before flushing them
+MAX_WRITE_REGISTERS = 123  # FC16 limit per request
+# Write and read back in one FC23 request where the controller supports it.
+DEFAULT_WRITE_VERIFY = False
+MAX_WRITE_READ_REGISTERS = 121  # FC23 limit for the written words
 WRITE_WARNING_THRESHOLD = 30
 WRITE_WARNING_WINDOW_SECONDS = 7 * 24 * 60 * 60
+# Register writes allowed per day, with a burst of WRITE_BUDGET_BURST writes;
+# 0 only counts writes without limiting them.
+DEFAULT_WRITE_BUDGET_PER_DAY = 0
+WRITE_BUDGET_BURST = 10
+WRITE_BUDGET_POLICY_DELAY = "delay"
+WRITE_BUDGET_POLICY_REJECT = "reject"
+WRITE_BUDGET_POLICIES = [WRITE_BUDGET_POLICY_DELAY, WRITE_BUDGET_POLICY_REJECT]
+DEFAULT_WRITE_BUDGET_POLICY = WRITE_BUDGET_POLICY_DELAY
+# Longest a write is held for tokens under the delay policy; callers such as
+# service calls await the write, so a longer wait fails it instead.
+WRITE_BUDGET_MAX_WAIT_SECONDS = 5
+WRITE_BUDGET_SAVE_DELAY_SECONDS = 10
+WRITE_BUDGET_STORAGE_VERSION = 1
+# Queue writes made while the link is down and send them once it is back.
+DEFAULT_WRITE_BEHIND = False
+WRITE_BEHIND_SAVE_DELAY_SECONDS = 1
+WRITE_BEHIND_STORAGE_VERSION = 1
+
+# Parsed register descriptions, cached until the JSON files change.
+REGISTER_PACK_FILE = "modbus_registers.pack"
+REGISTER_PACK_VERSION = 2
+
+POLL_TIERS = ("realtime", "normal", "slow", "static")
 
 DATA_COORDINATOR = "coordinator"
 DATA_REGISTERS = "registers"
 DATA_CLIENT = "client"
+DATA_PRESETS = "presets"
+DATA_SCHEDULE = "schedule"
+
+SERVICE_WRITE_REGISTERS = "write_registers"
+SERVICE_SAVE_PRESET = "save_preset"
+SERVICE_RESTORE_PRESET = "restore_preset"
+SERVICE_DELETE_PRESET = "delete_preset"
+SERVICE_SET_SCHEDULE = "set_schedule"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_NAME = "name"
+ATTR_VALUES = "values"
+ATTR_SLOTS = "slots"
+ATTR_DAYS = "days"
+ATTR_TIME = "time"
+PRESET_STORAGE_VERSION = 1
+SCHEDULE_STORAGE_VERSION = 1
 
 PLATFORMS = [
     Platform.SENSOR,
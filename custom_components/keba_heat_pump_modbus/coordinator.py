@@ -1,21 +1,49 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import timedelta
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Set, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_NORMAL_INTERVAL,
+    DEFAULT_SLOW_INTERVAL,
+    DEFAULT_STATIC_INTERVAL,
+    DOMAIN,
+    POLL_BUDGET_FRACTION,
+    POLL_TIERS,
+)
+from .io_worker import PRIORITY_READ
 from .models import ModbusRegister
 from .modbus_client import KebaModbusClient
 
+if TYPE_CHECKING:
+    from .write_utils import DebounceScheduler
+
 _LOGGER = logging.getLogger(__name__)
 
 
-class KebaCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
-    """Coordinator to poll KEBA heat pump over Modbus."""
+class KebaCoordinator(DataUpdateCoordinator[Mapping[str, Any]]):
+    """Coordinator to poll KEBA heat pump over Modbus.
+
+    Registers are split into poll tiers that are re-read on their own interval.
+    The coordinator ticks at the fastest tier's interval and only reads the tiers
+    that are due, merging the values into the previously known data.
+
+    Each cycle may spend at most ``POLL_BUDGET_FRACTION`` of the tick reading.
+    Registers left unread when the budget runs out are carried over to the
+    front of the next cycle, so a slow link delays values instead of making
+    polls overrun.
+
+    The data is the client's register image, a mapping that only decodes a
+    register again once its raw words changed. Every cycle records which
+    values changed. Entities subscribe with the ``unique_id`` keys they render
+    as their listener context, and only the entities whose keys changed are
+    notified.
+    """
 
     def __init__(
         self,
@@ -23,19 +51,278 @@ class KebaCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         client: KebaModbusClient,
         registers: List[ModbusRegister],
         scan_interval: int,
+        tier_intervals: Dict[str, int] | None = None,
     ) -> None:
+        intervals = {
+            "realtime": scan_interval,
+            "normal": DEFAULT_NORMAL_INTERVAL,
+            "slow": DEFAULT_SLOW_INTERVAL,
+            "static": DEFAULT_STATIC_INTERVAL,
+        }
+        intervals.update(tier_intervals or {})
+
+        self._tier_registers: Dict[str, List[ModbusRegister]] = {}
+        for reg in registers:
+            tier = reg.poll_tier if reg.poll_tier in POLL_TIERS else "normal"
+            self._tier_registers.setdefault(tier, []).append(reg)
+
+        active = [intervals[tier] for tier in self._tier_registers] or [scan_interval]
+        tick = min(active)
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN} coordinator",
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=tick),
         )
         self._client = client
         self._registers = registers
+        self._register_map = {reg.unique_id: reg for reg in registers}
+        self._tier_intervals = intervals
+        self._tick = tick
+        self._tier_last_read: Dict[str, float] = {}
+        self._values: Dict[str, Any] = {}
+        self._budget = tick * POLL_BUDGET_FRACTION
+        self._carry_over: List[ModbusRegister] = []
+        self._read_at: Dict[str, float] = {}
+        self._changed: Set[str] | None = None
+        self._notified_success: bool | None = None
+        self._pending: Dict[str, Any] = {}
+        self._write_errors: Dict[str, str] = {}
+        # The entry's debounce timer for entity writes, set up with the entry.
+        self.write_scheduler: DebounceScheduler | None = None
+        write_behind = getattr(client, "write_behind", None)
+        if write_behind is not None:
+            # Queued writes flushed after a reconnect are read back like any other.
+            write_behind.on_flushed = self.async_refresh_registers
+
+    def last_read(self, unique_id: str) -> float | None:
+        """Return the ``time.monotonic()`` timestamp of the last read of a register."""
+        return self._read_at.get(unique_id)
+
+    def value_age(self, unique_id: str) -> float | None:
+        """Return how many seconds ago a register was last read."""
+        read_at = self._read_at.get(unique_id)
+        if read_at is None:
+            return None
+        return time.monotonic() - read_at
+
+    # ------------------------------------------------------------------
+    #  Optimistic writes
+    # ------------------------------------------------------------------
+    def value(self, unique_id: str) -> Any:
+        """Return the value to show: a pending write's value, else the polled one."""
+        if unique_id in self._pending:
+            return self._pending[unique_id]
+        if self.data is None:
+            return None
+        return self.data.get(unique_id)
+
+    def is_pending(self, unique_id: str) -> bool:
+        return unique_id in self._pending
+
+    def write_error(self, unique_id: str) -> str | None:
+        """Why the last write to ``unique_id`` was rolled back, if it was."""
+        return self._write_errors.get(unique_id)
+
+    @callback
+    def set_pending(self, unique_id: str, value: Any) -> None:
+        """Show ``value`` for ``unique_id`` until the write is confirmed or rolled back."""
+        self._pending[unique_id] = value
+        self._write_errors.pop(unique_id, None)
+        self._notify({unique_id})
+
+    @callback
+    def clear_pending(self, unique_id: str) -> None:
+        """Drop a pending value without a verdict, e.g. a cancelled write."""
+        if self._pending.pop(unique_id, None) is not None:
+            self._notify({unique_id})
+
+    @callback
+    def rollback(self, unique_id: str, reason: str) -> None:
+        """Discard a pending value and remember why the write did not stick."""
+        self._discard_pending(unique_id, reason)
+        self._notify({unique_id})
+
+    def _discard_pending(self, unique_id: str, reason: str) -> None:
+        value = self._pending.pop(unique_id, None)
+        self._write_errors[unique_id] = reason
+        _LOGGER.error("Write of %s to %s rolled back: %s", value, unique_id, reason)
+
+    def _settle_pending(self, unique_ids: Iterable[str]) -> Set[str]:
+        """Confirm or roll back pending values of registers that were just read."""
+        from .write_utils import values_equal
+
+        settled: Set[str] = set()
+        for unique_id in unique_ids:
+            if unique_id not in self._pending or self.data is None:
+                continue
+            requested = self._pending[unique_id]
+            actual = self.data.get(unique_id)
+            reg = self._register_map[unique_id]
+            if values_equal(actual, requested, reg.precision):
+                del self._pending[unique_id]
+            else:
+                self._discard_pending(
+                    unique_id, f"controller reports {actual} instead of {requested}"
+                )
+            settled.add(unique_id)
+        return settled
+
+    @callback
+    def _notify(self, unique_ids: Set[str]) -> None:
+        self._changed = unique_ids
+        self.async_update_listeners()
+
+    def _due_tiers(self, now: float) -> List[str]:
+        """Return the tiers whose interval has elapsed.
+
+        Half a tick of slack keeps a tier from slipping a whole tick when the
+        scheduler fires a little early.
+        """
+        due: List[str] = []
+        for tier in POLL_TIERS:
+            if tier not in self._tier_registers:
+                continue
+            last = self._tier_last_read.get(tier)
+            if last is None or now - last + self._tick / 2 >= self._tier_intervals[tier]:
+                due.append(tier)
+        return due
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose context keys changed this cycle.
+
+        Listeners without a context, updates that did not come from a poll and
+        flips of ``last_update_success`` (availability) still reach everyone.
+        """
+        changed, self._changed = self._changed, None
+        success = self.last_update_success
+        if changed is None or success != self._notified_success or not success:
+            self._notified_success = success
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that re-reads every tier."""
+        self._tier_last_read.clear()
+        await super().async_request_refresh()
+
+    async def _async_update_data(self) -> Mapping[str, Any]:
+        """Fetch the register values of all due poll tiers."""
+        now = time.monotonic()
+        due = self._due_tiers(now)
+        carried = {reg.unique_id for reg in self._carry_over}
+        registers = self._carry_over + [
+            reg
+            for tier in due
+            for reg in self._tier_registers[tier]
+            if reg.unique_id not in carried
+        ]
 
-    async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch all register values."""
         try:
-            return await self.hass.async_add_executor_job(self._client.read_all, self._registers)
+            values = await self._client.async_read_all(registers, budget=self._budget)
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(f"Error updating KEBA Modbus data: {err}") from err
+
+        for tier in due:
+            self._tier_last_read[tier] = now
+        self._carry_over = [reg for reg in registers if reg.unique_id not in values]
+        data, self._changed = self._merge_values(values, now)
+        if self._carry_over:
+            _LOGGER.debug(
+                "Poll budget of %.1fs exhausted; carrying %s registers over",
+                self._budget,
+                len(self._carry_over),
+            )
+        _LOGGER.debug("Polled tiers %s (%s registers)", due, len(values))
+        return data
+
+    def _merge_values(
+        self, values: Mapping[str, Any], now: float
+    ) -> Tuple[Mapping[str, Any], Set[str]]:
+        """Record ``values`` as read at ``now``; return the new data and changed keys."""
+        for unique_id in values:
+            self._read_at[unique_id] = now
+        image = getattr(values, "image", None)
+        if image is not None:
+            # The client keeps a register image and knows which words moved;
+            # values are decoded lazily when entities read them.
+            return image, set(values.changed)
+
+        previous = self._values
+        changed = {
+            key
+            for key, value in values.items()
+            if key not in previous or previous[key] != value
+        }
+        previous.update(values)
+        return dict(previous), changed
+
+    async def async_refresh_registers(self, unique_ids: Iterable[str]) -> None:
+        """Re-read only ``unique_ids`` and the registers they list in ``refresh_with``.
+
+        Meant for the read-back after a write: one small request at read
+        priority instead of a full poll, and only the entities whose values
+        changed are notified. Pending optimistic values of the registers read
+        are confirmed if the controller reports them, and rolled back if it
+        clamped or ignored them. Falls back to a full refresh if the read fails.
+        """
+        registers: Dict[str, ModbusRegister] = {}
+        for unique_id in unique_ids:
+            reg = self._register_map.get(unique_id)
+            if reg is None:
+                continue
+            registers[unique_id] = reg
+            for dependent in reg.refresh_with or ():
+                if dependent in self._register_map:
+                    registers[dependent] = self._register_map[dependent]
+        if not registers:
+            return
+
+        now = time.monotonic()
+        data: Mapping[str, Any] | None = None
+        changed: Set[str] = set()
+        # Registers an FC23 write already read back need no second request.
+        take_verified = getattr(self._client, "take_verified", None)
+        verified = take_verified(registers) if take_verified is not None else {}
+        if verified:
+            data, changed = self._merge_values(
+                self._client.image.view(
+                    verified, {key for key, moved in verified.items() if moved}
+                ),
+                now,
+            )
+
+        remaining = [reg for key, reg in registers.items() if key not in verified]
+        if remaining:
+            try:
+                values = await self._client.async_read_all(
+                    remaining, priority=PRIORITY_READ
+                )
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug(
+                    "Read-back of %s failed (%s); refreshing everything",
+                    list(registers),
+                    err,
+                )
+                if data is not None:
+                    self.data = data
+                    changed |= self._settle_pending(verified)
+                for unique_id in registers:
+                    self._pending.pop(unique_id, None)
+                # The full refresh only notifies words that moved; entities
+                # showing a dropped pending value must go back to the last read.
+                self._notify(changed | set(registers))
+                await self.async_request_refresh()
+                return
+            data, read_changed = self._merge_values(values, now)
+            changed |= read_changed
+
+        self.data = data
+        changed |= self._settle_pending(registers)
+        self._notify(changed)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple, TypeVar
+
+from pymodbus.exceptions import ModbusException
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Lower value = served first. Writes and targeted reads overtake the queued
+# block reads of a background poll.
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_POLL = 2
+PRIORITY_NAMES = {PRIORITY_WRITE: "write", PRIORITY_READ: "read", PRIORITY_POLL: "poll"}
+
+# Weight of the newest sample in the smoothed latencies.
+_SMOOTHING = 0.2
+
+_QueueItem = Tuple[int, int, float, Callable[[], Awaitable[Any]], asyncio.Future]
+
+
+@dataclass
+class LatencyStats:
+    """Smoothed queue wait and service time of one request class, in seconds."""
+
+    count: int = 0
+    queue_wait: float = 0.0
+    service_time: float = 0.0
+    max_queue_wait: float = 0.0
+
+    def record(self, queue_wait: float, service_time: float) -> None:
+        if self.count == 0:
+            self.queue_wait, self.service_time = queue_wait, service_time
+        else:
+            self.queue_wait += _SMOOTHING * (queue_wait - self.queue_wait)
+            self.service_time += _SMOOTHING * (service_time - self.service_time)
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+        self.count += 1
+
+
+class ModbusIOWorker:
+    """Run every request of one connection from a single priority queue.
+
+    Callers hand in a coroutine factory per Modbus request; the worker starts
+    them in priority order, at most ``concurrency()`` at a time (one, or the
+    pipeline window). A poll enqueues one request per block, so a write issued
+    mid-poll goes out as soon as the request in flight has been answered
+    instead of waiting for the whole poll. Time spent queued and time spent on
+    the wire are tracked per priority class.
+    """
+
+    def __init__(self, concurrency: Callable[[], int] = lambda: 1, name: str = "") -> None:
+        self._concurrency = concurrency
+        self._name = name
+        self._seq = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.PriorityQueue[_QueueItem] | None = None
+        self._slot_freed: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._serving: Set[asyncio.Task] = set()
+        self._in_flight = 0
+        self.stats: Dict[str, LatencyStats] = {
+            name: LatencyStats() for name in PRIORITY_NAMES.values()
+        }
+        self.total = LatencyStats()
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, priority: int, request: Callable[[], Awaitable[T]]) -> T:
+        """Queue ``request`` and return its result once the worker ran it."""
+        queue = self._ensure_started()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((priority, next(self._seq), time.monotonic(), request, future))
+        return await future
+
+    async def async_stop(self) -> None:
+        """Stop the worker and fail whatever is still queued."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+        queue, self._queue = self._queue, None
+        while queue is not None and not queue.empty():
+            future = queue.get_nowait()[4]
+            if not future.done():
+                future.set_exception(ModbusException("Modbus I/O worker stopped"))
+        self._loop = None
+
+    def _ensure_started(self) -> asyncio.PriorityQueue[_QueueItem]:
+        loop = asyncio.get_running_loop()
+        if (
+            self._task is None
+            or self._task.done()
+            or self._loop is not loop
+            or self._queue is None
+        ):
+            # First use, or the previous loop is gone (scripts, tests).
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._slot_freed = asyncio.Event()
+            self._serving = set()
+            self._in_flight = 0
+            self._task = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.PriorityQueue[_QueueItem]) -> None:
+        slot_freed = self._slot_freed
+        assert slot_freed is not None
+        while True:
+            # Take the next request only once a slot is free, so a write that
+            # arrives in the meantime is still picked before queued poll reads.
+            while self._in_flight >= max(self._concurrency(), 1):
+                slot_freed.clear()
+                await slot_freed.wait()
+            item = await queue.get()
+            if item[4].done():
+                continue  # the caller gave up while it was queued
+            self._in_flight += 1
+            task = asyncio.get_running_loop().create_task(self._serve(item))
+            self._serving.add(task)
+            task.add_done_callback(self._serving.discard)
+
+    async def _serve(self, item: _QueueItem) -> None:
+        priority, _, queued_at, request, future = item
+        started = time.monotonic()
+        try:
+            result = await request()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            if not future.done():
+                future.set_exception(err)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            if self._slot_freed is not None:
+                self._slot_freed.set()
+            finished = time.monotonic()
+            kind = PRIORITY_NAMES.get(priority, "poll")
+            self.stats[kind].record(started - queued_at, finished - started)
+            self.total.record(started - queued_at, finished - started)
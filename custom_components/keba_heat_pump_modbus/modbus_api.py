@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import inspect
+import logging
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keyword that carries the Modbus unit id, newest pymodbus first:
+# 3.10+ ``device_id``, 3.0-3.9 ``slave``, 2.x ``unit`` (via ``**kwargs``).
+UNIT_KEYWORDS = ("device_id", "slave", "unit")
+
+
+@dataclass(frozen=True)
+class ModbusApi:
+    """What a transport's request methods accept."""
+
+    count_keyword: bool = True
+    unit_keyword: str | None = None
+
+
+def negotiate_api(transport: Any) -> ModbusApi:
+    """Inspect ``transport.read_holding_registers`` once and describe its API."""
+    method = getattr(transport, "read_holding_registers", None)
+    try:
+        params = inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return ModbusApi()
+
+    var_keyword = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
+    unit_keyword = next((name for name in UNIT_KEYWORDS if name in params), None)
+    if unit_keyword is None and var_keyword:
+        unit_keyword = "unit"
+
+    return ModbusApi(
+        count_keyword="count" in params or var_keyword,
+        unit_keyword=unit_keyword,
+    )
+
+
+class ModbusCalls:
+    """Read/write callables bound to one transport and its negotiated API.
+
+    The unit id is baked into the bound callables, so the hot path is a plain
+    call. Transports that advertise ``count`` but reject it (very old
+    pymodbus, or wrappers with a generic signature) are downgraded once via
+    ``downgrade_count`` and read word by word from then on.
+    """
+
+    def __init__(self, transport: Any, unit_id: int) -> None:
+        self.transport = transport
+        self.unit_id = unit_id
+        self.api = negotiate_api(transport)
+        self.read: Dict[str, Callable[..., Any]] = {}
+        self.write: Callable[..., Any]
+        self.write_many: Callable[..., Any]
+        self.write_read: Callable[..., Any]
+        self._bind()
+        _LOGGER.debug(
+            "Negotiated Modbus API for %s: %s", type(transport).__name__, self.api
+        )
+
+    @property
+    def count_supported(self) -> bool:
+        return self.api.count_keyword
+
+    def _bind(self) -> None:
+        extra: Dict[str, int] = {}
+        if self.api.unit_keyword is not None:
+            extra[self.api.unit_keyword] = self.unit_id
+        self.read = {
+            "holding": self._bind_method("read_holding_registers", extra),
+            "input": self._bind_method("read_input_registers", extra),
+        }
+        self.write = self._bind_method("write_register", extra)
+        self.write_many = self._bind_method("write_registers", extra)
+        self.write_read = self._bind_method("readwrite_registers", extra)
+
+    def _bind_method(self, name: str, extra: Dict[str, int]) -> Callable[..., Any]:
+        method = getattr(self.transport, name, None)
+        if method is None:
+
+            def _missing(*args: Any, **kwargs: Any) -> Any:
+                raise AttributeError(
+                    f"{type(self.transport).__name__} has no attribute {name!r}"
+                )
+
+            return _missing
+        if not extra:
+            return method
+        return partial(method, **extra)
+
+    def downgrade_count(self) -> None:
+        _LOGGER.debug(
+            "%s rejects the count keyword; reading word by word",
+            type(self.transport).__name__,
+        )
+        self.api = ModbusApi(count_keyword=False, unit_keyword=self.api.unit_keyword)
+        self._bind()
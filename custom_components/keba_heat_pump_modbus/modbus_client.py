@@ -1,22 +1,64 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import struct
 import time
 from collections import deque
-from typing import Callable, Dict, List
-
-from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ModbusException
-
-from .const import WRITE_WARNING_THRESHOLD, WRITE_WARNING_WINDOW_SECONDS
+from typing import Callable, Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple, Union
+
+from pymodbus.client import AsyncModbusTcpClient, ModbusTcpClient
+from pymodbus.exceptions import ConnectionException, ModbusException
+
+from .codec import BlockDecoder
+from .connection import (
+    STATE_BACKOFF,
+    STATE_CONNECTED,
+    ConnectionManager,
+    configure_socket,
+    is_connection_error,
+)
+from .io_worker import PRIORITY_POLL, PRIORITY_READ, PRIORITY_WRITE, ModbusIOWorker
+from .modbus_api import ModbusCalls
+from .const import (
+    DEFAULT_CONNECTION_MODE,
+    DEFAULT_MAX_READ_GAP,
+    DEFAULT_PIPELINING,
+    DEFAULT_WRITE_VERIFY,
+    MAX_CACHED_READ_PLANS,
+    MAX_READ_BLOCK_SIZE,
+    MAX_WRITE_READ_REGISTERS,
+    MAX_WRITE_REGISTERS,
+    WRITE_COALESCE_SECONDS,
+    WRITE_WARNING_THRESHOLD,
+    WRITE_WARNING_WINDOW_SECONDS,
+)
 from .models import ModbusRegister
+from .pipeline import ModbusTcpPipeline
+from .read_planner import ReadBlock, build_read_plan
+from .register_image import ReadResult, RegisterImage
+from .write_behind import WriteBehindQueue, WriteQueued
+from .write_budget import WriteBudget, WriteBudgetExceeded
+from .write_coalescer import WriteCoalescer, WriteRun
 
 _LOGGER = logging.getLogger(__name__)
 
+# Modbus exception codes for unsupported function codes and addresses.
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+
+AsyncTransport = Union[AsyncModbusTcpClient, ModbusTcpPipeline]
+
 
 class KebaModbusClient:
-    """Thin wrapper around ModbusTcpClient."""
+    """Thin wrapper around pymodbus' TCP clients.
+
+    The synchronous API (``read_all``/``write_register``) runs on
+    ``ModbusTcpClient`` and is kept for scripts and tests. Home Assistant uses
+    the ``async_*`` API, which runs on ``AsyncModbusTcpClient`` inside the event
+    loop and shares read planning, decoding and encoding with the sync API.
+    Async requests run inside ``connection.session()``, which keeps the link
+    alive between polls and reconnects in the background when it drops.
+    """
 
     def __init__(
         self,
@@ -24,20 +66,74 @@ class KebaModbusClient:
         port: int,
         unit_id: int,
         warning_callback: Callable[[int], None] | None = None,
+        max_read_gap: int = DEFAULT_MAX_READ_GAP,
+        pipelining: bool = DEFAULT_PIPELINING,
+        connection_mode: str = DEFAULT_CONNECTION_MODE,
+        write_coalesce_window: float = WRITE_COALESCE_SECONDS,
+        write_budget: WriteBudget | None = None,
+        write_behind: WriteBehindQueue | None = None,
+        write_verify: bool = DEFAULT_WRITE_VERIFY,
     ) -> None:
         self._host = host
         self._port = port
-        self._unit_id = unit_id  # note: may not be used by your pymodbus version
+        self._unit_id = unit_id
+        self._sync_calls: ModbusCalls | None = None
+        self._async_calls: ModbusCalls | None = None
         self._client: ModbusTcpClient | None = None
-        self._write_timestamps: deque[float] = deque()
+        self._async_client: AsyncTransport | None = None
+        self._pipelining = pipelining
+        self._write_budget = write_budget
+        # Seeded from storage so a restart does not reset the wear warning.
+        self._write_timestamps: deque[float] = deque(
+            write_budget.recent_writes() if write_budget is not None else ()
+        )
         self._write_warning_active = False
         self._warning_callback = warning_callback
+        self._max_read_gap = max_read_gap
+        self._read_plans: Dict[FrozenSet[str], List[ReadBlock]] = {}
+        self._illegal_addresses: Set[Tuple[str, int]] = set()
+        self._block_decoders: Dict[Tuple[int, int, Tuple[str, ...]], BlockDecoder] = {}
+        self._probe_register: ModbusRegister | None = None
+        # Raw words of the last async reads, decoded lazily.
+        self.image = RegisterImage()
+        self._writes = WriteCoalescer(
+            self._async_write_run,
+            write_coalesce_window,
+            # A run never needs more tokens than the budget can hold.
+            max_registers=(
+                min(MAX_WRITE_REGISTERS, write_budget.burst)
+                if write_budget is not None and write_budget.limited
+                else MAX_WRITE_REGISTERS
+            ),
+        )
+        self._multi_write_supported = True
+        # FC23 write-and-read-back: None until the controller answered one.
+        self._write_read_supported: bool | None = None if write_verify else False
+        self._register_index: Dict[str, ModbusRegister] = {}
+        # Registers read back by FC23 writes -> whether their words changed.
+        self._verified: Dict[str, bool] = {}
+        # Every async request of the connection is served by this worker.
+        self.io = ModbusIOWorker(self._io_concurrency, name=f"{host}:{port}")
+        self.connection = ConnectionManager(
+            connect=self.async_connect,
+            disconnect=self._async_disconnect,
+            probe=self._async_probe,
+            is_connected=self._async_connected,
+            mode=connection_mode,
+            name=f"{host}:{port}",
+        )
+        self._write_behind = write_behind
+        self._write_behind_task: asyncio.Task[None] | None = None
+        if write_behind is not None:
+            self.connection.async_add_listener(self._on_connection_state)
 
     def connect(self) -> None:
         if self._client is None:
             self._client = ModbusTcpClient(self._host, port=self._port)
         if not self._client.connect():
             raise ModbusException(f"Unable to connect to {self._host}:{self._port}")
+        configure_socket(getattr(self._client, "socket", None))
+        self._calls_for_sync(self._client)
 
     def close(self) -> None:
         if self._client is not None:
@@ -53,79 +149,379 @@ class KebaModbusClient:
         assert self._client is not None
         return self._client
 
+    async def async_connect(self) -> None:
+        if self._async_client is None:
+            if self._pipelining:
+                self._async_client = ModbusTcpPipeline(
+                    self._host, self._port, self._unit_id
+                )
+            else:
+                self._async_client = AsyncModbusTcpClient(self._host, port=self._port)
+        if not self._async_client.connected:
+            await self._async_client.connect()
+        if not self._async_client.connected:
+            raise ConnectionException(f"Unable to connect to {self._host}:{self._port}")
+        configure_socket(self._transport_socket(self._async_client))
+        self._calls_for_async(self._async_client)
+        if self._write_read_supported is None and not hasattr(
+            self._async_client, "readwrite_registers"
+        ):
+            _LOGGER.debug(
+                "Transport has no readwrite_registers; verifying writes by reading"
+            )
+            self._write_read_supported = False
+
+    async def async_close(self) -> None:
+        if self._write_behind_task is not None:
+            self._write_behind_task.cancel()
+            self._write_behind_task = None
+        if self._write_budget is not None:
+            self._write_budget.close()
+        try:
+            await self._writes.async_flush()
+        finally:
+            await self.io.async_stop()
+            await self.connection.async_stop()
+
+    async def _async_disconnect(self) -> None:
+        if self._async_client is not None:
+            try:
+                self._async_client.close()
+            except Exception:  # noqa: BLE001
+                pass
+            self._async_client = None
+
+    def _async_connected(self) -> bool:
+        return self._async_client is not None and bool(self._async_client.connected)
+
+    async def _async_probe(self) -> None:
+        """Read one known-good word to detect a half-open connection."""
+        reg = self._probe_register
+        if reg is None or self._async_client is None:
+            return
+        calls = self._calls_for_async(self._async_client)
+        await calls.read[reg.register_type](reg.address, count=1)
+
+    def _io_concurrency(self) -> int:
+        """Requests the worker may keep in flight: the pipeline window, or one."""
+        client = self._async_client
+        if isinstance(client, ModbusTcpPipeline):
+            return client.window
+        return 1
+
+    @staticmethod
+    def _transport_socket(client: AsyncTransport):
+        sock = getattr(client, "socket", None)
+        if sock is not None:
+            return sock
+        # pymodbus 3.x keeps the asyncio transport on its protocol object.
+        transport = getattr(getattr(client, "ctx", None), "transport", None)
+        if transport is None:
+            return None
+        return transport.get_extra_info("socket")
+
     # ---------------------------------------------------------------------
     #  Helper that hides all the pymodbus version differences
     # ---------------------------------------------------------------------
-    def _read_register_list(
-        self, client: ModbusTcpClient, reg: ModbusRegister
-    ) -> list[int] | None:
-        """
-        Return a list of raw 16-bit register values for one ModbusRegister.
+    def _calls_for_sync(self, client: ModbusTcpClient) -> ModbusCalls:
+        """Return the request callables negotiated for ``client``.
 
-        Tries the "modern" signature (address, count) first.
-        If that raises TypeError (like in your environment), falls back to
-        calling with only address and, for multi-word values, multiple calls.
+        The pymodbus API is inspected once per transport (count keyword,
+        unit id keyword); afterwards reads and writes are plain calls.
         """
-        try:
-            # First try: assume function(address, count) exists.
-            if reg.register_type == "holding":
-                resp = client.read_holding_registers(reg.address, reg.length)
-            else:
-                resp = client.read_input_registers(reg.address, reg.length)
+        calls = self._sync_calls
+        if calls is None or calls.transport is not client:
+            calls = self._sync_calls = ModbusCalls(client, self._unit_id)
+        return calls
+
+    def _calls_for_async(self, client: AsyncTransport) -> ModbusCalls:
+        calls = self._async_calls
+        if calls is None or calls.transport is not client:
+            calls = self._async_calls = ModbusCalls(client, self._unit_id)
+        return calls
 
-            if hasattr(resp, "isError") and resp.isError():
+    @staticmethod
+    def _register_words(
+        reg: ModbusRegister, resp, offset: int | None = None
+    ) -> list[int] | None:
+        if hasattr(resp, "isError") and resp.isError():
+            if offset is None:
                 _LOGGER.warning(
                     "Error reading register %s (%s): %s",
                     reg.name,
                     reg.address,
                     resp,
                 )
+            else:
+                _LOGGER.warning(
+                    "Error reading register %s (%s + %s): %s",
+                    reg.name,
+                    reg.address,
+                    offset,
+                    resp,
+                )
+            return None
+        return list(resp.registers)
+
+    def _read_register_list(
+        self, client: ModbusTcpClient, reg: ModbusRegister
+    ) -> list[int] | None:
+        """
+        Return a list of raw 16-bit register values for one ModbusRegister.
+
+        Uses ``read_*_registers(address, count=...)`` when the negotiated API
+        supports it. Without a count argument, multi-word values are read with
+        one call per word.
+        """
+        calls = self._calls_for_sync(client)
+        read = calls.read[reg.register_type]
+
+        if calls.count_supported:
+            try:
+                resp = read(reg.address, count=reg.length)
+            except TypeError:
+                # Advertised but rejected: remember and never try again.
+                calls.downgrade_count()
+                read = calls.read[reg.register_type]
+            else:
+                return self._register_words(reg, resp)
+
+        if reg.length <= 1:
+            return self._register_words(reg, read(reg.address))
+
+        # Multi-register fallback: call once per 16-bit word.
+        all_regs: list[int] = []
+        for offset in range(reg.length):
+            words = self._register_words(reg, read(reg.address + offset), offset)
+            if words is None:
                 return None
+            all_regs.extend(words)
 
-            return list(resp.registers)
+        return all_regs
 
-        except TypeError:
-            # Fallback for your style: read_holding_registers(address) only.
-            # We simulate 'count' by doing multiple calls.
-            if reg.length <= 1:
-                if reg.register_type == "holding":
-                    resp = client.read_holding_registers(reg.address)
-                else:
-                    resp = client.read_input_registers(reg.address)
-
-                if hasattr(resp, "isError") and resp.isError():
-                    _LOGGER.warning(
-                        "Error reading register %s (%s): %s",
-                        reg.name,
-                        reg.address,
-                        resp,
-                    )
-                    return None
+    async def _async_read_register_list(
+        self, client: AsyncTransport, reg: ModbusRegister, priority: int = PRIORITY_POLL
+    ) -> list[int] | None:
+        """Async counterpart of ``_read_register_list`` for modern pymodbus."""
+        read = self._calls_for_async(client).read[reg.register_type]
+        resp = await self.io.submit(
+            priority, lambda: read(reg.address, count=reg.length)
+        )
+        return self._register_words(reg, resp)
+
+    def _read_block_words(
+        self, client: ModbusTcpClient, block: ReadBlock
+    ) -> Tuple[list[int] | None, int | None]:
+        """Read a whole block in one request.
+
+        Returns the raw words (or ``None`` on failure) together with the Modbus
+        exception code of an error response, if the controller sent one.
+        """
+        read = self._calls_for_sync(client).read[block.register_type]
+        resp = read(block.address, count=block.count)
+        return self._block_response_words(block, resp)
+
+    async def _async_read_block_words(
+        self, client: AsyncTransport, block: ReadBlock, priority: int = PRIORITY_POLL
+    ) -> Tuple[list[int] | None, int | None]:
+        read = self._calls_for_async(client).read[block.register_type]
+        resp = await self.io.submit(
+            priority, lambda: read(block.address, count=block.count)
+        )
+        return self._block_response_words(block, resp)
 
-                return list(resp.registers)
+    @staticmethod
+    def _block_response_words(
+        block: ReadBlock, resp
+    ) -> Tuple[list[int] | None, int | None]:
+        if hasattr(resp, "isError") and resp.isError():
+            _LOGGER.debug(
+                "Error reading block %s-%s (%s): %s",
+                block.address,
+                block.end - 1,
+                block.register_type,
+                resp,
+            )
+            return None, getattr(resp, "exception_code", None)
+
+        words = list(resp.registers)
+        if len(words) < block.count:
+            _LOGGER.debug(
+                "Short response for block %s-%s: %s of %s words",
+                block.address,
+                block.end - 1,
+                len(words),
+                block.count,
+            )
+            return None, None
 
-            # Multi-register fallback: call once per 16-bit word.
-            all_regs: list[int] = []
-            for offset in range(reg.length):
-                addr = reg.address + offset
-                if reg.register_type == "holding":
-                    resp = client.read_holding_registers(addr)
-                else:
-                    resp = client.read_input_registers(addr)
-
-                if hasattr(resp, "isError") and resp.isError():
-                    _LOGGER.warning(
-                        "Error reading register %s (%s + %s): %s",
-                        reg.name,
-                        reg.address,
-                        offset,
-                        resp,
-                    )
-                    return None
+        return words, None
 
-                all_regs.extend(list(resp.registers))
+    # ---------------------------------------------------------------------
+    #  Read planning
+    # ---------------------------------------------------------------------
+    def plan_reads(self, registers: List[ModbusRegister]) -> List[ReadBlock]:
+        """Return (and cache) the coalesced block reads for ``registers``.
 
-            return all_regs
+        The plan does not depend on the order of ``registers``, so it is cached
+        per register set. Time-budgeted polling produces varying sets, hence
+        the cache is bounded.
+        """
+        key = frozenset(reg.unique_id for reg in registers)
+        plan = self._read_plans.get(key)
+        for reg in registers:
+            self._register_index.setdefault(reg.unique_id, reg)
+        if self._probe_register is None and registers:
+            self._probe_register = registers[0]
+        if plan is None:
+            plan = build_read_plan(
+                registers,
+                max_gap=self._max_read_gap,
+                illegal_addresses=self._illegal_addresses,
+            )
+            if len(self._read_plans) >= MAX_CACHED_READ_PLANS:
+                self._read_plans.clear()
+            self._read_plans[key] = plan
+            _LOGGER.debug(
+                "Planned %s block reads for %s registers", len(plan), len(registers)
+            )
+        return plan
+
+    def _learn_illegal_addresses(
+        self, block: ReadBlock, failed: List[ModbusRegister]
+    ) -> None:
+        """Remember addresses that made a block read fail and force a re-plan."""
+        if failed:
+            addresses = {
+                addr
+                for reg in failed
+                for addr in range(reg.address, reg.address + max(reg.length, 1))
+            }
+        else:
+            # Every register reads fine on its own, so the hole is in the gaps.
+            covered = {
+                addr
+                for reg in block.registers
+                for addr in range(reg.address, reg.address + max(reg.length, 1))
+            }
+            addresses = set(range(block.address, block.end)) - covered
+
+        _LOGGER.debug(
+            "Learned illegal %s addresses %s", block.register_type, sorted(addresses)
+        )
+        self._illegal_addresses.update(
+            (block.register_type, addr) for addr in addresses
+        )
+        self._read_plans.clear()
+
+    def _read_single(
+        self, client: ModbusTcpClient, reg: ModbusRegister
+    ) -> Tuple[float | int | str | bool | None, bool]:
+        """Read and decode one register; the flag tells whether the read succeeded."""
+        try:
+            raw_list = self._read_register_list(client, reg)
+            if raw_list is None:
+                return None, False
+            return self._decode_registers(raw_list, reg), True
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.exception(
+                "Exception reading register %s (%s): %s",
+                reg.name,
+                reg.address,
+                err,
+            )
+            return None, False
+
+    async def _async_read_words(
+        self, client: AsyncTransport, reg: ModbusRegister, priority: int = PRIORITY_POLL
+    ) -> list[int] | None:
+        """Read the raw words of one register, ``None`` if the read failed."""
+        try:
+            return await self._async_read_register_list(client, reg, priority)
+        except Exception as err:  # noqa: BLE001
+            if is_connection_error(err):
+                raise
+            _LOGGER.exception(
+                "Exception reading register %s (%s): %s",
+                reg.name,
+                reg.address,
+                err,
+            )
+            return None
+
+    def _read_block(
+        self, client: ModbusTcpClient, block: ReadBlock
+    ) -> Dict[str, float | int | str | bool | None]:
+        words: list[int] | None = None
+        exception_code: int | None = None
+        calls = self._calls_for_sync(client)
+        if calls.count_supported and len(block.registers) > 1:
+            try:
+                words, exception_code = self._read_block_words(client, block)
+            except TypeError:
+                # pymodbus without a count argument: read register by register.
+                calls.downgrade_count()
+            except Exception as err:  # noqa: BLE001
+                self._log_block_exception(block, err)
+
+        if words is not None:
+            return self._decode_block(block, words)
+
+        result: Dict[str, float | int | str | bool | None] = {}
+        failed: List[ModbusRegister] = []
+        for reg in block.registers:
+            value, ok = self._read_single(client, reg)
+            result[reg.unique_id] = value
+            if not ok:
+                failed.append(reg)
+        if exception_code == ILLEGAL_DATA_ADDRESS:
+            self._learn_illegal_addresses(block, failed)
+        return result
+
+    async def _async_read_block(
+        self, client: AsyncTransport, block: ReadBlock, priority: int = PRIORITY_POLL
+    ) -> Set[str]:
+        """Read ``block`` into the register image; return the changed unique_ids."""
+        words: list[int] | None = None
+        exception_code: int | None = None
+        if len(block.registers) > 1:
+            try:
+                words, exception_code = await self._async_read_block_words(
+                    client, block, priority
+                )
+            except Exception as err:  # noqa: BLE001
+                if is_connection_error(err):
+                    raise
+                self._log_block_exception(block, err)
+
+        if words is not None:
+            return self.image.store_block(block, words)
+
+        changed: Set[str] = set()
+        failed: List[ModbusRegister] = []
+        for reg in block.registers:
+            raw_list = await self._async_read_words(client, reg, priority)
+            if self.image.store_register(reg, raw_list):
+                changed.add(reg.unique_id)
+            if raw_list is None:
+                failed.append(reg)
+        if exception_code == ILLEGAL_DATA_ADDRESS:
+            self._learn_illegal_addresses(block, failed)
+        return changed
+
+    @staticmethod
+    def _log_block_exception(block: ReadBlock, err: Exception) -> None:
+        _LOGGER.debug(
+            "Exception reading block %s-%s: %s",
+            block.address,
+            block.end - 1,
+            err,
+        )
+
+    def _decode_block(
+        self, block: ReadBlock, words: list[int]
+    ) -> Dict[str, float | int | str | bool | None]:
+        return block.decoder.decode(words)
 
     # ---------------------------------------------------------------------
     #  Main public method used by the coordinator
@@ -133,79 +529,379 @@ class KebaModbusClient:
     def read_all(
         self, registers: List[ModbusRegister]
     ) -> Dict[str, float | int | str | bool | None]:
-        """Read all configured registers and return a dict of unique_id -> value."""
+        """Read all configured registers and return a dict of unique_id -> value.
+
+        Registers are fetched in coalesced blocks (see ``plan_reads``); a block
+        that fails is retried register by register.
+        """
         client = self._ensure_client()
         result: Dict[str, float | int | str | bool | None] = {}
 
-        for reg in registers:
-            try:
-                raw_list = self._read_register_list(client, reg)
-                if raw_list is None:
-                    value = None
-                else:
-                    value = self._decode_registers(raw_list, reg)
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.exception(
-                    "Exception reading register %s (%s): %s",
-                    reg.name,
-                    reg.address,
-                    err,
-                )
-                value = None
-
-            result[reg.unique_id] = value
+        for block in self.plan_reads(registers):
+            result.update(self._read_block(client, block))
 
         return result
 
+    async def async_read_all(
+        self,
+        registers: List[ModbusRegister],
+        budget: float | None = None,
+        priority: int = PRIORITY_POLL,
+    ) -> ReadResult:
+        """Async counterpart of ``read_all`` that never leaves the event loop.
+
+        With pipelining enabled all blocks are issued at once and the pipeline
+        keeps as many of them in flight as the controller was found to accept.
+        A lost connection aborts the whole read instead of being retried
+        register by register.
+
+        With a ``budget`` (seconds), blocks are read in the order their first
+        register appears in ``registers`` and no new block is started once the
+        budget is spent; at least one block is always read. Registers missing
+        from the result were not read.
+
+        Responses are copied into ``image`` and only registers whose raw words
+        changed are decoded again, on first access. The returned mapping covers
+        the registers read by this call; its ``changed`` set lists those whose
+        words differ from the previous read.
+
+        Each block is one request on the I/O worker at ``priority``; writes
+        overtake the blocks of a poll that are still queued.
+        """
+        read: List[str] = []
+        changed: Set[str] = set()
+        plan = self.plan_reads(registers)
+        deadline: float | None = None
+        if budget is not None:
+            deadline = time.monotonic() + budget
+            position = {reg.unique_id: index for index, reg in enumerate(registers)}
+            plan = sorted(
+                plan,
+                key=lambda block: min(position[reg.unique_id] for reg in block.registers),
+            )
+
+        async with self.connection.session():
+            client = self._async_client
+            assert client is not None
+
+            if isinstance(client, ModbusTcpPipeline):
+                if not client.probed and plan:
+                    await client.probe_window(plan[0].address, plan[0].register_type)
+                # Without a budget everything goes out at once; with one, a
+                # window's worth at a time so the deadline can be honoured.
+                step = len(plan) if deadline is None else max(client.window, 1)
+                for start in range(0, len(plan), max(step, 1)):
+                    if deadline is not None and read and time.monotonic() >= deadline:
+                        break
+                    batch = plan[start : start + step]
+                    for block, block_changed in zip(
+                        batch,
+                        await asyncio.gather(
+                            *(
+                                self._async_read_block(client, block, priority)
+                                for block in batch
+                            )
+                        ),
+                    ):
+                        read.extend(reg.unique_id for reg in block.registers)
+                        changed |= block_changed
+                return self.image.view(read, changed)
+
+            for block in plan:
+                if deadline is not None and read and time.monotonic() >= deadline:
+                    break
+                changed |= await self._async_read_block(client, block, priority)
+                read.extend(reg.unique_id for reg in block.registers)
+
+        return self.image.view(read, changed)
+
+    # ---------------------------------------------------------------------
+    #  Writing
+    # ---------------------------------------------------------------------
+    @staticmethod
+    def _encode_value(reg: ModbusRegister, value: float | int | bool) -> List[int]:
+        """Validate ``value`` for ``reg`` and return the raw words to write."""
+        return reg.codec.encode_words(value)
+
     def write_register(self, reg: ModbusRegister, value: float | int | bool) -> None:
         """Write a single holding register based on the ModbusRegister metadata."""
+        words = self._encode_value(reg, value)
+        client = self._ensure_client()
 
-        if reg.register_type != "holding":
-            raise ModbusException("Only holding registers can be written")
+        calls = self._calls_for_sync(client)
+        if len(words) == 1:
+            resp = calls.write(reg.address, words[0])
+        else:
+            resp = calls.write_many(reg.address, words)
+        self._check_write_response([reg], resp)
+        self._record_writes([reg])
 
-        if reg.length != 1:
-            raise ModbusException("Writing multi-register values is not supported yet")
+    @property
+    def write_budget(self) -> WriteBudget | None:
+        return self._write_budget
 
-        client = self._ensure_client()
+    @property
+    def write_behind(self) -> WriteBehindQueue | None:
+        return self._write_behind
+
+    async def async_write_register(
+        self, reg: ModbusRegister, value: float | int | bool
+    ) -> None:
+        """Async counterpart of ``write_register``.
 
-        if isinstance(value, (int, float)):
+        The write joins the coalescer's current batch, so neighbouring
+        registers written together go out as a single FC16 request. Returns
+        once the controller acknowledged it.
+        """
+        words = self._encode_value(reg, value)
+        try:
+            await self._writes.submit(reg, words)
+        except Exception as err:
+            if not self._should_queue(err):
+                raise
+            self._write_behind.enqueue(reg, words)
+            raise WriteQueued(
+                f"Modbus link is down; write to {reg.name} queued until it is back"
+            ) from err
+        if self._write_behind is not None:
+            # A direct write supersedes whatever was still queued.
+            self._write_behind.discard(reg.unique_id)
+
+    async def async_write_registers(
+        self, writes: Sequence[Tuple[ModbusRegister, float | int | bool]]
+    ) -> Dict[str, Exception | None]:
+        """Write several registers in as few requests as possible.
+
+        All values are encoded first; the valid ones are flushed as one batch,
+        so neighbouring registers share FC16 requests. Returns the error per
+        unique_id, ``None`` for registers that were written.
+        """
+        results: Dict[str, Exception | None] = {}
+        batch: List[Tuple[ModbusRegister, List[int]]] = []
+        for reg, value in writes:
             try:
-                scaled_value = (float(value) - reg.offset) / reg.scale
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.error(
-                    "Failed to scale value %s for %s: %s", value, reg.name, err
+                batch.append((reg, self._encode_value(reg, value)))
+            except (ModbusException, TypeError, ValueError, ZeroDivisionError) as err:
+                results[reg.unique_id] = err
+        errors = await self._writes.submit_many(batch) if batch else []
+        for (reg, words), err in zip(batch, errors):
+            if err is not None and self._should_queue(err):
+                self._write_behind.enqueue(reg, words)
+                err = WriteQueued(
+                    f"Modbus link is down; write to {reg.name} queued until it is back"
                 )
-                raise
-            raw_value = int(round(scaled_value))
-        elif isinstance(value, bool):
-            raw_value = int(value)
-        else:
-            raise ModbusException("Unsupported value type for writing")
-
-        if reg.data_type == "int16":
-            if raw_value < -0x8000 or raw_value > 0x7FFF:
-                raise ModbusException(
-                    f"Value {raw_value} out of range for signed 16-bit register {reg.name}"
+            elif err is None and self._write_behind is not None:
+                self._write_behind.discard(reg.unique_id)
+            results[reg.unique_id] = err
+        return results
+
+    def _should_queue(self, err: Exception) -> bool:
+        return (
+            self._write_behind is not None
+            and not isinstance(err, WriteBudgetExceeded)
+            and (is_connection_error(err) or self.connection.state == STATE_BACKOFF)
+        )
+
+    def _on_connection_state(self) -> None:
+        if (
+            self.connection.state != STATE_CONNECTED
+            or not self._write_behind
+            or (self._write_behind_task is not None and not self._write_behind_task.done())
+        ):
+            return
+        self._write_behind_task = asyncio.get_running_loop().create_task(
+            self.async_flush_write_behind()
+        )
+
+    async def async_flush_write_behind(self) -> None:
+        """Write the queued registers that do not already hold the queued words."""
+        queue = self._write_behind
+        if not queue:
+            return
+        entries = queue.items()
+        try:
+            await self.async_read_all([reg for reg, _ in entries], priority=PRIORITY_READ)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Fresh-value check before the queued writes failed: %s", err)
+            return
+
+        handled: List[str] = []
+        for reg, words in entries:
+            if self.image.words(reg.unique_id) == words:
+                _LOGGER.debug("Skipping queued write to %s: value already set", reg.name)
+            else:
+                try:
+                    await self._writes.submit(reg, words)
+                except Exception as err:  # noqa: BLE001
+                    if is_connection_error(err) or self.connection.state == STATE_BACKOFF:
+                        break  # link lost again; the rest stays queued
+                    _LOGGER.error("Dropping queued write to %s: %s", reg.name, err)
+            queue.discard(reg.unique_id, words)
+            handled.append(reg.unique_id)
+
+        if handled and queue.on_flushed is not None:
+            await queue.on_flushed(handled)
+
+    async def _async_write_run(self, run: WriteRun) -> None:
+        """Write one address-contiguous run of registers in a single request."""
+        budget = self._write_budget
+        if budget is None:
+            await self._async_send_run(run)
+            return
+        # Every register costs a token, whether it goes out as FC16 or FC6;
+        # registers that were not written get theirs back.
+        await budget.async_acquire(len(run))
+        written_before = budget.total
+        try:
+            await self._async_send_run(run)
+        except BaseException:
+            budget.refund(len(run) - (budget.total - written_before))
+            raise
+
+    async def _async_send_run(self, run: WriteRun) -> None:
+        regs = [reg for reg, _ in run]
+        words = [word for _, reg_words in run for word in reg_words]
+        address = regs[0].address
+        async with self.connection.session():
+            client = self._async_client
+            assert client is not None
+            calls = self._calls_for_async(client)
+            if (
+                self._write_read_supported is not False
+                and len(words) <= MAX_WRITE_READ_REGISTERS
+                and await self._async_write_read(calls, run, words)
+            ):
+                return
+            if len(words) > 1 and self._multi_write_supported:
+                try:
+                    resp = await self.io.submit(
+                        PRIORITY_WRITE, lambda: calls.write_many(address, words)
+                    )
+                except AttributeError:
+                    resp = None  # transport without write_registers
+                if resp is None or (
+                    hasattr(resp, "isError")
+                    and resp.isError()
+                    and getattr(resp, "exception_code", None) == ILLEGAL_FUNCTION
+                ):
+                    _LOGGER.debug(
+                        "Controller rejects write_multiple_registers; "
+                        "writing registers one by one"
+                    )
+                    self._multi_write_supported = False
+                else:
+                    self._check_write_response(regs, resp)
+                    self._record_writes(regs)
+                    return
+            for reg, reg_words in run:
+                # A 32-bit value always goes out as one FC16 request, so the
+                # controller never holds half of the new value.
+                resp = await self.io.submit(
+                    PRIORITY_WRITE,
+                    lambda reg=reg, reg_words=reg_words: (
+                        calls.write_many(reg.address, reg_words)
+                        if len(reg_words) > 1
+                        else calls.write(reg.address, reg_words[0])
+                    ),
                 )
-            raw_value &= 0xFFFF
-        elif raw_value < 0 or raw_value > 0xFFFF:
-            raise ModbusException(
-                f"Value {raw_value} out of range for 16-bit register {reg.name}"
+                self._check_write_response([reg], resp)
+                self._record_writes([reg])
+
+    async def _async_write_read(
+        self, calls: ModbusCalls, run: WriteRun, words: List[int]
+    ) -> bool:
+        """Write ``run`` and read it back in one FC23 request.
+
+        The read covers the written registers and the holding registers they
+        list in ``refresh_with`` when those are close enough to share the
+        request. Returns False if the controller does not support FC23, so
+        the caller falls back to a plain write.
+        """
+        regs = [reg for reg, _ in run]
+        covered = list(regs)
+        start, end = regs[0].address, regs[-1].address + regs[-1].length
+        for reg in regs:
+            for unique_id in reg.refresh_with or ():
+                dependent = self._register_index.get(unique_id)
+                if dependent is None or dependent.register_type != "holding":
+                    continue
+                lo = min(start, dependent.address)
+                hi = max(end, dependent.address + dependent.length)
+                if hi - lo <= MAX_READ_BLOCK_SIZE and dependent not in covered:
+                    start, end = lo, hi
+                    covered.append(dependent)
+
+        try:
+            resp = await self.io.submit(
+                PRIORITY_WRITE,
+                lambda: calls.write_read(
+                    read_address=start,
+                    read_count=end - start,
+                    write_address=regs[0].address,
+                    values=words,
+                ),
+            )
+        except AttributeError:
+            resp = None  # transport without readwrite_registers
+        if resp is None or (
+            hasattr(resp, "isError")
+            and resp.isError()
+            and getattr(resp, "exception_code", None) == ILLEGAL_FUNCTION
+        ):
+            _LOGGER.debug(
+                "Controller rejects read_write_multiple_registers; "
+                "verifying writes with a separate read"
             )
+            self._write_read_supported = False
+            return False
+
+        self._check_write_response(regs, resp)
+        self._write_read_supported = True
+        self._record_writes(regs)
+        read_back = list(getattr(resp, "registers", None) or [])
+        if len(read_back) >= end - start:
+            for reg in covered:
+                offset = reg.address - start
+                changed = self.image.store_register(
+                    reg, read_back[offset : offset + reg.length]
+                )
+                self._verified[reg.unique_id] = changed
+        return True
 
-        resp = client.write_register(reg.address, raw_value)
+    def take_verified(self, unique_ids: Iterable[str]) -> Dict[str, bool]:
+        """Pop the registers an FC23 write already read back into ``image``.
+
+        Maps each unique_id to whether its words changed, so a read-back
+        after the write can skip them.
+        """
+        return {
+            unique_id: self._verified.pop(unique_id)
+            for unique_id in list(unique_ids)
+            if unique_id in self._verified
+        }
+
+    @staticmethod
+    def _check_write_response(regs: List[ModbusRegister], resp) -> None:
         if hasattr(resp, "isError") and resp.isError():
-            raise ModbusException(
-                f"Error writing register {reg.name} ({reg.address}): {resp}"
-            )
-        self._track_write()
+            names = ", ".join(reg.name for reg in regs)
+            if len(regs) == 1:
+                location = str(regs[0].address)
+            else:
+                location = f"{regs[0].address}-{regs[-1].address}"
+            raise ModbusException(f"Error writing register {names} ({location}): {resp}")
+
+    def _record_writes(self, regs: List[ModbusRegister]) -> None:
+        self._track_write(len(regs))
+        if self._write_budget is not None:
+            self._write_budget.record(reg.unique_id for reg in regs)
 
-    def _track_write(self) -> None:
+    def _track_write(self, registers: int = 1) -> None:
+        """Count ``registers`` register writes toward the weekly wear warning."""
         now = time.time()
         window_start = now - WRITE_WARNING_WINDOW_SECONDS
         while self._write_timestamps and self._write_timestamps[0] < window_start:
             self._write_timestamps.popleft()
-        self._write_timestamps.append(now)
+        self._write_timestamps.extend([now] * registers)
         write_count = len(self._write_timestamps)
         if write_count > WRITE_WARNING_THRESHOLD:
             if not self._write_warning_active:
@@ -223,63 +919,31 @@ class KebaModbusClient:
     # ---------------------------------------------------------------------
     #  Decoding
     # ---------------------------------------------------------------------
+    def decode_many(
+        self, words: Sequence[int], registers: List[ModbusRegister], address: int
+    ) -> Dict[str, float | int | str | bool | None]:
+        """Decode a contiguous run of raw words starting at ``address``.
+
+        Gives the same values as calling ``_decode_registers`` on each
+        register's slice, but unpacks the whole run at once. Meant for large
+        spans and recorded dumps; the compiled layout is cached per run, in a
+        cache bounded like the read plans.
+        """
+        key = (address, len(words), tuple(reg.unique_id for reg in registers))
+        decoder = self._block_decoders.get(key)
+        if decoder is None:
+            decoder = BlockDecoder(address, len(words), registers)
+            if len(self._block_decoders) >= MAX_CACHED_READ_PLANS:
+                self._block_decoders.clear()
+            self._block_decoders[key] = decoder
+        return decoder.decode(words)
+
     @staticmethod
     def _decode_registers(
         raw: list[int], reg: ModbusRegister
     ) -> float | int | str | bool | None:
-        """Decode according to data_type, then apply scale/offset and value_map."""
-        if not raw:
-            return None
+        """Decode according to data_type, then apply scale/offset and value_map.
 
-        def to_int16(v: int) -> int:
-            return v - 0x10000 if v & 0x8000 else v
-
-        # Basic decoding
-        if reg.data_type == "int16":
-            val = to_int16(raw[0])
-        elif reg.data_type == "uint16":
-            val = int(raw[0])
-        elif reg.data_type in ("int32", "uint32", "float32"):
-            if len(raw) < 2:
-                base = raw[0]
-                val = to_int16(base) if reg.data_type == "int32" else int(base)
-            else:
-                hi, lo = raw[0], raw[1]
-                combined = (hi << 16) | lo
-
-                if reg.data_type == "int32":
-                    val = struct.unpack(
-                        ">i", combined.to_bytes(4, "big", signed=False)
-                    )[0]
-                elif reg.data_type == "uint32":
-                    val = combined
-                else:  # float32
-                    val = struct.unpack(
-                        ">f", combined.to_bytes(4, "big", signed=False)
-                    )[0]
-        elif reg.data_type == "boolean":
-            val = bool(raw[0])
-        else:
-            # Unknown type: just return the first raw register
-            val = raw[0]
-
-        # Scale and offset
-        numeric = val
-        if isinstance(val, (int, float)):
-            try:
-                numeric = (float(val) * reg.scale) + reg.offset
-            except Exception:  # noqa: BLE001
-                numeric = val
-
-        # Map enum values if provided
-        if reg.value_map is not None:
-            key = str(int(val)) if isinstance(val, (int, float)) else str(val)
-            mapped = reg.value_map.get(key)
-            if mapped is not None:
-                return mapped
-
-        # Precision on floats
-        if isinstance(numeric, float) and reg.precision is not None:
-            numeric = round(numeric, reg.precision)
-
-        return numeric
+        The work is done by the register's compiled codec (see ``codec.py``).
+        """
+        return reg.codec.decode(raw)
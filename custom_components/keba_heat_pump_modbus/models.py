@@ -1,14 +1,56 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Literal
+import sys
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, Literal, Mapping, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .codec import RegisterCodec
 
 
 RegisterType = Literal["holding", "input"]
 EntityPlatform = Literal["sensor", "binary_sensor", "controls", "select"]
+PollTier = Literal["realtime", "normal", "slow", "static"]
+
+
+# Fields that repeat across registers (device keys, units, icons, ...).
+_INTERNED_FIELDS = (
+    "register_type",
+    "data_type",
+    "unit_of_measurement",
+    "device",
+    "icon",
+    "icon_on",
+    "icon_off",
+    "device_class",
+    "state_class",
+    "entity_category",
+    "entity_platform",
+    "poll_tier",
+)
 
+# One read-only mapping per distinct value map; the register catalog only
+# has a handful, repeated across circuits.
+_VALUE_MAPS: Dict[Tuple[Tuple[str, Any], ...], Mapping[str, Any]] = {}
 
-@dataclass
+
+def _shared_value_map(value_map: Mapping[str, Any]) -> Mapping[str, Any]:
+    items = tuple(
+        (sys.intern(key) if type(key) is str else key, value)
+        for key, value in value_map.items()
+    )
+    try:
+        shared = _VALUE_MAPS.get(items)
+    except TypeError:
+        # Unhashable options cannot be shared, but are still made read-only.
+        return MappingProxyType(dict(items))
+    if shared is None:
+        shared = _VALUE_MAPS[items] = MappingProxyType(dict(items))
+    return shared
+
+
+@dataclass(frozen=True, slots=True)
 class ModbusRegister:
     unique_id: str
     name: str
@@ -29,10 +71,59 @@ class ModbusRegister:
     entity_category: str | None = None  # "diagnostic", "config", etc.
     enabled_default: bool = True
     entity_platform: EntityPlatform = "sensor"  # sensor / binary_sensor
+    poll_tier: PollTier = "normal"  # how often the coordinator re-reads the register
+    refresh_with: Tuple[str, ...] | None = None  # unique_ids re-read after writing this one
     # Optional mapping for enumerations or binary values:
-    value_map: dict[str, Any] | None = (
-        None  # map raw values -> state (as string/bool/etc.)
-    )
+    value_map: Mapping[str, Any] | None = field(
+        default=None, hash=False
+    )  # map raw values -> state (as string/bool/etc.), shared and read-only
     native_min_value: float | int | None = None
     native_max_value: float | int | None = None
     native_step: float | int | None = None
+    _codec: RegisterCodec | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        _share_fields(self)
+
+    @property
+    def codec(self) -> RegisterCodec:
+        """Decoder/encoder compiled from this description on first use."""
+        codec = self._codec
+        if codec is None:
+            from .codec import RegisterCodec
+
+            codec = RegisterCodec(self)
+            object.__setattr__(self, "_codec", codec)
+        return codec
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        # The codec holds closures; it is compiled again after unpickling.
+        return tuple(
+            dict(value) if isinstance(value, MappingProxyType) else value
+            for value in (getattr(self, name) for name in _STATE_FIELDS)
+        )
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(_STATE_FIELDS, state):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_codec", None)
+        _share_fields(self)
+
+
+_STATE_FIELDS = tuple(f.name for f in fields(ModbusRegister) if f.init)
+
+
+def _share_fields(reg: ModbusRegister) -> None:
+    """Intern repeated strings and swap the value map for its shared copy."""
+    for name in _INTERNED_FIELDS:
+        value = getattr(reg, name)
+        if type(value) is str:
+            object.__setattr__(reg, name, sys.intern(value))
+    if reg.value_map is not None:
+        object.__setattr__(reg, "value_map", _shared_value_map(reg.value_map))
+    if reg.refresh_with is not None:
+        object.__setattr__(
+            reg, "refresh_with", tuple(sys.intern(uid) for uid in reg.refresh_with)
+        )
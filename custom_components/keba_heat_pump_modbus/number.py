@@ -19,7 +19,11 @@ from .const import (
 from .coordinator import KebaCoordinator
 from .modbus_client import KebaModbusClient
 from .models import ModbusRegister
-from .write_utils import DebouncedRegisterWriter, values_equal
+from .write_utils import (
+    DebouncedRegisterWriter,
+    pending_write_attributes,
+    values_equal,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,7 +60,7 @@ class KebaControl(CoordinatorEntity[KebaCoordinator], NumberEntity):
         reg: ModbusRegister,
         client: KebaModbusClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({reg.unique_id}))
         self._entry = entry
         self._reg = reg
         self._client = client
@@ -73,11 +77,11 @@ class KebaControl(CoordinatorEntity[KebaCoordinator], NumberEntity):
         self._attr_native_min_value = reg.native_min_value
         self._attr_native_max_value = reg.native_max_value
         self._debounced_writer = DebouncedRegisterWriter(
-            hass=coordinator.hass,
             coordinator=self.coordinator,
             client=self._client,
             reg=self._reg,
             current_value=self._current_value,
+            scheduler=coordinator.write_scheduler,
         )
 
     @property
@@ -97,13 +101,17 @@ class KebaControl(CoordinatorEntity[KebaCoordinator], NumberEntity):
 
     @property
     def native_value(self) -> Any:
+        return self.coordinator.value(self._reg.unique_id)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return pending_write_attributes(self.coordinator, self._reg)
+
+    def _current_value(self) -> Any:
         if self.coordinator.data is None:
             return None
         return self.coordinator.data.get(self._reg.unique_id)
 
-    def _current_value(self) -> Any:
-        return self.native_value
-
     async def async_set_native_value(self, value: float) -> None:
         if values_equal(self.native_value, value, self._reg.precision):
             return
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+from collections import OrderedDict
+from typing import List
+
+from pymodbus.exceptions import ModbusIOException
+
+from .const import DEFAULT_PIPELINE_MAX_WINDOW, MODBUS_TIMEOUT_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+_MBAP = struct.Struct(">HHHB")  # transaction id, protocol id, length, unit id
+_READ_REQUEST = struct.Struct(">BHH")  # function code, address, count
+_WRITE_SINGLE = struct.Struct(">BHH")  # function code, address, value
+_WRITE_MULTIPLE = struct.Struct(">BHHB")  # function code, address, count, bytes
+# function code, read address, read count, write address, write count, bytes
+_READ_WRITE = struct.Struct(">BHHHHB")
+
+FC_READ_HOLDING = 0x03
+FC_READ_INPUT = 0x04
+FC_WRITE_SINGLE = 0x06
+FC_WRITE_MULTIPLE = 0x10
+FC_READ_WRITE = 0x17
+
+
+class PipelineResponse:
+    """Minimal response object mirroring the parts of pymodbus' API we use."""
+
+    def __init__(
+        self, registers: List[int] | None = None, exception_code: int | None = None
+    ) -> None:
+        self.registers = registers or []
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802 - pymodbus naming
+        return self.exception_code is not None
+
+    def __repr__(self) -> str:
+        if self.exception_code is not None:
+            return f"PipelineResponse(exception_code={self.exception_code})"
+        return f"PipelineResponse(registers={self.registers})"
+
+
+class ModbusTcpPipeline:
+    """Modbus TCP connection that keeps several requests in flight.
+
+    Responses are matched to requests by MBAP transaction id, so up to
+    ``window`` requests can share one round trip. The window is found with
+    ``probe_window`` and drops back to 1 as soon as a response arrives out of
+    order or a request times out, as some gateways silently serialise or drop
+    queued requests.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        unit_id: int,
+        max_window: int = DEFAULT_PIPELINE_MAX_WINDOW,
+        timeout: float = MODBUS_TIMEOUT_SECONDS,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._unit_id = unit_id
+        self._max_window = max(1, max_window)
+        self._timeout = timeout
+        self.window = 1
+        self.probed = False
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: OrderedDict[int, asyncio.Future[PipelineResponse]] = OrderedDict()
+        self._next_tid = 0
+        self._slots = asyncio.Condition()
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    @property
+    def socket(self):
+        if self._writer is None:
+            return None
+        return self._writer.get_extra_info("socket")
+
+    async def connect(self) -> bool:
+        if self.connected:
+            return True
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), self._timeout
+            )
+        except (OSError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Pipeline connect to %s:%s failed: %s", self._host, self._port, err)
+            return False
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+        return True
+
+    def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._reader = None
+        self._fail_pending(ConnectionError("Pipeline closed"))
+
+    # ------------------------------------------------------------------
+    #  pymodbus-compatible request API
+    # ------------------------------------------------------------------
+    async def read_holding_registers(
+        self, address: int, count: int = 1
+    ) -> PipelineResponse:
+        return await self._request(_READ_REQUEST.pack(FC_READ_HOLDING, address, count))
+
+    async def read_input_registers(
+        self, address: int, count: int = 1
+    ) -> PipelineResponse:
+        return await self._request(_READ_REQUEST.pack(FC_READ_INPUT, address, count))
+
+    async def write_register(self, address: int, value: int) -> PipelineResponse:
+        return await self._request(_WRITE_SINGLE.pack(FC_WRITE_SINGLE, address, value))
+
+    async def write_registers(
+        self, address: int, values: List[int]
+    ) -> PipelineResponse:
+        count = len(values)
+        return await self._request(
+            _WRITE_MULTIPLE.pack(FC_WRITE_MULTIPLE, address, count, 2 * count)
+            + struct.pack(f">{count}H", *values)
+        )
+
+    async def readwrite_registers(
+        self,
+        read_address: int,
+        read_count: int,
+        write_address: int,
+        values: List[int],
+    ) -> PipelineResponse:
+        count = len(values)
+        return await self._request(
+            _READ_WRITE.pack(
+                FC_READ_WRITE, read_address, read_count, write_address, count, 2 * count
+            )
+            + struct.pack(f">{count}H", *values)
+        )
+
+    # ------------------------------------------------------------------
+    #  Window detection
+    # ------------------------------------------------------------------
+    async def probe_window(self, address: int, register_type: str = "holding") -> int:
+        """Find how many outstanding reads the controller answers correctly.
+
+        Only reads ``address`` (which must be readable), doubling the number of
+        concurrent requests until one comes back wrong, late or out of order.
+        """
+        read = (
+            self.read_holding_registers
+            if register_type == "holding"
+            else self.read_input_registers
+        )
+        good = 1
+        size = 2
+        while size <= self._max_window:
+            self.window = size
+            responses = await asyncio.gather(
+                *(read(address, count=1) for _ in range(size)),
+                return_exceptions=True,
+            )
+            if self.window < size or any(
+                isinstance(resp, Exception) or resp.isError() for resp in responses
+            ):
+                break
+            good = size
+            size *= 2
+
+        self.window = good
+        self.probed = True
+        _LOGGER.debug("Modbus pipeline window for %s: %s", self._host, good)
+        return good
+
+    def _fall_back(self, reason: str) -> None:
+        if self.window > 1:
+            _LOGGER.warning(
+                "Disabling Modbus pipelining for %s: %s", self._host, reason
+            )
+        self.window = 1
+
+    # ------------------------------------------------------------------
+    #  Internals
+    # ------------------------------------------------------------------
+    async def _request(self, pdu: bytes) -> PipelineResponse:
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            raise ConnectionError(f"Not connected to {self._host}:{self._port}")
+
+        async with self._slots:
+            await self._slots.wait_for(lambda: len(self._pending) < self.window)
+            tid = self._next_tid
+            self._next_tid = (self._next_tid + 1) & 0xFFFF
+            future: asyncio.Future[PipelineResponse] = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._pending[tid] = future
+            writer.write(_MBAP.pack(tid, 0, len(pdu) + 1, self._unit_id) + pdu)
+
+        try:
+            await writer.drain()
+            return await asyncio.wait_for(future, self._timeout)
+        except asyncio.TimeoutError as err:
+            self._fall_back(f"request {tid} timed out")
+            raise ModbusIOException(f"Timeout waiting for transaction {tid}") from err
+        finally:
+            self._pending.pop(tid, None)
+            async with self._slots:
+                self._slots.notify_all()
+
+    async def _read_loop(self) -> None:
+        assert self._reader is not None
+        try:
+            while True:
+                header = await self._reader.readexactly(_MBAP.size)
+                tid, _protocol, length, _unit = _MBAP.unpack(header)
+                pdu = await self._reader.readexactly(length - 1)
+                self._dispatch(tid, pdu)
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, ConnectionError, OSError) as err:
+            _LOGGER.debug("Pipeline connection to %s lost: %s", self._host, err)
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._fail_pending(ConnectionError("Connection lost"))
+
+    def _dispatch(self, tid: int, pdu: bytes) -> None:
+        if tid not in self._pending:
+            _LOGGER.debug("Dropping response for unknown transaction %s", tid)
+            return
+        if next(iter(self._pending)) != tid:
+            self._fall_back(f"response {tid} arrived out of order")
+        future = self._pending.pop(tid)
+        if future.done():
+            return
+
+        function_code = pdu[0]
+        if function_code & 0x80:
+            future.set_result(PipelineResponse(exception_code=pdu[1]))
+        elif function_code in (FC_READ_HOLDING, FC_READ_INPUT, FC_READ_WRITE):
+            count = pdu[1] // 2
+            future.set_result(
+                PipelineResponse(list(struct.unpack(f">{count}H", pdu[2 : 2 + 2 * count])))
+            )
+        else:
+            future.set_result(PipelineResponse())
+
+    def _fail_pending(self, err: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(err)
+        self._pending.clear()
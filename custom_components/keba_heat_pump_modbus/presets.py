@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PresetStore:
+    """Named snapshots of writable register values, kept in Home Assistant storage."""
+
+    def __init__(self, store: Any | None = None) -> None:
+        self._store = store
+        self._presets: Dict[str, Dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        if self._store is None:
+            return
+        data = await self._store.async_load()
+        if data:
+            self._presets = {
+                name: dict(values) for name, values in data.get("presets", {}).items()
+            }
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self._presets)
+
+    def get(self, name: str) -> Dict[str, Any] | None:
+        values = self._presets.get(name)
+        return dict(values) if values is not None else None
+
+    async def async_save(self, name: str, values: Dict[str, Any]) -> None:
+        self._presets[name] = dict(values)
+        _LOGGER.debug("Saved preset %s with %s registers", name, len(values))
+        if self._store is not None:
+            await self._store.async_save({"presets": self._presets})
+
+    async def async_delete(self, name: str) -> bool:
+        if self._presets.pop(name, None) is None:
+            return False
+        if self._store is not None:
+            await self._store.async_save({"presets": self._presets})
+        return True
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .codec import BlockDecoder
+from .const import DEFAULT_MAX_READ_GAP, MAX_READ_BLOCK_SIZE
+from .models import ModbusRegister, RegisterType
+
+
+@dataclass
+class ReadBlock:
+    """A contiguous span of registers that is fetched with a single request."""
+
+    register_type: RegisterType
+    address: int
+    count: int
+    registers: List[ModbusRegister] = field(default_factory=list)
+
+    @property
+    def end(self) -> int:
+        return self.address + self.count
+
+    def slice(self, words: List[int], reg: ModbusRegister) -> List[int]:
+        """Return the raw words belonging to ``reg`` from a block response."""
+        start = reg.address - self.address
+        return words[start : start + reg.length]
+
+    @cached_property
+    def decoder(self) -> BlockDecoder:
+        """Bulk decoder for this block, built on the first response."""
+        return BlockDecoder(self.address, self.count, self.registers)
+
+
+def _span(reg: ModbusRegister) -> Tuple[int, int]:
+    return reg.address, reg.address + max(reg.length, 1)
+
+
+def build_read_plan(
+    registers: Iterable[ModbusRegister],
+    max_gap: int = DEFAULT_MAX_READ_GAP,
+    max_block_size: int = MAX_READ_BLOCK_SIZE,
+    illegal_addresses: Set[Tuple[str, int]] | None = None,
+) -> List[ReadBlock]:
+    """Group registers into as few block reads as possible.
+
+    Registers are grouped per ``register_type`` and merged into one block while
+    the unused words between them stay within ``max_gap`` and the block does not
+    exceed ``max_block_size`` words (125 is the Modbus PDU limit). Addresses in
+    ``illegal_addresses`` are never bridged; registers that sit on such an
+    address are read on their own so they cannot fail a whole block.
+    """
+
+    illegal = illegal_addresses or set()
+    by_type: Dict[str, List[ModbusRegister]] = {}
+    for reg in registers:
+        by_type.setdefault(reg.register_type, []).append(reg)
+
+    plan: List[ReadBlock] = []
+
+    for register_type in sorted(by_type):
+        block: ReadBlock | None = None
+        block_isolated = False
+
+        for reg in sorted(by_type[register_type], key=_span):
+            start, end = _span(reg)
+            isolated = any(
+                (register_type, addr) in illegal for addr in range(start, end)
+            )
+
+            if block is not None and not isolated and not block_isolated:
+                new_end = max(block.end, end)
+                gap = range(block.end, start)
+                if (
+                    len(gap) <= max_gap
+                    and new_end - block.address <= max_block_size
+                    and not any((register_type, addr) in illegal for addr in gap)
+                ):
+                    block.count = new_end - block.address
+                    block.registers.append(reg)
+                    continue
+
+            block = ReadBlock(
+                register_type=register_type,
+                address=start,
+                count=end - start,
+                registers=[reg],
+            )
+            block_isolated = isolated
+            plan.append(block)
+
+    return plan
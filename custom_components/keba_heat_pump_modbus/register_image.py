@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import logging
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set
+
+from .models import ModbusRegister
+from .read_planner import ReadBlock
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RegisterImage(Mapping):
+    """Raw words of every polled address plus lazily decoded register values.
+
+    One ``array('H')`` per register type is indexed by Modbus address and
+    overwritten from each response. A register is only marked for decoding
+    when its words differ from what the image already held; its value is then
+    decoded on the next access and cached until the words change again.
+    Registers whose last read failed map to ``None``.
+    """
+
+    def __init__(self) -> None:
+        self._words: Dict[str, array] = {}
+        self._registers: Dict[str, ModbusRegister] = {}
+        self._values: Dict[str, Any] = {}
+        self._failed: Set[str] = set()
+        # Short or non-16-bit responses cannot live in the address image.
+        self._partial: Dict[str, List[int]] = {}
+
+    # ------------------------------------------------------------------
+    #  Updating
+    # ------------------------------------------------------------------
+    def _image(self, register_type: str, end: int) -> array:
+        words = self._words.get(register_type)
+        if words is None:
+            words = self._words[register_type] = array("H")
+        if len(words) < end:
+            words.extend([0] * (end - len(words)))
+        return words
+
+    def store_block(self, block: ReadBlock, words: Sequence[int]) -> Set[str]:
+        """Copy a block response into the image; return the changed unique_ids."""
+        try:
+            new = array("H", words[: block.count])
+        except (OverflowError, TypeError):
+            new = None
+        if new is None or len(new) < block.count:
+            # Short or non-16-bit response: keep what each register got.
+            return {
+                reg.unique_id
+                for reg in block.registers
+                if self.store_register(reg, list(block.slice(list(words), reg)))
+            }
+        image = self._image(block.register_type, block.end)
+        old = image[block.address : block.end]
+        changed: Set[str] = set()
+
+        if old == new:
+            # Identical words: only registers seen for the first time (or
+            # recovering from a failed read) change.
+            for reg in block.registers:
+                if self._mark_known(reg) or self._drop_partial(reg):
+                    changed.add(reg.unique_id)
+            return changed
+
+        image[block.address : block.end] = new
+        for reg in block.registers:
+            start = reg.address - block.address
+            end = start + reg.length
+            first = self._mark_known(reg) or self._drop_partial(reg)
+            if first or old[start:end] != new[start:end]:
+                self._values.pop(reg.unique_id, None)
+                changed.add(reg.unique_id)
+        return changed
+
+    def store_register(self, reg: ModbusRegister, words: List[int] | None) -> bool:
+        """Record a single-register read (``None`` when it failed)."""
+        unique_id = reg.unique_id
+        if words is None:
+            was_failed = unique_id in self._failed
+            self._registers[unique_id] = reg
+            self._failed.add(unique_id)
+            self._values[unique_id] = None
+            self._partial.pop(unique_id, None)
+            return not was_failed
+
+        try:
+            new = array("H", words[: reg.length])
+        except (OverflowError, TypeError):
+            new = None
+        if new is None or len(new) < reg.length:
+            first = self._mark_known(reg)
+            if first or self._partial.get(unique_id) != words:
+                self._partial[unique_id] = list(words)
+                self._values.pop(unique_id, None)
+                return True
+            return False
+
+        image = self._image(reg.register_type, reg.address + reg.length)
+        first = self._mark_known(reg) or self._drop_partial(reg)
+        if first or image[reg.address : reg.address + reg.length] != new:
+            image[reg.address : reg.address + reg.length] = new
+            self._values.pop(unique_id, None)
+            return True
+        return False
+
+    def _mark_known(self, reg: ModbusRegister) -> bool:
+        """Register ``reg`` as readable; True if its value is new or recovered."""
+        unique_id = reg.unique_id
+        if unique_id in self._failed:
+            self._failed.discard(unique_id)
+            self._values.pop(unique_id, None)
+            return True
+        if unique_id not in self._registers:
+            self._registers[unique_id] = reg
+            return True
+        return False
+
+    def _drop_partial(self, reg: ModbusRegister) -> bool:
+        if self._partial.pop(reg.unique_id, None) is None:
+            return False
+        self._values.pop(reg.unique_id, None)
+        return True
+
+    def words(self, unique_id: str) -> List[int] | None:
+        """Raw words last read for ``unique_id``; ``None`` if unknown or failed."""
+        reg = self._registers.get(unique_id)
+        if reg is None or unique_id in self._failed:
+            return None
+        raw = self._partial.get(unique_id)
+        if raw is not None:
+            return list(raw)
+        return self._words[reg.register_type][reg.address : reg.address + reg.length].tolist()
+
+    # ------------------------------------------------------------------
+    #  Mapping interface (what entities see as coordinator.data)
+    # ------------------------------------------------------------------
+    def __getitem__(self, unique_id: str) -> Any:
+        try:
+            return self._values[unique_id]
+        except KeyError:
+            pass
+        reg = self._registers[unique_id]
+        raw = self._partial.get(unique_id)
+        if raw is None:
+            words = self._words[reg.register_type]
+            raw = words[reg.address : reg.address + reg.length].tolist()
+        try:
+            value = reg.codec.decode(raw)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.exception(
+                "Exception decoding register %s (%s): %s", reg.name, reg.address, err
+            )
+            value = None
+        self._values[unique_id] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._registers)
+
+    def __len__(self) -> int:
+        return len(self._registers)
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._registers
+
+    def view(self, unique_ids: Iterable[str], changed: Set[str]) -> "ReadResult":
+        return ReadResult(self, unique_ids, changed)
+
+
+class ReadResult(Mapping):
+    """The registers read in one ``async_read_all`` call, decoded on access.
+
+    ``changed`` holds the unique_ids whose raw words (or failure state) differ
+    from the previous read; ``image`` is the full register image behind it.
+    """
+
+    def __init__(
+        self, image: RegisterImage, unique_ids: Iterable[str], changed: Set[str]
+    ) -> None:
+        self.image = image
+        self.changed = changed
+        self._keys = dict.fromkeys(unique_ids)
+
+    def __getitem__(self, unique_id: str) -> Any:
+        if unique_id not in self._keys:
+            raise KeyError(unique_id)
+        return self.image[unique_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._keys
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from dataclasses import fields
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .const import REGISTER_PACK_VERSION
+from .models import ModbusRegister
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _read_sources(paths: Sequence[str]) -> Tuple[str, List[Tuple[str, bytes]]]:
+    """Read the JSON sources and return their content hash with the raw bytes.
+
+    The hash also covers the pack format and the register fields, so a pack
+    written by another version of the integration is never reused.
+    """
+    digest = hashlib.sha256(f"{REGISTER_PACK_VERSION}".encode())
+    digest.update(",".join(field.name for field in fields(ModbusRegister)).encode())
+    sources: List[Tuple[str, bytes]] = []
+    for path in paths:
+        with open(path, "rb") as f:
+            raw = f.read()
+        name = os.path.basename(path)
+        digest.update(name.encode() + b"\0" + raw + b"\0")
+        sources.append((name, raw))
+    return digest.hexdigest(), sources
+
+
+def _parse_sources(sources: List[Tuple[str, bytes]]) -> List[ModbusRegister]:
+    regs: List[ModbusRegister] = []
+    for name, raw in sources:
+        data: Dict[str, Any] = json.loads(raw)
+        items = data.get("registers", [])
+        regs.extend(ModbusRegister(**item) for item in items)
+        _LOGGER.debug("Loaded %s Modbus registers from %s", len(items), name)
+    return regs
+
+
+def _read_pack(pack_path: str, source_hash: str) -> List[ModbusRegister] | None:
+    try:
+        with open(pack_path, "rb") as f:
+            pack = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as err:  # noqa: BLE001 - a broken pack is simply rebuilt
+        _LOGGER.debug("Ignoring unreadable register pack %s: %s", pack_path, err)
+        return None
+    if not isinstance(pack, dict) or pack.get("source_hash") != source_hash:
+        return None
+    return pack["registers"]
+
+
+def _write_pack(
+    pack_path: str, source_hash: str, registers: List[ModbusRegister]
+) -> None:
+    # Registers are pickled before their codecs are compiled; codecs hold
+    # closures and are rebuilt after loading.
+    tmp_path = f"{pack_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(pack_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"source_hash": source_hash, "registers": registers},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, pack_path)
+    except OSError as err:
+        # A read-only install still works, it just parses the JSON every time.
+        _LOGGER.debug("Could not write register pack %s: %s", pack_path, err)
+
+
+def load_register_pack(
+    paths: Sequence[str], pack_path: str | None
+) -> List[ModbusRegister]:
+    """Return the registers described by the JSON files at ``paths``.
+
+    With a ``pack_path``, the parsed registers are kept in a pickled pack
+    keyed by a content hash of the sources. The pack is reused as long as the
+    sources are unchanged and rebuilt otherwise, so a setup or reload skips
+    JSON parsing and building each ``ModbusRegister``.
+    """
+    source_hash, sources = _read_sources(paths)
+    if pack_path is not None:
+        registers = _read_pack(pack_path, source_hash)
+        if registers is not None:
+            _LOGGER.debug("Loaded %s Modbus registers from %s", len(registers), pack_path)
+            return registers
+    registers = _parse_sources(sources)
+    if pack_path is not None:
+        _write_pack(pack_path, source_hash, registers)
+    return registers
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_DAYS, ATTR_TIME, ATTR_VALUES, WRITE_WARNING_THRESHOLD
+from .models import ModbusRegister
+from .services import validate_value
+from .write_budget import WriteBudget
+from .write_utils import values_equal
+
+_LOGGER = logging.getLogger(__name__)
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+@dataclass
+class ScheduleSlot:
+    """Register values to apply at a time of day on some weekdays."""
+
+    days: List[int]
+    minute: int
+    values: Dict[str, Any]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            ATTR_DAYS: [WEEKDAYS[day] for day in self.days],
+            ATTR_TIME: f"{self.minute // 60:02d}:{self.minute % 60:02d}",
+            ATTR_VALUES: dict(self.values),
+        }
+
+
+def _parse_time(value: str) -> int:
+    for fmt in ("%H:%M", "%H:%M:%S"):
+        try:
+            parsed = datetime.strptime(str(value), fmt)
+        except ValueError:
+            continue
+        return parsed.hour * 60 + parsed.minute
+    raise ValueError(f"invalid time '{value}'")
+
+
+def parse_slots(
+    slots: Iterable[Mapping[str, Any]],
+    registers: Mapping[str, ModbusRegister],
+    strict: bool = True,
+) -> List[ScheduleSlot]:
+    """Validate raw slots; raise ValueError listing every problem.
+
+    Without ``strict``, values for unknown registers or out of their range
+    (a stored schedule after the register set changed) are dropped instead.
+    """
+    parsed: List[ScheduleSlot] = []
+    problems: List[str] = []
+    stale: List[str] = []
+    for index, slot in enumerate(slots, start=1):
+        try:
+            minute = _parse_time(slot.get(ATTR_TIME, ""))
+        except ValueError as err:
+            problems.append(f"slot {index}: {err}")
+            continue
+        days = []
+        for day in slot.get(ATTR_DAYS) or WEEKDAYS:
+            if day not in WEEKDAYS:
+                problems.append(f"slot {index}: invalid day '{day}'")
+                continue
+            days.append(WEEKDAYS.index(day))
+        values: Dict[str, Any] = {}
+        for unique_id, value in (slot.get(ATTR_VALUES) or {}).items():
+            reg = registers.get(unique_id)
+            if reg is None:
+                (problems if strict else stale).append(
+                    f"slot {index}: {unique_id}: unknown register"
+                )
+                continue
+            try:
+                _, values[unique_id] = validate_value(reg, value)
+            except ValueError as err:
+                (problems if strict else stale).append(f"slot {index}: {unique_id}: {err}")
+        if not slot.get(ATTR_VALUES):
+            problems.append(f"slot {index}: no values")
+        if values:
+            parsed.append(ScheduleSlot(sorted(set(days)), minute, values))
+    if stale:
+        _LOGGER.warning("Dropping stored schedule values: %s", "; ".join(stale))
+    if problems:
+        raise ValueError("; ".join(problems))
+    return parsed
+
+
+def compile_transitions(
+    slots: Iterable[ScheduleSlot], registers: Mapping[str, ModbusRegister]
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Reduce slots to the register changes per minute of the week.
+
+    Slots at the same time are merged into one transition. As the week
+    repeats, a register starts out at the last value the week leaves it at,
+    and a value equal to the one before it is dropped; a register that is
+    always scheduled to the same value keeps its first occurrence, so it is
+    still applied once a week.
+    """
+    merged: Dict[int, Dict[str, Any]] = {}
+    for slot in slots:
+        for day in slot.days:
+            merged.setdefault(day * MINUTES_PER_DAY + slot.minute, {}).update(slot.values)
+    points = sorted(merged.items())
+
+    def _equal(unique_id: str, current: Any, new: Any) -> bool:
+        return values_equal(current, new, registers[unique_id].precision)
+
+    state: Dict[str, Any] = {}
+    scheduled: Dict[str, List[Any]] = {}
+    for _, values in points:
+        state.update(values)
+        for unique_id, value in values.items():
+            scheduled.setdefault(unique_id, []).append(value)
+    constant = {
+        unique_id
+        for unique_id, seen in scheduled.items()
+        if all(_equal(unique_id, seen[0], value) for value in seen)
+    }
+
+    transitions: List[Tuple[int, Dict[str, Any]]] = []
+    for minute, values in points:
+        changes = {
+            unique_id: value
+            for unique_id, value in values.items()
+            if not _equal(unique_id, state[unique_id], value)
+        }
+        for unique_id in constant & values.keys():
+            changes[unique_id] = values[unique_id]
+            constant.discard(unique_id)
+        state.update(values)
+        if changes:
+            transitions.append((minute, changes))
+    return transitions
+
+
+def _minute_of_week(now: datetime) -> int:
+    return now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+
+
+class SetpointSchedule:
+    """A weekly schedule of register values, kept in Home Assistant storage.
+
+    Only the register changes between consecutive slots are applied, and
+    the changes due at the same time are written as one batch through
+    ``write`` (which skips values the controller already has). A schedule
+    whose changes would exceed ``weekly_budget`` writes per week is refused;
+    with a limited ``write_budget``, its weekly allowance minus the other
+    writes of the past week applies instead, so the budget does not throttle
+    an accepted schedule.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: Any | None,
+        registers: Iterable[ModbusRegister],
+        write: Callable[[Mapping[str, Any]], Awaitable[Dict[str, str]]],
+        weekly_budget: int = WRITE_WARNING_THRESHOLD,
+        write_budget: WriteBudget | None = None,
+    ) -> None:
+        self._hass = hass
+        self._store = store
+        self._registers = {reg.unique_id: reg for reg in registers}
+        self._write = write
+        self._weekly_budget = weekly_budget
+        self._write_budget = write_budget
+        self._slots: List[ScheduleSlot] = []
+        self._transitions: List[Tuple[int, Dict[str, Any]]] = []
+        self._unsub: Callable[[], None] | None = None
+        self._running = False
+
+    @property
+    def slots(self) -> List[Dict[str, Any]]:
+        return [slot.as_dict() for slot in self._slots]
+
+    @property
+    def writes_per_week(self) -> int:
+        return sum(len(changes) for _, changes in self._transitions)
+
+    async def async_load(self) -> None:
+        if self._store is None:
+            return
+        data = await self._store.async_load()
+        if not data:
+            return
+        try:
+            self._apply(
+                parse_slots(data.get("slots", []), self._registers, strict=False)
+            )
+        except ValueError as err:
+            _LOGGER.warning("Ignoring stored schedule: %s", err)
+
+    async def async_set(self, slots: Iterable[Mapping[str, Any]]) -> int:
+        """Validate, store and start a new schedule; an empty one clears it.
+
+        Raises ValueError if a slot is invalid or the schedule needs more
+        writes per week than the budget allows. Returns the writes per week.
+        """
+        parsed = parse_slots(slots, self._registers)
+        transitions = compile_transitions(parsed, self._registers)
+        writes = sum(len(changes) for _, changes in transitions)
+        allowed = self._weekly_allowance()
+        if writes > allowed:
+            raise ValueError(
+                f"schedule needs {writes} register writes per week, "
+                f"more than the budget of {allowed}"
+            )
+        self._apply(parsed, transitions)
+        if self._store is not None:
+            await self._store.async_save({"slots": self.slots})
+        if self._running:
+            self.async_start()
+        return writes
+
+    def _weekly_allowance(self) -> int:
+        budget = self._write_budget
+        if budget is None or not budget.limited:
+            return self._weekly_budget
+        # The schedule being replaced accounts for part of the past week.
+        others = max(budget.recent_count - self.writes_per_week, 0)
+        return max(budget.per_day * 7 - others, 0)
+
+    def _apply(
+        self,
+        slots: List[ScheduleSlot],
+        transitions: List[Tuple[int, Dict[str, Any]]] | None = None,
+    ) -> None:
+        self._slots = slots
+        if transitions is None:
+            transitions = compile_transitions(slots, self._registers)
+        self._transitions = transitions
+        _LOGGER.debug(
+            "Schedule has %s transitions, %s writes per week",
+            len(transitions),
+            self.writes_per_week,
+        )
+
+    def async_start(self) -> None:
+        self.async_stop()
+        self._running = True
+        self._schedule_next(dt_util.now())
+
+    def async_stop(self) -> None:
+        self._running = False
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def _schedule_next(self, now: datetime) -> None:
+        if not self._transitions:
+            return
+        current = _minute_of_week(now)
+        minute, changes = next(
+            (
+                (minute, changes)
+                for minute, changes in self._transitions
+                if minute > current
+            ),
+            (self._transitions[0][0] + MINUTES_PER_WEEK, self._transitions[0][1]),
+        )
+        when = now.replace(second=0, microsecond=0) + timedelta(minutes=minute - current)
+
+        async def _async_fire(fired_at: datetime) -> None:
+            self._unsub = None
+            self._schedule_next(when)
+            await self._async_apply(changes)
+
+        self._unsub = async_track_point_in_time(self._hass, _async_fire, when)
+
+    async def _async_apply(self, changes: Dict[str, Any]) -> None:
+        try:
+            results = await self._write(changes)
+        except Exception as err:  # noqa: BLE001 - keep the schedule running
+            _LOGGER.warning("Applying scheduled values failed: %s", err)
+            return
+        written = [uid for uid, result in results.items() if result == "written"]
+        _LOGGER.info(
+            "Schedule wrote %s of %s registers", len(written), len(results)
+        )
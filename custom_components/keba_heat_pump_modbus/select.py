@@ -19,6 +19,7 @@ from .const import (
 from .coordinator import KebaCoordinator
 from .modbus_client import KebaModbusClient
 from .models import ModbusRegister
+from .write_utils import async_write_with_read_back, pending_write_attributes
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,7 +63,7 @@ class KebaSelect(CoordinatorEntity[KebaCoordinator], SelectEntity):
         reg: ModbusRegister,
         client: KebaModbusClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({reg.unique_id}))
         self._entry = entry
         self._reg = reg
         self._client = client
@@ -93,27 +94,18 @@ class KebaSelect(CoordinatorEntity[KebaCoordinator], SelectEntity):
 
     @property
     def current_option(self) -> str | None:
-        if self.coordinator.data is None:
-            return None
-
-        value = self.coordinator.data.get(self._reg.unique_id)
+        value = self.coordinator.value(self._reg.unique_id)
         return value if value in self._options else None
 
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return pending_write_attributes(self.coordinator, self._reg)
+
     async def async_select_option(self, option: str) -> None:
         if not self._reg.value_map:
             raise ValueError(f"No value_map defined for {self._reg.unique_id}")
 
-        raw_value: int | None = None
-        for key, val in self._reg.value_map.items():
-            if val == option:
-                try:
-                    raw_value = int(key)
-                except ValueError as err:  # noqa: BLE001
-                    raise ValueError(
-                        f"Invalid register key '{key}' for option '{option}'"
-                    ) from err
-                break
-
+        raw_value = self._reg.codec.option_to_raw.get(option)
         if raw_value is None:
             raise ValueError(
                 f"Invalid option '{option}' for {self._reg.unique_id}")
@@ -122,7 +114,6 @@ class KebaSelect(CoordinatorEntity[KebaCoordinator], SelectEntity):
         if self.current_option == option:
             return
 
-        await self.hass.async_add_executor_job(
-            self._client.write_register, self._reg, raw_value
+        await async_write_with_read_back(
+            self.coordinator, self._client, self._reg, raw_value, option
         )
-        await self.coordinator.async_request_refresh()
@@ -9,9 +9,19 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, DATA_COORDINATOR, DATA_REGISTERS, DEVICE_NAME_MAP
+from .connection import CONNECTION_STATES, ConnectionManager
+from .io_worker import LatencyStats, ModbusIOWorker
+from .const import (
+    DOMAIN,
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DATA_REGISTERS,
+    DEVICE_NAME_MAP,
+)
 from .models import ModbusRegister
 from .coordinator import KebaCoordinator
+from .write_behind import WriteBehindQueue
+from .write_budget import WriteBudget
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +52,23 @@ async def async_setup_entry(
     }.issubset(register_ids):
         entities.append(KebaFlowRateSensor(coordinator, entry))
 
+    client = data.get(DATA_CLIENT)
+    if client is not None:
+        entities.append(KebaConnectionStateSensor(client.connection, entry))
+        entities.append(KebaReconnectCountSensor(client.connection, entry))
+        entities.append(KebaQueueWaitSensor(coordinator, entry, client.io))
+        entities.append(KebaServiceTimeSensor(coordinator, entry, client.io))
+        if client.write_budget is not None:
+            if client.write_budget.limited:
+                entities.append(
+                    KebaWriteBudgetSensor(coordinator, entry, client.write_budget)
+                )
+            entities.append(
+                KebaWriteCountSensor(coordinator, entry, client.write_budget)
+            )
+        if client.write_behind is not None:
+            entities.append(KebaQueuedWritesSensor(client.write_behind, entry))
+
     async_add_entities(entities)
 
 
@@ -53,7 +80,7 @@ class KebaSensor(CoordinatorEntity[KebaCoordinator], SensorEntity):
     def __init__(
         self, coordinator: KebaCoordinator, entry: ConfigEntry, reg: ModbusRegister
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({reg.unique_id}))
         self._entry = entry
         self._reg = reg
 
@@ -102,7 +129,12 @@ class KebaCopSensor(CoordinatorEntity[KebaCoordinator], SensorEntity):
     _attr_suggested_display_precision = 2
 
     def __init__(self, coordinator: KebaCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset(
+                {"heat_power_consumption", "electrical_power_consumption"}
+            ),
+        )
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_cop"
 
@@ -149,7 +181,12 @@ class KebaFlowRateSensor(CoordinatorEntity[KebaCoordinator], SensorEntity):
     _attr_suggested_display_precision = 0
 
     def __init__(self, coordinator: KebaCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset(
+                {"heat_power_consumption", "flow_temperature", "reflux_temperature"}
+            ),
+        )
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_flow_rate"
 
@@ -180,3 +217,267 @@ class KebaFlowRateSensor(CoordinatorEntity[KebaCoordinator], SensorEntity):
             return None
 
         return round((heat_power * 3600) / (4186 * delta_temp), 1)
+
+
+class _KebaConnectionSensor(SensorEntity):
+    """Base for diagnostic sensors that follow the Modbus connection manager."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = "diagnostic"
+
+    def __init__(self, connection: ConnectionManager, entry: ConfigEntry) -> None:
+        self._connection = connection
+        self._entry = entry
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_heat_pump")},
+            "name": "Heat Pump",
+            "manufacturer": "KEBA",
+            "model": "Heat Pump (Modbus)",
+            "configuration_url": None,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            self._connection.async_add_listener(self.async_write_ha_state)
+        )
+
+
+class KebaConnectionStateSensor(_KebaConnectionSensor):
+    """Reports whether the Modbus link is up, down or reconnecting."""
+
+    _attr_name = "Modbus Connection"
+    _attr_icon = "mdi:lan-connect"
+    _attr_device_class = "enum"
+    _attr_options = CONNECTION_STATES
+
+    def __init__(self, connection: ConnectionManager, entry: ConfigEntry) -> None:
+        super().__init__(connection, entry)
+        self._attr_unique_id = f"{entry.entry_id}_modbus_connection"
+
+    @property
+    def native_value(self) -> str:
+        return self._connection.state
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {
+            "mode": self._connection.mode,
+            "last_error": self._connection.last_error,
+        }
+
+
+class KebaReconnectCountSensor(_KebaConnectionSensor):
+    """Counts how often the Modbus link had to be re-established."""
+
+    _attr_name = "Modbus Reconnects"
+    _attr_icon = "mdi:lan-pending"
+    _attr_state_class = "total_increasing"
+
+    def __init__(self, connection: ConnectionManager, entry: ConfigEntry) -> None:
+        super().__init__(connection, entry)
+        self._attr_unique_id = f"{entry.entry_id}_modbus_reconnects"
+
+    @property
+    def native_value(self) -> int:
+        return self._connection.reconnect_count
+
+
+class _KebaIOLatencySensor(CoordinatorEntity[KebaCoordinator], SensorEntity):
+    """Base for diagnostic sensors on the Modbus I/O worker's latencies.
+
+    They refresh with every poll; the state is the smoothed value over all
+    requests, the attributes break it down per request class. ``stat`` names
+    the ``LatencyStats`` field the sensor reports.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = "diagnostic"
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = "measurement"
+    _attr_suggested_display_precision = 1
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: KebaCoordinator,
+        entry: ConfigEntry,
+        worker: ModbusIOWorker,
+        stat: str,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._worker = worker
+        self._stat = stat
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_heat_pump")},
+            "name": "Heat Pump",
+            "manufacturer": "KEBA",
+            "model": "Heat Pump (Modbus)",
+            "configuration_url": None,
+        }
+
+    def _seconds(self, stats: LatencyStats) -> float:
+        return getattr(stats, self._stat)
+
+    @property
+    def native_value(self) -> float | None:
+        if self._worker.total.count == 0:
+            return None
+        return round(self._seconds(self._worker.total) * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {
+            kind: round(self._seconds(stats) * 1000, 1)
+            for kind, stats in self._worker.stats.items()
+            if stats.count
+        }
+
+
+class KebaQueueWaitSensor(_KebaIOLatencySensor):
+    """How long Modbus requests wait for the connection before they are sent."""
+
+    _attr_name = "Modbus Queue Wait"
+    _attr_icon = "mdi:tray-full"
+
+    def __init__(
+        self, coordinator: KebaCoordinator, entry: ConfigEntry, worker: ModbusIOWorker
+    ) -> None:
+        super().__init__(coordinator, entry, worker, "queue_wait")
+        self._attr_unique_id = f"{entry.entry_id}_modbus_queue_wait"
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        attributes = super().extra_state_attributes
+        attributes["max_write"] = round(
+            self._worker.stats["write"].max_queue_wait * 1000, 1
+        )
+        return attributes
+
+
+class KebaServiceTimeSensor(_KebaIOLatencySensor):
+    """Round-trip time of Modbus requests once they are sent."""
+
+    _attr_name = "Modbus Service Time"
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self, coordinator: KebaCoordinator, entry: ConfigEntry, worker: ModbusIOWorker
+    ) -> None:
+        super().__init__(coordinator, entry, worker, "service_time")
+        self._attr_unique_id = f"{entry.entry_id}_modbus_service_time"
+
+
+class _KebaWriteBudgetBase(CoordinatorEntity[KebaCoordinator], SensorEntity):
+    """Base for diagnostic sensors on the persistent register write budget."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = "diagnostic"
+
+    def __init__(
+        self, coordinator: KebaCoordinator, entry: ConfigEntry, budget: WriteBudget
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._budget = budget
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_heat_pump")},
+            "name": "Heat Pump",
+            "manufacturer": "KEBA",
+            "model": "Heat Pump (Modbus)",
+            "configuration_url": None,
+        }
+
+
+class KebaWriteBudgetSensor(_KebaWriteBudgetBase):
+    """Register writes that can be made right now without waiting."""
+
+    _attr_name = "Write Budget Remaining"
+    _attr_icon = "mdi:counter"
+
+    def __init__(
+        self, coordinator: KebaCoordinator, entry: ConfigEntry, budget: WriteBudget
+    ) -> None:
+        super().__init__(coordinator, entry, budget)
+        self._attr_unique_id = f"{entry.entry_id}_write_budget_remaining"
+
+    @property
+    def native_value(self) -> int:
+        return self._budget.remaining
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {
+            "per_day": self._budget.per_day,
+            "burst": self._budget.burst,
+            "policy": self._budget.policy,
+        }
+
+
+class KebaWriteCountSensor(_KebaWriteBudgetBase):
+    """Total register writes, with the count per register as attributes."""
+
+    _attr_name = "Modbus Writes"
+    _attr_icon = "mdi:pencil-box-multiple"
+    _attr_state_class = "total_increasing"
+
+    def __init__(
+        self, coordinator: KebaCoordinator, entry: ConfigEntry, budget: WriteBudget
+    ) -> None:
+        super().__init__(coordinator, entry, budget)
+        self._attr_unique_id = f"{entry.entry_id}_modbus_writes"
+
+    @property
+    def native_value(self) -> int:
+        return self._budget.total
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return dict(self._budget.per_register)
+
+
+class KebaQueuedWritesSensor(SensorEntity):
+    """Writes waiting in the write-behind queue for the Modbus link to return."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = "diagnostic"
+    _attr_name = "Queued Writes"
+    _attr_icon = "mdi:tray-arrow-up"
+    _attr_state_class = "measurement"
+
+    def __init__(self, queue: WriteBehindQueue, entry: ConfigEntry) -> None:
+        self._queue = queue
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_queued_writes"
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_heat_pump")},
+            "name": "Heat Pump",
+            "manufacturer": "KEBA",
+            "model": "Heat Pump (Modbus)",
+            "configuration_url": None,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._queue.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        return len(self._queue)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {"registers": self._queue.unique_ids}
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Mapping, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+
+from .const import (
+    ATTR_DAYS,
+    ATTR_ENTRY_ID,
+    ATTR_NAME,
+    ATTR_SLOTS,
+    ATTR_TIME,
+    ATTR_VALUES,
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DATA_PRESETS,
+    DATA_REGISTERS,
+    DATA_SCHEDULE,
+    DOMAIN,
+    SERVICE_DELETE_PRESET,
+    SERVICE_RESTORE_PRESET,
+    SERVICE_SAVE_PRESET,
+    SERVICE_SET_SCHEDULE,
+    SERVICE_WRITE_REGISTERS,
+)
+from .models import ModbusRegister
+from .write_utils import async_write_batch, values_equal
+
+_LOGGER = logging.getLogger(__name__)
+
+WRITE_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_VALUES): {str: vol.Any(vol.Coerce(float), str)},
+        vol.Optional(ATTR_ENTRY_ID): str,
+    }
+)
+PRESET_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_NAME): str,
+        vol.Optional(ATTR_ENTRY_ID): str,
+    }
+)
+SET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_SLOTS): [
+            {
+                vol.Optional(ATTR_DAYS): [str],
+                vol.Required(ATTR_TIME): str,
+                vol.Required(ATTR_VALUES): {str: vol.Any(vol.Coerce(float), str)},
+            }
+        ],
+        vol.Optional(ATTR_ENTRY_ID): str,
+    }
+)
+
+# Every register is a holding register; only those exposed as number or
+# select entities are meant to be written.
+_WRITABLE_PLATFORMS = ("controls", "select")
+
+# Tolerance when checking that a value lies on a register's step grid.
+_STEP_TOLERANCE = 1e-6
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services once, for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_WRITE_REGISTERS):
+        return
+
+    async def _async_handle_write_registers(call: ServiceCall) -> ServiceResponse:
+        return await async_write_registers(hass, call.data)
+
+    async def _async_handle_save_preset(call: ServiceCall) -> ServiceResponse:
+        return await async_save_preset(hass, call.data)
+
+    async def _async_handle_restore_preset(call: ServiceCall) -> ServiceResponse:
+        return await async_restore_preset(hass, call.data)
+
+    async def _async_handle_delete_preset(call: ServiceCall) -> None:
+        await async_delete_preset(hass, call.data)
+
+    async def _async_handle_set_schedule(call: ServiceCall) -> ServiceResponse:
+        return await async_set_schedule(hass, call.data)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_REGISTERS,
+        _async_handle_write_registers,
+        schema=WRITE_REGISTERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_PRESET,
+        _async_handle_save_preset,
+        schema=PRESET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_PRESET,
+        _async_handle_restore_preset,
+        schema=PRESET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_PRESET,
+        _async_handle_delete_preset,
+        schema=PRESET_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCHEDULE,
+        _async_handle_set_schedule,
+        schema=SET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _entry_data(hass: HomeAssistant, entry_id: str | None) -> Dict[str, Any]:
+    entries: Dict[str, Dict[str, Any]] = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        if entry_id not in entries:
+            raise ServiceValidationError(f"Unknown config entry {entry_id}")
+        return entries[entry_id]
+    if len(entries) != 1:
+        raise ServiceValidationError(
+            f"{len(entries)} KEBA heat pumps are set up; pass {ATTR_ENTRY_ID}"
+        )
+    return next(iter(entries.values()))
+
+
+def _is_writable(reg: ModbusRegister) -> bool:
+    return reg.register_type == "holding" and reg.entity_platform in _WRITABLE_PLATFORMS
+
+
+def validate_value(reg: ModbusRegister, value: Any) -> Tuple[float | int, Any]:
+    """Return the value to encode and the value to show, or raise ValueError."""
+    if not _is_writable(reg):
+        raise ValueError("register is read-only")
+
+    if isinstance(value, str) and not reg.codec.value_to_option:
+        # A number sent as text, e.g. from a template.
+        try:
+            value = float(value)
+        except ValueError:
+            raise ValueError(f"'{value}' is not a number") from None
+    if isinstance(value, str):
+        raw = reg.codec.option_to_raw.get(value)
+        if raw is None:
+            raise ValueError(f"invalid option '{value}'")
+        return raw, value
+    if reg.codec.value_to_option:
+        raise ValueError(f"expects one of {sorted(reg.codec.option_to_raw)}")
+
+    if reg.native_min_value is not None and value < reg.native_min_value:
+        raise ValueError(f"{value} is below the minimum {reg.native_min_value}")
+    if reg.native_max_value is not None and value > reg.native_max_value:
+        raise ValueError(f"{value} is above the maximum {reg.native_max_value}")
+    if reg.native_step:
+        steps = (value - (reg.native_min_value or 0)) / reg.native_step
+        if abs(steps - round(steps)) > _STEP_TOLERANCE:
+            raise ValueError(f"{value} is not a multiple of the step {reg.native_step}")
+    return value, value
+
+
+async def async_write_registers(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Validate a set of register values and write the ones that differ.
+
+    Nothing is written unless every value is valid. Values equal to what the
+    controller reports are skipped; the rest are written in address order as
+    one batch, so neighbouring registers share a request, and read back
+    together. The response reports ``written``, ``unchanged``, ``queued`` or
+    the error for each register.
+    """
+    entry_data = _entry_data(hass, data.get(ATTR_ENTRY_ID))
+    return {"results": await async_write_values(entry_data, data[ATTR_VALUES])}
+
+
+async def async_save_preset(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Snapshot the current value of every writable register under a name.
+
+    A current value that could not be written back (off the step grid, out of
+    range or not one of the options) is left out of the preset and reported
+    under ``skipped`` with the reason.
+    """
+    entry_data = _entry_data(hass, data.get(ATTR_ENTRY_ID))
+    current = entry_data[DATA_COORDINATOR].data or {}
+    values: Dict[str, Any] = {}
+    skipped: Dict[str, str] = {}
+    for reg in entry_data[DATA_REGISTERS]:
+        value = current.get(reg.unique_id)
+        if value is None or not _is_writable(reg):
+            continue
+        try:
+            validate_value(reg, value)
+        except ValueError as err:
+            skipped[reg.unique_id] = str(err)
+            continue
+        values[reg.unique_id] = value
+    if skipped:
+        _LOGGER.warning(
+            "Preset %s leaves out values that cannot be restored: %s",
+            data[ATTR_NAME],
+            "; ".join(f"{unique_id}: {reason}" for unique_id, reason in skipped.items()),
+        )
+    await entry_data[DATA_PRESETS].async_save(data[ATTR_NAME], values)
+    return {"registers": len(values), "skipped": skipped}
+
+
+async def async_restore_preset(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Write the registers of a saved preset that differ from the controller."""
+    entry_data = _entry_data(hass, data.get(ATTR_ENTRY_ID))
+    name = data[ATTR_NAME]
+    values = entry_data[DATA_PRESETS].get(name)
+    if values is None:
+        raise ServiceValidationError(f"Unknown preset {name}")
+    return {"results": await async_write_values(entry_data, values, strict=False)}
+
+
+async def async_delete_preset(hass: HomeAssistant, data: Mapping[str, Any]) -> None:
+    entry_data = _entry_data(hass, data.get(ATTR_ENTRY_ID))
+    name = data[ATTR_NAME]
+    if not await entry_data[DATA_PRESETS].async_delete(name):
+        raise ServiceValidationError(f"Unknown preset {name}")
+
+
+async def async_set_schedule(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Replace the weekly schedule; refused if it would exceed the write budget."""
+    entry_data = _entry_data(hass, data.get(ATTR_ENTRY_ID))
+    try:
+        writes = await entry_data[DATA_SCHEDULE].async_set(data[ATTR_SLOTS])
+    except ValueError as err:
+        raise ServiceValidationError(f"Invalid schedule: {err}") from err
+    return {"writes_per_week": writes}
+
+
+async def async_write_values(
+    entry_data: Dict[str, Any], values: Mapping[str, Any], strict: bool = True
+) -> Dict[str, str]:
+    """Write the values that differ and return the outcome per register.
+
+    With ``strict``, one invalid value rejects the whole set. Otherwise, as
+    for stored presets and schedules that may predate the current register
+    set, invalid values are reported in the results and the rest is written.
+    """
+    coordinator = entry_data[DATA_COORDINATOR]
+    client = entry_data[DATA_CLIENT]
+    registers = {reg.unique_id: reg for reg in entry_data[DATA_REGISTERS]}
+
+    planned: List[Tuple[ModbusRegister, float | int, Any]] = []
+    invalid: Dict[str, str] = {}
+    for unique_id, value in values.items():
+        reg = registers.get(unique_id)
+        if reg is None:
+            invalid[unique_id] = "unknown register"
+            continue
+        try:
+            raw, shown = validate_value(reg, value)
+        except ValueError as err:
+            invalid[unique_id] = str(err)
+            continue
+        planned.append((reg, raw, shown))
+    if invalid and strict:
+        raise ServiceValidationError(
+            "Invalid register values: "
+            + "; ".join(f"{unique_id}: {reason}" for unique_id, reason in invalid.items())
+        )
+
+    results: Dict[str, str] = {}
+    for unique_id, reason in invalid.items():
+        results[unique_id] = (
+            reason if reason == "unknown register" else f"invalid: {reason}"
+        )
+        _LOGGER.warning("Skipping stored value for %s: %s", unique_id, reason)
+    changes: List[Tuple[ModbusRegister, float | int, Any]] = []
+    current = coordinator.data or {}
+    for reg, raw, shown in sorted(planned, key=lambda item: item[0].address):
+        if values_equal(current.get(reg.unique_id), shown, reg.precision):
+            results[reg.unique_id] = "unchanged"
+        else:
+            changes.append((reg, raw, shown))
+    if not changes:
+        return results
+
+    results.update(await async_write_batch(coordinator, client, changes))
+    return results
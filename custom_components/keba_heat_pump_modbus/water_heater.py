@@ -27,7 +27,12 @@ from .const import (
 from .coordinator import KebaCoordinator
 from .modbus_client import KebaModbusClient
 from .models import ModbusRegister
-from .write_utils import DebouncedRegisterWriter, values_equal
+from .write_utils import (
+    DebouncedRegisterWriter,
+    async_write_with_read_back,
+    pending_write_attributes,
+    values_equal,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -112,7 +117,16 @@ class KebaWaterHeater(CoordinatorEntity[KebaCoordinator], WaterHeaterEntity):
         mode_reg: ModbusRegister,
         client: KebaModbusClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset(
+                {
+                    current_temp_reg.unique_id,
+                    target_temp_reg.unique_id,
+                    mode_reg.unique_id,
+                }
+            ),
+        )
         self._entry = entry
         self._current_temp_reg = current_temp_reg
         self._target_temp_reg = target_temp_reg
@@ -140,11 +154,11 @@ class KebaWaterHeater(CoordinatorEntity[KebaCoordinator], WaterHeaterEntity):
             else 0.5
         )
         self._debounced_writer = DebouncedRegisterWriter(
-            hass=coordinator.hass,
             coordinator=self.coordinator,
             client=self._client,
             reg=self._target_temp_reg,
             current_value=self._current_target_temperature,
+            scheduler=coordinator.write_scheduler,
         )
 
     @property
@@ -171,19 +185,24 @@ class KebaWaterHeater(CoordinatorEntity[KebaCoordinator], WaterHeaterEntity):
 
     @property
     def target_temperature(self) -> float | None:
+        value = self.coordinator.value(self._target_temp_reg.unique_id)
+        return float(value) if value is not None else None
+
+    def _current_target_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
         value = self.coordinator.data.get(self._target_temp_reg.unique_id)
         return float(value) if value is not None else None
 
-    def _current_target_temperature(self) -> float | None:
-        return self.target_temperature
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return pending_write_attributes(
+            self.coordinator, self._target_temp_reg, self._mode_reg
+        )
 
     @property
     def current_operation(self) -> str | None:
-        if self.coordinator.data is None:
-            return None
-        raw_mode = self.coordinator.data.get(self._mode_reg.unique_id)
+        raw_mode = self.coordinator.value(self._mode_reg.unique_id)
         if raw_mode is None:
             return None
 
@@ -215,10 +234,13 @@ class KebaWaterHeater(CoordinatorEntity[KebaCoordinator], WaterHeaterEntity):
         current_mode = self.current_operation
         if current_mode is not None and normalized == current_mode.lower():
             return
-        await self.hass.async_add_executor_job(
-            self._client.write_register, self._mode_reg, mode_value
+        await async_write_with_read_back(
+            self.coordinator,
+            self._client,
+            self._mode_reg,
+            mode_value,
+            (self._mode_reg.codec.value_to_option or {}).get(mode_value, mode_value),
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_will_remove_from_hass(self) -> None:
         self._debounced_writer.cancel()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from pymodbus.exceptions import ModbusException
+
+from .const import WRITE_BEHIND_SAVE_DELAY_SECONDS
+from .models import ModbusRegister
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WriteQueued(ModbusException):
+    """The link is down; the write was queued and goes out once it is back."""
+
+
+class WriteBehindQueue:
+    """Register writes held back while the Modbus link is down.
+
+    The queue keeps the raw words of the latest write per register (a later
+    write replaces an earlier one) and lives in Home Assistant storage, so it
+    survives a restart. The client flushes it when the link comes back,
+    skipping registers that already hold the queued words; ``on_flushed`` is
+    then called with the registers that were handled, so their values can be
+    read back.
+    """
+
+    def __init__(self, store: Any | None = None) -> None:
+        self._store = store
+        self._pending: Dict[str, Tuple[ModbusRegister, List[int]]] = {}
+        self._listeners: List[Callable[[], None]] = []
+        self.on_flushed: Callable[[List[str]], Awaitable[None]] | None = None
+
+    async def async_load(self, registers: Iterable[ModbusRegister]) -> None:
+        """Restore queued writes for the registers this entry still has."""
+        if self._store is None:
+            return
+        data = await self._store.async_load()
+        if not data:
+            return
+        by_id = {reg.unique_id: reg for reg in registers}
+        for unique_id, words in data.get("writes", {}).items():
+            reg = by_id.get(unique_id)
+            if reg is None:
+                _LOGGER.debug("Dropping queued write to unknown register %s", unique_id)
+                continue
+            self._pending[unique_id] = (reg, [int(word) for word in words])
+        if self._pending:
+            _LOGGER.info("Restored %s queued Modbus writes", len(self._pending))
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        return {
+            "writes": {
+                unique_id: words for unique_id, (_, words) in self._pending.items()
+            }
+        }
+
+    def _changed(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(
+                self._data_to_save, WRITE_BEHIND_SAVE_DELAY_SECONDS
+            )
+        for listener in list(self._listeners):
+            listener()
+
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def unique_ids(self) -> List[str]:
+        return list(self._pending)
+
+    def items(self) -> List[Tuple[ModbusRegister, List[int]]]:
+        return list(self._pending.values())
+
+    def enqueue(self, reg: ModbusRegister, words: List[int]) -> None:
+        self._pending[reg.unique_id] = (reg, list(words))
+        _LOGGER.debug("Queued write of %s to %s until the link is back", words, reg.name)
+        self._changed()
+
+    def discard(self, unique_id: str, words: List[int] | None = None) -> None:
+        """Drop the queued write; with ``words``, only if it was not replaced since."""
+        entry = self._pending.get(unique_id)
+        if entry is None or (words is not None and entry[1] != words):
+            return
+        del self._pending[unique_id]
+        self._changed()
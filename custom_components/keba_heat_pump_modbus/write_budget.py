@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List
+
+from pymodbus.exceptions import ModbusException
+
+from .const import (
+    DEFAULT_WRITE_BUDGET_PER_DAY,
+    DEFAULT_WRITE_BUDGET_POLICY,
+    WRITE_BUDGET_BURST,
+    WRITE_BUDGET_MAX_WAIT_SECONDS,
+    WRITE_BUDGET_POLICY_REJECT,
+    WRITE_BUDGET_SAVE_DELAY_SECONDS,
+    WRITE_WARNING_THRESHOLD,
+    WRITE_WARNING_WINDOW_SECONDS,
+)
+
+# Writes of the past week are counted per hour, so the stored history stays
+# bounded however many writes are made.
+_BUCKET_SECONDS = 3600
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WriteBudgetExceeded(ModbusException):
+    """A write was refused because the write budget is used up."""
+
+
+class WriteBudget:
+    """Token bucket that limits register writes to protect the controller's flash.
+
+    The bucket holds up to ``burst`` tokens and refills at ``per_day`` tokens a
+    day; every written register takes one token, and a write that fails gives
+    its tokens back. When the bucket is empty the ``delay`` policy holds the
+    write until enough tokens are available, for at most
+    ``WRITE_BUDGET_MAX_WAIT_SECONDS`` (writes that keep arriving meanwhile are
+    coalesced by the client's write queue), and fails it if the tokens take
+    longer; the ``reject`` policy fails it right away. ``close`` ends waiting writes, so unloading
+    the entry is not held up. With ``per_day`` 0 writes are only counted.
+
+    The token level, the total and per-register write counts and the hourly
+    write counts of the past week live in Home Assistant storage, so neither
+    the budget nor the weekly wear warning is reset by a restart.
+    """
+
+    def __init__(
+        self,
+        store: Any | None = None,
+        per_day: int = DEFAULT_WRITE_BUDGET_PER_DAY,
+        burst: int = WRITE_BUDGET_BURST,
+        policy: str = DEFAULT_WRITE_BUDGET_POLICY,
+    ) -> None:
+        self._store = store
+        self.per_day = max(int(per_day), 0)
+        self.burst = max(int(burst), 1)
+        self.policy = policy
+        self._rate = self.per_day / 86400.0  # tokens per second
+        self._closed = False
+        self._wake: asyncio.Event | None = None
+        self._tokens = float(self.burst)
+        self._updated = time.time()
+        self.total = 0
+        self.per_register: Dict[str, int] = {}
+        self._recent: Dict[int, int] = {}  # hour bucket -> writes
+
+    # ------------------------------------------------------------------
+    #  Persistence
+    # ------------------------------------------------------------------
+    async def async_load(self) -> None:
+        if self._store is None:
+            return
+        data = await self._store.async_load()
+        if not data:
+            return
+        self._tokens = min(float(data.get("tokens", self.burst)), float(self.burst))
+        self._updated = float(data.get("updated", time.time()))
+        self.total = int(data.get("total", 0))
+        self.per_register = {
+            key: int(count) for key, count in data.get("registers", {}).items()
+        }
+        self._recent = {
+            int(bucket): int(count) for bucket, count in data.get("recent", {}).items()
+        }
+        self._refill(time.time())
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        return {
+            "tokens": self._tokens,
+            "updated": self._updated,
+            "total": self.total,
+            "registers": self.per_register,
+            "recent": {str(bucket): count for bucket, count in self._recent.items()},
+        }
+
+    def _schedule_save(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(
+                self._data_to_save, WRITE_BUDGET_SAVE_DELAY_SECONDS
+            )
+
+    # ------------------------------------------------------------------
+    #  Budget
+    # ------------------------------------------------------------------
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self._tokens + elapsed * self._rate, float(self.burst))
+        self._updated = now
+
+    @property
+    def limited(self) -> bool:
+        return self.per_day > 0
+
+    @property
+    def remaining(self) -> int:
+        """Whole writes that can be made right now."""
+        self._refill(time.time())
+        return int(self._tokens)
+
+    async def async_acquire(self, registers: int = 1) -> None:
+        """Take ``registers`` tokens, waiting or failing per the policy.
+
+        The client never asks for more than ``burst`` tokens at once. Raises
+        WriteBudgetExceeded if the tokens are not available within
+        ``WRITE_BUDGET_MAX_WAIT_SECONDS``, as the caller awaits the write.
+        """
+        if not self.limited:
+            return
+        if registers > self.burst:
+            raise WriteBudgetExceeded(
+                f"{registers} register writes exceed the write budget burst of {self.burst}"
+            )
+        self._refill(time.time())
+        missing = registers - self._tokens
+        if missing > 0:
+            wait = missing / self._rate
+            if (
+                self.policy == WRITE_BUDGET_POLICY_REJECT
+                or self._closed
+                or wait > WRITE_BUDGET_MAX_WAIT_SECONDS
+            ):
+                raise WriteBudgetExceeded(
+                    f"Modbus write budget of {self.per_day} writes per day exhausted; "
+                    f"next write possible in {wait:.0f} s"
+                )
+            _LOGGER.debug("Write budget exhausted; delaying write by %.1f s", wait)
+            if self._wake is None:
+                self._wake = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._wake.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                raise WriteBudgetExceeded(
+                    "Write held back by the write budget was dropped on shutdown"
+                )
+            self._refill(time.time())
+        self._tokens = max(self._tokens - registers, 0.0)
+        self._schedule_save()
+
+    def refund(self, registers: int) -> None:
+        """Give back the tokens of writes that did not reach the controller."""
+        if not self.limited or registers <= 0:
+            return
+        self._refill(time.time())
+        self._tokens = min(self._tokens + registers, float(self.burst))
+        self._schedule_save()
+
+    def close(self) -> None:
+        """Fail writes waiting for tokens, and later ones that would have to wait."""
+        self._closed = True
+        if self._wake is not None:
+            self._wake.set()
+            self._wake = None
+
+    def _prune(self, now: float) -> None:
+        first = int((now - WRITE_WARNING_WINDOW_SECONDS) // _BUCKET_SECONDS)
+        for bucket in [bucket for bucket in self._recent if bucket < first]:
+            del self._recent[bucket]
+
+    def record(self, unique_ids: Iterable[str]) -> None:
+        """Count writes that reached the controller."""
+        now = time.time()
+        self._prune(now)
+        bucket = int(now // _BUCKET_SECONDS)
+        for unique_id in unique_ids:
+            self.total += 1
+            self.per_register[unique_id] = self.per_register.get(unique_id, 0) + 1
+            self._recent[bucket] = self._recent.get(bucket, 0) + 1
+        self._schedule_save()
+
+    @property
+    def recent_count(self) -> int:
+        """Writes in the weekly warning window, to the hour."""
+        self._prune(time.time())
+        return sum(self._recent.values())
+
+    def recent_writes(self) -> List[float]:
+        """Times of the latest writes in the weekly warning window, to the hour.
+
+        At most ``WRITE_WARNING_THRESHOLD + 1`` are returned, enough to tell
+        whether the warning threshold was crossed.
+        """
+        self._prune(time.time())
+        stamps: List[float] = []
+        for bucket in sorted(self._recent, reverse=True):
+            count = min(self._recent[bucket], WRITE_WARNING_THRESHOLD + 1 - len(stamps))
+            stamps.extend([float(bucket * _BUCKET_SECONDS)] * count)
+            if len(stamps) > WRITE_WARNING_THRESHOLD:
+                break
+        return sorted(stamps)
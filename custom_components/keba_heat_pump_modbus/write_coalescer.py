@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
+
+from .const import MAX_WRITE_REGISTERS, WRITE_COALESCE_SECONDS
+from .models import ModbusRegister
+
+_LOGGER = logging.getLogger(__name__)
+
+# One register and the raw words to put into it.
+PendingWrite = Tuple[ModbusRegister, List[int]]
+WriteRun = List[PendingWrite]
+_Entry = Tuple[ModbusRegister, List[int], List[asyncio.Future]]
+
+
+def group_runs(
+    writes: List[PendingWrite], max_registers: int = MAX_WRITE_REGISTERS
+) -> List[WriteRun]:
+    """Split ``writes`` into address-contiguous runs of at most ``max_registers`` words."""
+    runs: List[WriteRun] = []
+    current: WriteRun = []
+    next_address = None
+    size = 0
+    for reg, words in sorted(writes, key=lambda item: item[0].address):
+        if current and reg.address == next_address and size + len(words) <= max_registers:
+            current.append((reg, words))
+            size += len(words)
+        else:
+            current = [(reg, words)]
+            runs.append(current)
+            size = len(words)
+        next_address = reg.address + len(words)
+    return runs
+
+
+class WriteCoalescer:
+    """Collect holding-register writes for a short window and flush them in runs.
+
+    Writes submitted within ``window`` seconds of the first pending one are
+    flushed together: address-contiguous registers go out as one multi-register
+    request (FC16), so a scene that touches several neighbouring setpoints
+    costs one round trip and one commit on the controller. A later write to
+    the same address replaces the pending value. ``submit`` returns once the
+    run holding the write was acknowledged and raises if that run failed.
+
+    Flushes run one after another: writes submitted while a flush is in
+    progress (for example one held back by the write budget) stay pending and
+    keep coalescing until that flush is done.
+    """
+
+    def __init__(
+        self,
+        write_run: Callable[[WriteRun], Awaitable[None]],
+        window: float = WRITE_COALESCE_SECONDS,
+        max_registers: int = MAX_WRITE_REGISTERS,
+    ) -> None:
+        self._write_run = write_run
+        self._window = window
+        self._max_registers = max_registers
+        self._pending: Dict[int, _Entry] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._flushing = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, reg: ModbusRegister, words: List[int]) -> None:
+        future = self._add(reg, words)
+        if self._window <= 0:
+            await self._drain()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._window, self._start_flush
+            )
+        await future
+
+    async def submit_many(self, writes: List[PendingWrite]) -> List[Exception | None]:
+        """Flush ``writes`` together right away; return the error of each, or None."""
+        futures = [self._add(reg, words) for reg, words in writes]
+        await self._drain()
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        return [result if isinstance(result, Exception) else None for result in results]
+
+    def _add(self, reg: ModbusRegister, words: List[int]) -> asyncio.Future:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        previous = self._pending.get(reg.address)
+        futures = previous[2] if previous is not None else []
+        futures.append(future)
+        self._pending[reg.address] = (reg, words, futures)
+        return future
+
+    async def async_flush(self) -> None:
+        """Write everything pending now, e.g. before the connection is closed."""
+        await self._drain()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _take(self) -> Dict[int, _Entry]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        return batch
+
+    def _start_flush(self) -> None:
+        self._timer = None
+        task = asyncio.get_running_loop().create_task(self._drain())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self) -> None:
+        if self._flushing:
+            return  # the running flush picks up what was added meanwhile
+        self._flushing = True
+        try:
+            while self._pending:
+                await self._flush(self._take())
+        finally:
+            self._flushing = False
+
+    async def _flush(self, batch: Dict[int, _Entry]) -> None:
+        if not batch:
+            return
+        runs = group_runs(
+            [(reg, words) for reg, words, _ in batch.values()], self._max_registers
+        )
+        if len(runs) < len(batch):
+            _LOGGER.debug(
+                "Coalesced %s register writes into %s requests", len(batch), len(runs)
+            )
+        for run in runs:
+            try:
+                await self._write_run(run)
+            except Exception as err:  # noqa: BLE001
+                self._resolve(batch, run, err)
+            else:
+                self._resolve(batch, run, None)
+
+    @staticmethod
+    def _resolve(batch: Dict[int, _Entry], run: WriteRun, err: Exception | None) -> None:
+        for reg, _ in run:
+            for future in batch[reg.address][2]:
+                if future.done():
+                    continue
+                if err is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(err)
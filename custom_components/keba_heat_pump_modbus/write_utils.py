@@ -2,13 +2,17 @@ from __future__ import annotations
 from math import isclose
 
 import asyncio
-from typing import Callable
+import logging
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 from homeassistant.core import HomeAssistant
 
 from .coordinator import KebaCoordinator
 from .modbus_client import KebaModbusClient
 from .models import ModbusRegister
+from .write_behind import WriteQueued
+
+_LOGGER = logging.getLogger(__name__)
 
 
 def values_equal(
@@ -42,69 +46,209 @@ def values_equal(
     return current == new
 
 
-class DebouncedRegisterWriter:
+def pending_write_attributes(
+    coordinator: KebaCoordinator, *registers: ModbusRegister
+) -> dict[str, Any]:
+    """State attributes flagging an unconfirmed write or the last rolled-back one."""
+    attributes: dict[str, Any] = {
+        "pending_write": any(coordinator.is_pending(reg.unique_id) for reg in registers)
+    }
+    errors = [
+        error
+        for error in (coordinator.write_error(reg.unique_id) for reg in registers)
+        if error is not None
+    ]
+    if errors:
+        attributes["write_error"] = "; ".join(errors)
+    return attributes
+
+
+async def async_write_with_read_back(
+    coordinator: KebaCoordinator,
+    client: KebaModbusClient,
+    reg: ModbusRegister,
+    raw_value: float | int | bool,
+    shown_value: Any,
+) -> None:
+    """Write ``raw_value``, showing ``shown_value`` until the read-back settles it.
+
+    The coordinator publishes ``shown_value`` right away. A failed write rolls
+    it back and re-raises; otherwise the register is read back, which confirms
+    the value or rolls it back if the controller did not take it as sent.
+    A write queued while the link is down stays pending until the queue is
+    flushed and read back.
+    """
+    coordinator.set_pending(reg.unique_id, shown_value)
+    try:
+        await client.async_write_register(reg, raw_value)
+    except WriteQueued as err:
+        _LOGGER.info("%s", err)
+        return
+    except Exception as err:
+        coordinator.rollback(reg.unique_id, str(err))
+        raise
+    await coordinator.async_refresh_registers([reg.unique_id])
+
+
+async def async_write_batch(
+    coordinator: KebaCoordinator,
+    client: KebaModbusClient,
+    changes: Sequence[Tuple[ModbusRegister, float | int | bool, Any]],
+) -> Dict[str, str]:
+    """Write ``(reg, raw_value, shown_value)`` changes as one batch and read them back.
+
+    Each shown value is published right away. The client writes the batch in
+    one go, so neighbouring registers share a request; failed registers are
+    rolled back, queued ones stay pending, and the written ones are read back
+    together. Returns ``written``, ``queued`` or the error for each register.
+    """
+    for reg, _, shown in changes:
+        coordinator.set_pending(reg.unique_id, shown)
+    errors = await client.async_write_registers([(reg, raw) for reg, raw, _ in changes])
+
+    results: Dict[str, str] = {}
+    written: List[str] = []
+    for reg, _, _ in changes:
+        err = errors.get(reg.unique_id)
+        if err is None:
+            results[reg.unique_id] = "written"
+            written.append(reg.unique_id)
+        elif isinstance(err, WriteQueued):
+            results[reg.unique_id] = "queued"
+        else:
+            coordinator.rollback(reg.unique_id, str(err))
+            results[reg.unique_id] = f"error: {err}"
+            _LOGGER.warning("Writing %s failed: %s", reg.unique_id, err)
+    if written:
+        await coordinator.async_refresh_registers(written)
+    return results
+
+
+# Slack when checking the deadline, so a timer firing a hair early is not re-armed.
+_DEADLINE_TOLERANCE = 0.001
+
+
+class DebounceScheduler:
+    """A single debounce timer for all writable registers of a config entry.
+
+    Writers hand the latest value of their register to the scheduler instead
+    of starting a task each. One ``call_at`` handle fires once no register has
+    changed for ``delay`` seconds; a change only moves the deadline, and the
+    handle re-arms itself when it fires before it. The values that still
+    differ from the controller are then written as one batch. Setup creates
+    one per entry and keeps it on the coordinator as ``write_scheduler``.
+    """
+
     def __init__(
         self,
         hass: HomeAssistant,
         coordinator: KebaCoordinator,
         client: KebaModbusClient,
-        reg: ModbusRegister,
-        current_value: Callable[[], float | int | bool | str | None],
-        delay: float | None = None,
+        delay: float,
     ) -> None:
         self._hass = hass
         self._coordinator = coordinator
         self._client = client
-        self._reg = reg
-        self._current_value = current_value
-        if delay is None:
-            # Read at runtime so tests can monkeypatch const.WRITE_DEBOUNCE_SECONDS.
-            from .const import WRITE_DEBOUNCE_SECONDS
-
-            delay = WRITE_DEBOUNCE_SECONDS
-        self._delay = float(delay)
-        self._pending_task: asyncio.Task[None] | None = None
-        self._pending_value: float | int | bool | str | None = None
+        self._delay = delay
+        self._pending: Dict[str, Tuple[ModbusRegister, Any, Callable[[], Any]]] = {}
+        self._deadline = 0.0
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
 
-    def cancel(self) -> None:
-        if self._pending_task is not None:
-            self._pending_task.cancel()
-            self._pending_task = None
+    @property
+    def delay(self) -> float:
+        return self._delay
 
-    async def schedule(self, value: float | int | bool | str) -> None:
-        if values_equal(self._current_value(), value, self._reg.precision):
-            return
-        self._pending_value = value
+    def is_pending(self, unique_id: str) -> bool:
+        return unique_id in self._pending
 
-        # For unit tests (often using asyncio.run) and for callers that want immediate
-        # writes, allow delay=0 to execute synchronously.
-        if self._delay <= 0:
-            await self._write_pending()
+    def schedule(
+        self,
+        reg: ModbusRegister,
+        value: float | int | bool | str,
+        current_value: Callable[[], float | int | bool | str | None],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        self._pending[reg.unique_id] = (reg, value, current_value)
+        self._deadline = loop.time() + self._delay
+        if self._handle is None:
+            self._handle = loop.call_at(self._deadline, self._fire)
+
+    def cancel(self, unique_id: str) -> bool:
+        """Drop the register's waiting value; return whether there was one."""
+        if self._pending.pop(unique_id, None) is None:
+            return False
+        if not self._pending and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        return True
+
+    def _fire(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._deadline - loop.time() > _DEADLINE_TOLERANCE:
+            self._handle = loop.call_at(self._deadline, self._fire)
             return
-
-        if self._pending_task is not None:
-            self._pending_task.cancel()
+        self._handle = None
+        batch, self._pending = self._pending, {}
         create_task = getattr(self._hass, "async_create_task", None)
         if callable(create_task):
-            self._pending_task = create_task(self._delayed_write())
+            task = create_task(self._async_flush(batch))
         else:
             # Fallback for lightweight test stubs that don't implement hass.async_create_task.
-            self._pending_task = asyncio.create_task(self._delayed_write())
+            task = loop.create_task(self._async_flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
-    async def _write_pending(self) -> None:
-        value = self._pending_value
-        if value is None:
+    async def _async_flush(
+        self, batch: Dict[str, Tuple[ModbusRegister, Any, Callable[[], Any]]]
+    ) -> None:
+        changes: List[Tuple[ModbusRegister, Any, Any]] = []
+        for reg, value, current_value in batch.values():
+            if values_equal(current_value(), value, reg.precision):
+                self._coordinator.clear_pending(reg.unique_id)
+                continue
+            changes.append((reg, value, value))
+        if not changes:
             return
+        changes.sort(key=lambda change: change[0].address)
+        _LOGGER.debug("Flushing %s debounced register writes", len(changes))
+        await async_write_batch(self._coordinator, self._client, changes)
+
+
+class DebouncedRegisterWriter:
+    """Hand one register's new values to the entry's ``DebounceScheduler``.
+
+    Without a scheduler, or with a zero delay, each value is written right away.
+    """
+
+    def __init__(
+        self,
+        coordinator: KebaCoordinator,
+        client: KebaModbusClient,
+        reg: ModbusRegister,
+        current_value: Callable[[], float | int | bool | str | None],
+        scheduler: DebounceScheduler | None,
+    ) -> None:
+        self._coordinator = coordinator
+        self._client = client
+        self._reg = reg
+        self._current_value = current_value
+        self._scheduler = scheduler if scheduler is not None and scheduler.delay > 0 else None
+
+    def cancel(self) -> None:
+        if self._scheduler is not None and self._scheduler.cancel(self._reg.unique_id):
+            self._coordinator.clear_pending(self._reg.unique_id)
+
+    async def schedule(self, value: float | int | bool | str) -> None:
         if values_equal(self._current_value(), value, self._reg.precision):
+            # Back to the value the controller has: drop a write still waiting.
+            self.cancel()
             return
-        await self._hass.async_add_executor_job(
-            self._client.write_register, self._reg, value
-        )
-        await self._coordinator.async_request_refresh()
-
-    async def _delayed_write(self) -> None:
-        try:
-            await asyncio.sleep(self._delay)
-        except asyncio.CancelledError:
+        self._coordinator.set_pending(self._reg.unique_id, value)
+
+        if self._scheduler is None:
+            await async_write_with_read_back(
+                self._coordinator, self._client, self._reg, value, value
+            )
             return
-        await self._write_pending()
+        self._scheduler.schedule(self._reg, value, self._current_value)
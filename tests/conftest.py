@@ -1,6 +1,6 @@
 import sys
 import types
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 
 def _ensure_voluptuous_stub() -> None:
@@ -28,6 +28,8 @@ def _ensure_voluptuous_stub() -> None:
     vol.All = lambda *funcs: _identity
     vol.Coerce = lambda typ: typ
     vol.Range = lambda min=None, max=None: _identity
+    vol.In = lambda container: _identity
+    vol.Any = lambda *validators: _identity
 
     sys.modules["voluptuous"] = vol
 
@@ -177,8 +179,33 @@ def _create_homeassistant_stub() -> None:
     def callback(func):
         return func
 
+    class ServiceCall:
+        def __init__(self, domain, service, data=None):
+            self.domain = domain
+            self.service = service
+            self.data = data or {}
+
+    class SupportsResponse:
+        NONE = "none"
+        OPTIONAL = "optional"
+        ONLY = "only"
+
     core.HomeAssistant = HomeAssistant
     core.callback = callback
+    core.ServiceCall = ServiceCall
+    core.ServiceResponse = dict
+    core.SupportsResponse = SupportsResponse
+
+    exceptions = types.ModuleType("homeassistant.exceptions")
+
+    class HomeAssistantError(Exception):
+        pass
+
+    class ServiceValidationError(HomeAssistantError):
+        pass
+
+    exceptions.HomeAssistantError = HomeAssistantError
+    exceptions.ServiceValidationError = ServiceValidationError
 
     typing_mod = types.ModuleType("homeassistant.helpers.typing")
     typing_mod.ConfigType = dict
@@ -237,8 +264,9 @@ def _create_homeassistant_stub() -> None:
         pass
 
     class CoordinatorEntity:
-        def __init__(self, coordinator=None):
+        def __init__(self, coordinator=None, context=None):
             self.coordinator = coordinator
+            self.coordinator_context = context
             self.hass = getattr(coordinator, "hass", None)
 
         __class_getitem__ = classmethod(lambda cls, item: cls)
@@ -251,10 +279,26 @@ def _create_homeassistant_stub() -> None:
             self.logger = logger
             self.name = name
             self.update_interval = update_interval
+            self.last_update_success = True
+            self._listeners = {}
+
+        def async_add_listener(self, update_callback, context=None):
+            def remove_listener():
+                self._listeners.pop(remove_listener)
+
+            self._listeners[remove_listener] = (update_callback, context)
+            return remove_listener
+
+        def async_update_listeners(self):
+            for update_callback, _context in list(self._listeners.values()):
+                update_callback()
 
         async def async_config_entry_first_refresh(self):
             await self._async_update_data()
 
+        async def async_request_refresh(self):
+            self.data = await self._async_update_data()
+
         async def _async_update_data(self):
             raise NotImplementedError
 
@@ -264,11 +308,56 @@ def _create_homeassistant_stub() -> None:
 
     helpers.update_coordinator = update_coordinator
 
+    storage = types.ModuleType("homeassistant.helpers.storage")
+
+    class Store:
+        saved: dict = {}
+
+        def __init__(self, hass, version, key):
+            self.hass = hass
+            self.version = version
+            self.key = key
+
+        async def async_load(self):
+            return Store.saved.get(self.key)
+
+        async def async_save(self, data):
+            Store.saved[self.key] = data
+
+        def async_delay_save(self, data_func, delay=0):
+            Store.saved[self.key] = data_func()
+
+    storage.Store = Store
+    helpers.storage = storage
+
+    event = types.ModuleType("homeassistant.helpers.event")
+    event.tracked = []
+
+    def async_track_point_in_time(hass, action, point_in_time):  # noqa: ANN001
+        tracked = (action, point_in_time)
+        event.tracked.append(tracked)
+
+        def unsub():
+            if tracked in event.tracked:
+                event.tracked.remove(tracked)
+
+        return unsub
+
+    event.async_track_point_in_time = async_track_point_in_time
+    helpers.event = event
+
+    util = types.ModuleType("homeassistant.util")
+    dt_mod = types.ModuleType("homeassistant.util.dt")
+    dt_mod.now = lambda: datetime.now().astimezone()
+    util.dt = dt_mod
+
     ha.const = const
     ha.components = components
     ha.core = core
     ha.helpers = helpers
     ha.config_entries = config_entries
+    ha.exceptions = exceptions
+    ha.util = util
 
     sys.modules["homeassistant"] = ha
     sys.modules["homeassistant.components"] = components
@@ -285,7 +374,12 @@ def _create_homeassistant_stub() -> None:
     sys.modules["homeassistant.helpers.typing"] = typing_mod
     sys.modules["homeassistant.helpers.update_coordinator"] = update_coordinator
     sys.modules["homeassistant.helpers.entity_platform"] = entity_platform
+    sys.modules["homeassistant.helpers.storage"] = storage
+    sys.modules["homeassistant.helpers.event"] = event
+    sys.modules["homeassistant.util"] = util
+    sys.modules["homeassistant.util.dt"] = dt_mod
     sys.modules["homeassistant.config_entries"] = config_entries
+    sys.modules["homeassistant.exceptions"] = exceptions
 
 
 def _create_pymodbus_stub() -> None:
@@ -299,6 +393,12 @@ def _create_pymodbus_stub() -> None:
     class ModbusException(Exception):
         pass
 
+    class ConnectionException(ModbusException):
+        pass
+
+    class ModbusIOException(ModbusException):
+        pass
+
     class ModbusTcpClient:
         def __init__(self, host: str, port: int = 502):
             self.host = host
@@ -321,8 +421,33 @@ def _create_pymodbus_stub() -> None:
         def write_register(self, address, value):
             raise NotImplementedError
 
+    class AsyncModbusTcpClient:
+        def __init__(self, host: str, port: int = 502):
+            self.host = host
+            self.port = port
+            self.connected = False
+
+        async def connect(self):
+            self.connected = True
+            return True
+
+        def close(self):
+            self.connected = False
+
+        async def read_holding_registers(self, address, count=1):
+            raise NotImplementedError
+
+        async def read_input_registers(self, address, count=1):
+            raise NotImplementedError
+
+        async def write_register(self, address, value):
+            raise NotImplementedError
+
     client_mod.ModbusTcpClient = ModbusTcpClient
+    client_mod.AsyncModbusTcpClient = AsyncModbusTcpClient
     exceptions_mod.ModbusException = ModbusException
+    exceptions_mod.ConnectionException = ConnectionException
+    exceptions_mod.ModbusIOException = ModbusIOException
 
     pymodbus.client = client_mod
     pymodbus.exceptions = exceptions_mod
@@ -336,12 +461,3 @@ def pytest_sessionstart(session):
     _ensure_voluptuous_stub()
     _create_homeassistant_stub()
     _create_pymodbus_stub()
-
-    # Make debounced writes synchronous for unit tests.
-    try:
-        from custom_components.keba_heat_pump_modbus import const as integration_const
-
-        integration_const.WRITE_DEBOUNCE_SECONDS = 0
-    except Exception:  # noqa: BLE001
-        # If the integration cannot be imported yet for some reason, tests will surface it.
-        pass
@@ -0,0 +1,158 @@
+import math
+import random
+
+import pytest
+from pymodbus.exceptions import ModbusException
+
+from custom_components.keba_heat_pump_modbus.const import MAX_CACHED_READ_PLANS
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+
+
+def _reg(**kwargs):
+    params = dict(unique_id="reg", name="Reg", register_type="holding", address=0)
+    params.update(kwargs)
+    return ModbusRegister(**params)
+
+
+def test_codec_is_compiled_once_per_register():
+    reg = _reg(data_type="int16", scale=0.1, precision=1)
+
+    assert reg.codec is reg.codec
+    assert reg.codec.decode([0xFF9C]) == -10.0
+    # Served from the word memo on the second call.
+    assert reg.codec.decode([0xFF9C]) == -10.0
+    assert reg.codec.decode([]) is None
+
+
+def test_codec_value_maps_use_canonical_int_keys():
+    reg = _reg(value_map={"0": "Off", "01": "Padded", "1": "On", "2": None, "x": "X"})
+    codec = reg.codec
+
+    assert codec.value_to_option == {0: "Off", 1: "On"}
+    assert codec.option_to_raw == {"Off": 0, "On": 1}
+    assert codec.decode([1]) == "On"
+    assert codec.decode([2]) == 2.0
+
+
+def test_codec_reverse_map_keeps_first_raw_value_per_option():
+    reg = _reg(value_map={"3": "Auto", "4": "Auto"})
+
+    assert reg.codec.option_to_raw == {"Auto": 3}
+
+
+def test_codec_decodes_two_word_types_without_memo():
+    reg = _reg(length=2, data_type="int32")
+
+    assert reg.codec.decode([0xFFFF, 0xFFFE]) == -2.0
+    assert reg.codec.decode([0xFFFF, 0xFFFD]) == -3.0
+
+
+def test_codec_encode_validates_once_compiled_limits():
+    signed = _reg(data_type="int16", scale=0.5)
+    unsigned = _reg(data_type="uint16")
+
+    assert signed.codec.encode(-1) == 0xFFFE
+    assert unsigned.codec.encode(True) == 1
+    with pytest.raises(ModbusException):
+        signed.codec.encode(20000)
+    with pytest.raises(ModbusException):
+        unsigned.codec.encode(-1)
+    with pytest.raises(ModbusException):
+        unsigned.codec.encode("1")  # type: ignore[arg-type]
+    with pytest.raises(ModbusException):
+        _reg(register_type="input").codec.encode(1)
+
+
+def test_codec_encodes_32_bit_types_as_two_words_that_decode_back():
+    signed = _reg(length=2, data_type="int32", scale=0.1)
+    unsigned = _reg(length=2, data_type="uint32")
+    real = _reg(length=2, data_type="float32")
+
+    assert signed.codec.encode_words(-0.2) == [0xFFFF, 0xFFFE]
+    assert unsigned.codec.encode_words(0x12345678) == [0x1234, 0x5678]
+    for reg, value in ((signed, -123456.7), (unsigned, 4000000000), (real, 21.5)):
+        assert reg.codec.decode(reg.codec.encode_words(value)) == pytest.approx(value)
+
+    with pytest.raises(ModbusException, match="signed 32-bit"):
+        signed.codec.encode_words(1e9)
+    with pytest.raises(ModbusException, match="32-bit"):
+        unsigned.codec.encode_words(-1)
+    with pytest.raises(ModbusException, match="float32"):
+        real.codec.encode_words(float("inf"))
+    with pytest.raises(ModbusException, match="spans 2 words"):
+        unsigned.codec.encode(1)
+    with pytest.raises(ModbusException, match="spanning 3 words"):
+        _reg(length=3, data_type="int32").codec.encode_words(1)
+    # A 32-bit type read from one word is written back as a 16-bit value.
+    assert _reg(data_type="int32").codec.encode_words(-1) == [0xFFFF]
+
+
+def _same(a, b):
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b and type(a) is type(b)
+
+
+def _random_register(rng, name, address):
+    data_type = rng.choice(
+        ["int16", "uint16", "int32", "uint32", "float32", "boolean", "mystery"]
+    )
+    if data_type in ("int32", "uint32", "float32"):
+        length = rng.choice([1, 2, 2, 3])
+    else:
+        length = rng.choice([1, 1, 2])
+    value_map = None
+    if rng.random() < 0.3:
+        value_map = {str(rng.randrange(-3, 8)): f"opt{i}" for i in range(4)}
+    return ModbusRegister(
+        unique_id=name,
+        name=name,
+        register_type="input",
+        address=address,
+        length=length,
+        data_type=data_type,
+        scale=rng.choice([1.0, 0.1, 0.5, 10, 1e-3]),
+        offset=rng.choice([0.0, -40.0, 2.5]),
+        precision=rng.choice([None, 0, 1, 2]),
+        value_map=value_map,
+    )
+
+
+def test_decode_many_matches_per_register_decoding():
+    rng = random.Random(20240601)
+    client = KebaModbusClient("localhost", 502, 1)
+
+    for run in range(300):
+        base = rng.randrange(0, 1000)
+        registers = []
+        address = base
+        for index in range(rng.randrange(1, 12)):
+            # Occasionally overlap the previous register or leave a gap.
+            address += rng.choice([-1, 0, 0, 1, 3]) if registers else 0
+            address = max(base, address)
+            reg = _random_register(rng, f"r{run}_{index}", address)
+            registers.append(reg)
+            address += reg.length
+        count = max(reg.address + reg.length for reg in registers) - base
+        count += rng.choice([0, 0, 2])
+        words = [
+            rng.choice([0, 1, 2, 0x7FFF, 0x8000, 0xFFFF, rng.randrange(0x10000)])
+            for _ in range(count)
+        ]
+
+        bulk = client.decode_many(words, registers, base)
+
+        assert set(bulk) == {reg.unique_id for reg in registers}
+        for reg in registers:
+            start = reg.address - base
+            try:
+                expected = KebaModbusClient._decode_registers(
+                    words[start : start + reg.length], reg
+                )
+            except Exception:  # noqa: BLE001
+                expected = None
+            assert _same(bulk[reg.unique_id], expected), (reg, words)
+
+    # Every run has its own layout; the cache must not keep all of them.
+    assert len(client._block_decoders) <= MAX_CACHED_READ_PLANS
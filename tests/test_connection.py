@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+from pymodbus.exceptions import ModbusException, ModbusIOException
+
+from custom_components.keba_heat_pump_modbus.connection import (
+    STATE_BACKOFF,
+    STATE_CONNECTED,
+    STATE_DISCONNECTED,
+    ConnectionManager,
+)
+from custom_components.keba_heat_pump_modbus.const import CONNECTION_MODE_PER_CYCLE
+
+
+class FakeLink:
+    def __init__(self):
+        self.connected = False
+        self.connects = 0
+        self.disconnects = 0
+        self.probes = 0
+        self.fail_connects = 0
+        self.fail_probe = False
+
+    async def connect(self):
+        self.connects += 1
+        if self.fail_connects:
+            self.fail_connects -= 1
+            raise ModbusIOException("refused")
+        self.connected = True
+
+    async def disconnect(self):
+        self.disconnects += 1
+        self.connected = False
+
+    async def probe(self):
+        self.probes += 1
+        if self.fail_probe:
+            raise ModbusIOException("no response")
+
+    def manager(self, **kwargs):
+        kwargs.setdefault("backoff_min", 0.001)
+        kwargs.setdefault("backoff_max", 0.001)
+        return ConnectionManager(
+            self.connect, self.disconnect, self.probe, lambda: self.connected, **kwargs
+        )
+
+
+def test_persistent_session_reuses_connection():
+    link = FakeLink()
+    manager = link.manager()
+
+    async def scenario():
+        for _ in range(3):
+            async with manager.session():
+                pass
+
+    asyncio.run(scenario())
+
+    assert link.connects == 1
+    assert link.disconnects == 0
+    assert manager.state == STATE_CONNECTED
+
+
+def test_per_cycle_session_releases_connection():
+    link = FakeLink()
+    manager = link.manager(mode=CONNECTION_MODE_PER_CYCLE)
+
+    async def scenario():
+        for _ in range(2):
+            async with manager.session():
+                assert link.connected
+
+    asyncio.run(scenario())
+
+    assert link.connects == 2
+    assert link.disconnects == 2
+    assert manager.state == STATE_DISCONNECTED
+
+
+def test_link_error_fails_fast_and_reconnects_in_background():
+    link = FakeLink()
+    manager = link.manager()
+    states = []
+    manager.async_add_listener(lambda: states.append(manager.state))
+
+    async def scenario():
+        with pytest.raises(ModbusIOException):
+            async with manager.session():
+                raise ModbusIOException("timeout")
+
+        assert manager.state == STATE_BACKOFF
+        link.fail_connects = 1
+        connects = link.connects
+        with pytest.raises(ModbusException):
+            async with manager.session():
+                pass
+        # Failing fast must not touch the socket.
+        assert link.connects == connects
+
+        while manager.state == STATE_BACKOFF:
+            await asyncio.sleep(0.001)
+
+    asyncio.run(scenario())
+
+    assert manager.state == STATE_CONNECTED
+    assert manager.reconnect_count == 1
+    assert manager.last_error is None
+    assert states == [STATE_CONNECTED, STATE_BACKOFF, STATE_CONNECTED]
+
+
+def test_idle_connection_is_probed_before_use():
+    link = FakeLink()
+    manager = link.manager(idle_probe_seconds=0)
+
+    async def scenario():
+        async with manager.session():
+            pass
+        await asyncio.sleep(0.001)
+        async with manager.session():
+            pass
+
+        link.fail_probe = True
+        await asyncio.sleep(0.001)
+        with pytest.raises(ModbusIOException):
+            async with manager.session():
+                pass
+        state = manager.state
+        await manager.async_stop()
+        return state
+
+    state = asyncio.run(scenario())
+
+    assert link.probes == 2
+    assert state == STATE_BACKOFF
+
+
+def test_non_link_errors_keep_connection():
+    link = FakeLink()
+    manager = link.manager()
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            async with manager.session():
+                raise ValueError("bad value")
+
+    asyncio.run(scenario())
+
+    assert manager.state == STATE_CONNECTED
+    assert link.disconnects == 0
@@ -1,9 +1,12 @@
 import asyncio
+from types import SimpleNamespace
 
 import pytest
 
 from custom_components.keba_heat_pump_modbus.coordinator import KebaCoordinator
 from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.number import KebaControl
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 
@@ -17,6 +20,9 @@ class DummyClient:
             raise self.exc
         return self.data
 
+    async def async_read_all(self, registers, budget=None):
+        return self.read_all(registers)
+
 
 class DummyHass:
     def __init__(self, exc=None):
@@ -53,3 +59,298 @@ def test_coordinator_raises_update_failed():
 
     with pytest.raises(UpdateFailed):
         asyncio.run(coordinator._async_update_data())
+
+
+class RecordingReadClient:
+    def __init__(self):
+        self.reads = []
+
+    async def async_read_all(self, registers, budget=None):
+        self.reads.append([reg.unique_id for reg in registers])
+        return {reg.unique_id: len(self.reads) for reg in registers}
+
+
+def _tiered_registers():
+    return [
+        ModbusRegister(
+            unique_id="flow", name="Flow", register_type="holding", address=0,
+            poll_tier="realtime",
+        ),
+        ModbusRegister(
+            unique_id="hours", name="Hours", register_type="holding", address=1,
+            poll_tier="slow",
+        ),
+    ]
+
+
+def test_coordinator_ticks_at_fastest_tier():
+    coordinator = KebaCoordinator(
+        DummyHass(), RecordingReadClient(), _tiered_registers(), scan_interval=10,
+        tier_intervals={"slow": 300},
+    )
+
+    assert coordinator.update_interval.total_seconds() == 10
+
+
+def test_coordinator_reads_only_due_tiers_and_merges(monkeypatch):
+    client = RecordingReadClient()
+    coordinator = KebaCoordinator(
+        DummyHass(), client, _tiered_registers(), scan_interval=10,
+        tier_intervals={"slow": 300},
+    )
+    clock = iter([0.0, 10.0, 301.0])
+    monkeypatch.setattr(
+        "custom_components.keba_heat_pump_modbus.coordinator.time",
+        SimpleNamespace(monotonic=lambda: next(clock)),
+    )
+
+    first = asyncio.run(coordinator._async_update_data())
+    second = asyncio.run(coordinator._async_update_data())
+    third = asyncio.run(coordinator._async_update_data())
+
+    assert client.reads == [["flow", "hours"], ["flow"], ["flow", "hours"]]
+    assert first == {"flow": 1, "hours": 1}
+    assert second == {"flow": 2, "hours": 1}
+    assert third == {"flow": 3, "hours": 3}
+
+
+def test_coordinator_request_refresh_reads_all_tiers(monkeypatch):
+    client = RecordingReadClient()
+    coordinator = KebaCoordinator(
+        DummyHass(), client, _tiered_registers(), scan_interval=10,
+        tier_intervals={"slow": 300},
+    )
+    clock = iter([0.0, 10.0])
+    monkeypatch.setattr(
+        "custom_components.keba_heat_pump_modbus.coordinator.time",
+        SimpleNamespace(monotonic=lambda: next(clock)),
+    )
+
+    asyncio.run(coordinator._async_update_data())
+    asyncio.run(coordinator.async_request_refresh())
+
+    assert client.reads[-1] == ["flow", "hours"]
+
+
+class BudgetedReadClient:
+    """Reads at most ``per_cycle`` registers, like a link that runs out of time."""
+
+    def __init__(self, per_cycle):
+        self.per_cycle = per_cycle
+        self.reads = []
+
+    async def async_read_all(self, registers, budget=None):
+        assert budget is not None
+        read = registers[: self.per_cycle]
+        self.reads.append([reg.unique_id for reg in read])
+        return {reg.unique_id: len(self.reads) for reg in read}
+
+
+def test_coordinator_carries_unread_registers_to_next_cycle(monkeypatch):
+    registers = [
+        ModbusRegister(unique_id=name, name=name, register_type="input", address=i)
+        for i, name in enumerate(["a", "b", "c", "d", "e"])
+    ]
+    client = BudgetedReadClient(per_cycle=3)
+    coordinator = KebaCoordinator(
+        DummyHass(), client, registers, scan_interval=10,
+        tier_intervals={"normal": 10},
+    )
+    clock = iter([0.0, 10.0, 20.0, 25.0])
+    monkeypatch.setattr(
+        "custom_components.keba_heat_pump_modbus.coordinator.time",
+        SimpleNamespace(monotonic=lambda: next(clock)),
+    )
+
+    asyncio.run(coordinator._async_update_data())
+    asyncio.run(coordinator._async_update_data())
+    asyncio.run(coordinator._async_update_data())
+
+    # Leftovers go first, so every register is refreshed within two cycles.
+    assert client.reads == [["a", "b", "c"], ["d", "e", "a"], ["b", "c", "a"]]
+    assert coordinator.last_read("e") == 10.0
+    assert coordinator.last_read("b") == 20.0
+    assert coordinator.value_age("e") == 15.0
+    assert coordinator.value_age("missing") is None
+
+
+class SequenceReadClient:
+    def __init__(self, results):
+        self.results = iter(results)
+
+    async def async_read_all(self, registers, budget=None):
+        return next(self.results)
+
+
+def test_coordinator_notifies_only_changed_contexts():
+    registers = [
+        ModbusRegister(unique_id=name, name=name, register_type="input", address=i)
+        for i, name in enumerate(["a", "b"])
+    ]
+    client = SequenceReadClient(
+        [{"a": 1, "b": 1}, {"a": 2, "b": 1}, {"a": 2, "b": 1}, {"a": 2, "b": 1}]
+    )
+    coordinator = KebaCoordinator(DummyHass(), client, registers, scan_interval=10)
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append("a"), frozenset({"a"}))
+    coordinator.async_add_listener(lambda: calls.append("b"), frozenset({"b"}))
+    coordinator.async_add_listener(lambda: calls.append("ab"), frozenset({"a", "b"}))
+    coordinator.async_add_listener(lambda: calls.append("all"))
+
+    def poll():
+        calls.clear()
+        asyncio.run(coordinator._async_update_data())
+        coordinator.async_update_listeners()
+        return sorted(calls)
+
+    assert poll() == ["a", "ab", "all", "b"]
+    assert poll() == ["a", "ab", "all"]
+    assert poll() == ["all"]
+
+    # Availability changes reach every entity.
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    coordinator.last_update_success = True
+    assert poll() == ["a", "ab", "all", "b"]
+
+
+class TargetedReadClient:
+    def __init__(self, exc=None):
+        self.reads = []
+        self.exc = exc
+
+    async def async_read_all(self, registers, budget=None, priority=None):
+        self.reads.append(([reg.unique_id for reg in registers], priority))
+        if self.exc:
+            raise self.exc
+        return {reg.unique_id: 5 for reg in registers}
+
+
+def test_refresh_registers_reads_only_written_and_dependent_registers():
+    registers = [
+        ModbusRegister(
+            unique_id="setpoint",
+            name="Setpoint",
+            register_type="holding",
+            address=4,
+            refresh_with=["effective", "unknown"],
+        ),
+        ModbusRegister(unique_id="effective", name="E", register_type="holding", address=2),
+        ModbusRegister(unique_id="other", name="O", register_type="holding", address=9),
+    ]
+    client = TargetedReadClient()
+    coordinator = KebaCoordinator(DummyHass(), client, registers, scan_interval=10)
+    coordinator.data = {"setpoint": 5, "effective": 1, "other": 3}
+    coordinator._values.update(coordinator.data)
+    calls = []
+    for name in ("setpoint", "effective", "other"):
+        coordinator.async_add_listener(
+            lambda name=name: calls.append(name), frozenset({name})
+        )
+    coordinator.last_update_success = True
+    coordinator._notified_success = True
+
+    asyncio.run(coordinator.async_refresh_registers(["setpoint"]))
+
+    assert client.reads == [(["setpoint", "effective"], 1)]
+    assert coordinator.data == {"setpoint": 5, "effective": 5, "other": 3}
+    assert calls == ["effective"]
+    assert coordinator.last_read("other") is None
+
+
+def test_refresh_registers_falls_back_to_full_refresh_on_error(monkeypatch):
+    registers = [
+        ModbusRegister(unique_id="a", name="A", register_type="holding", address=1)
+    ]
+    client = TargetedReadClient(exc=RuntimeError("boom"))
+    coordinator = KebaCoordinator(DummyHass(), client, registers, scan_interval=10)
+    full = []
+
+    async def _full_refresh():
+        full.append(True)
+
+    monkeypatch.setattr(coordinator, "async_request_refresh", _full_refresh)
+
+    asyncio.run(coordinator.async_refresh_registers(["a", "missing"]))
+
+    assert full == [True]
+
+
+def test_pending_value_is_confirmed_or_rolled_back_by_read_back():
+    registers = [
+        ModbusRegister(unique_id="a", name="A", register_type="holding", address=1),
+        ModbusRegister(unique_id="b", name="B", register_type="holding", address=2),
+    ]
+    client = TargetedReadClient()  # reads back 5 for everything
+    coordinator = KebaCoordinator(DummyHass(), client, registers, scan_interval=10)
+    coordinator.data = {"a": 1, "b": 1}
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append("a"), frozenset({"a"}))
+    coordinator.async_add_listener(lambda: calls.append("b"), frozenset({"b"}))
+    coordinator.last_update_success = True
+    coordinator._notified_success = True
+
+    coordinator.set_pending("a", 5)
+    coordinator.set_pending("b", 9)
+    assert calls == ["a", "b"]
+    assert coordinator.value("a") == 5
+    assert coordinator.data["a"] == 1
+    assert coordinator.is_pending("b")
+
+    asyncio.run(coordinator.async_refresh_registers(["a", "b"]))
+
+    assert not coordinator.is_pending("a")
+    assert coordinator.write_error("a") is None
+    # The controller clamped "b" to 5: the requested 9 is rolled back.
+    assert not coordinator.is_pending("b")
+    assert coordinator.value("b") == 5
+    assert "instead of 9" in coordinator.write_error("b")
+
+
+def test_failed_read_back_drops_pending_values(monkeypatch):
+    registers = [
+        ModbusRegister(unique_id="a", name="A", register_type="holding", address=1)
+    ]
+    client = TargetedReadClient(exc=RuntimeError("boom"))
+    coordinator = KebaCoordinator(DummyHass(), client, registers, scan_interval=10)
+    coordinator.data = {"a": 1}
+
+    async def _full_refresh():
+        pass
+
+    monkeypatch.setattr(coordinator, "async_request_refresh", _full_refresh)
+    coordinator.set_pending("a", 3)
+
+    asyncio.run(coordinator.async_refresh_registers(["a"]))
+
+    assert coordinator.value("a") == 1
+
+
+def test_failed_read_back_shows_the_last_read_value_again(monkeypatch):
+    reg = ModbusRegister(
+        unique_id="a", name="A", register_type="holding", address=1, entity_platform="controls"
+    )
+    client = TargetedReadClient(exc=RuntimeError("boom"))
+    coordinator = KebaCoordinator(DummyHass(), client, [reg], scan_interval=10)
+    coordinator.data = {"a": 1}
+    coordinator.last_update_success = True
+    coordinator._notified_success = True
+    entity = KebaControl(coordinator, ConfigEntry(entry_id="entry1"), reg, client)
+    states = []
+    coordinator.async_add_listener(
+        lambda: states.append((entity.native_value, entity.extra_state_attributes)),
+        frozenset({"a"}),
+    )
+
+    async def _full_refresh():
+        pass
+
+    monkeypatch.setattr(coordinator, "async_request_refresh", _full_refresh)
+    coordinator.set_pending("a", 3)
+
+    asyncio.run(coordinator.async_refresh_registers(["a"]))
+
+    assert states == [
+        (3, {"pending_write": True}),
+        (1, {"pending_write": False}),
+    ]
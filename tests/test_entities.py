@@ -20,6 +20,7 @@ from custom_components.keba_heat_pump_modbus.const import (
     DATA_REGISTERS,
     DOMAIN,
 )
+from custom_components.keba_heat_pump_modbus.io_worker import ModbusIOWorker
 from custom_components.keba_heat_pump_modbus.models import ModbusRegister
 from custom_components.keba_heat_pump_modbus.number import (
     KebaControl,
@@ -33,6 +34,8 @@ from custom_components.keba_heat_pump_modbus.sensor import (
     KebaSensor,
     KebaCopSensor,
     KebaFlowRateSensor,
+    KebaQueueWaitSensor,
+    KebaServiceTimeSensor,
     async_setup_entry as setup_sensors,
 )
 from custom_components.keba_heat_pump_modbus.water_heater import (
@@ -52,11 +55,43 @@ class DummyCoordinator:
     def __init__(self, data=None, hass=None):
         self.data = data or {}
         self.refresh_called = False
+        self.refreshed = []
+        self.pending = {}
+        self.errors = {}
         self.hass = hass
+        # No debounce scheduler: entity writes go out immediately.
+        self.write_scheduler = None
 
     async def async_request_refresh(self):
         self.refresh_called = True
 
+    async def async_refresh_registers(self, unique_ids):
+        self.refresh_called = True
+        self.refreshed.append(list(unique_ids))
+        for unique_id in unique_ids:
+            self.pending.pop(unique_id, None)
+
+    def value(self, unique_id):
+        if unique_id in self.pending:
+            return self.pending[unique_id]
+        return self.data.get(unique_id) if self.data is not None else None
+
+    def is_pending(self, unique_id):
+        return unique_id in self.pending
+
+    def write_error(self, unique_id):
+        return self.errors.get(unique_id)
+
+    def set_pending(self, unique_id, value):
+        self.pending[unique_id] = value
+
+    def clear_pending(self, unique_id):
+        self.pending.pop(unique_id, None)
+
+    def rollback(self, unique_id, reason):
+        self.pending.pop(unique_id, None)
+        self.errors[unique_id] = reason
+
 
 class DummyClient:
     def __init__(self):
@@ -65,6 +100,9 @@ class DummyClient:
     def write_register(self, reg, value):
         self.writes.append((reg, value))
 
+    async def async_write_register(self, reg, value):
+        self.writes.append((reg, value))
+
 
 class DummyHass:
     def __init__(self):
@@ -206,6 +244,7 @@ def test_number_entity_write_and_setup(monkeypatch):
     asyncio.run(entity.async_set_native_value(55))
     assert client.writes == [(reg, 55)]
     assert coordinator.refresh_called is True
+    assert coordinator.refreshed == [["num"]]
 
 
 def test_select_entity_options_and_validation():
@@ -368,6 +407,25 @@ def test_flow_rate_sensor_calculation():
     assert entity.native_value is None
 
 
+def test_io_latency_sensors_report_their_own_stat():
+    entry = create_entry(entry_id="io1")
+    coordinator = DummyCoordinator()
+    worker = ModbusIOWorker()
+    queue_wait = KebaQueueWaitSensor(coordinator, entry, worker)
+    service_time = KebaServiceTimeSensor(coordinator, entry, worker)
+
+    assert queue_wait.native_value is None
+    worker.stats["write"].record(0.004, 0.012)
+    worker.total.record(0.004, 0.012)
+
+    assert queue_wait.unique_id == "io1_modbus_queue_wait"
+    assert queue_wait.native_value == 4.0
+    assert queue_wait.extra_state_attributes == {"write": 4.0, "max_write": 4.0}
+    assert service_time.unique_id == "io1_modbus_service_time"
+    assert service_time.native_value == 12.0
+    assert service_time.extra_state_attributes == {"write": 12.0}
+
+
 def test_flow_rate_sensor_setup_requires_registers():
     hass = DummyHass()
     entry = create_entry()
@@ -76,7 +76,7 @@ def test_async_unload_entry_closes_client():
         def __init__(self):
             self.closed = False
 
-        def close(self):
+        async def async_close(self):
             self.closed = True
 
     class DummyConfigEntries:
@@ -121,9 +121,12 @@ def test_async_setup_entry_populates_data_and_schedules_warning(monkeypatch):
         CONF_UNIT_ID,
         DATA_CLIENT,
         DATA_COORDINATOR,
+        DATA_PRESETS,
         DATA_REGISTERS,
+        DATA_SCHEDULE,
         DOMAIN,
         PLATFORMS,
+        WRITE_DEBOUNCE_SECONDS,
     )
     from homeassistant.config_entries import ConfigEntry
 
@@ -162,18 +165,23 @@ def test_async_setup_entry_populates_data_and_schedules_warning(monkeypatch):
             return func(*args, **kwargs)
 
     class FakeClient:
-        def __init__(self, host, port, unit_id, warning_callback=None):
+        def __init__(self, host, port, unit_id, warning_callback=None, **kwargs):
             self.host = host
             self.port = port
             self.unit_id = unit_id
             self.warning_callback = warning_callback
+            self.planned = None
+
+        def plan_reads(self, registers):
+            self.planned = registers
 
     class FakeCoordinator:
-        def __init__(self, hass, client, registers, scan_interval):
+        def __init__(self, hass, client, registers, scan_interval, tier_intervals=None):
             self.hass = hass
             self.client = client
             self.registers = registers
             self.scan_interval = scan_interval
+            self.tier_intervals = tier_intervals
             self.first_refresh = False
 
         async def async_config_entry_first_refresh(self):
@@ -198,9 +206,11 @@ def test_async_setup_entry_populates_data_and_schedules_warning(monkeypatch):
     assert ok is True
     assert DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]
     stored = hass.data[DOMAIN][entry.entry_id]
-    assert set(stored.keys()) == {DATA_CLIENT,
-                                  DATA_COORDINATOR, DATA_REGISTERS}
+    assert set(stored.keys()) == {DATA_CLIENT, DATA_COORDINATOR, DATA_REGISTERS,
+                                  DATA_PRESETS, DATA_SCHEDULE}
     assert stored[DATA_COORDINATOR].first_refresh is True
+    assert stored[DATA_COORDINATOR].write_scheduler.delay == WRITE_DEBOUNCE_SECONDS
+    assert stored[DATA_CLIENT].planned == []
     assert hass.config_entries.forwarded == [(entry, PLATFORMS)]
 
     # Exercise the warning notification callback path.
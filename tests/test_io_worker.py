@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+from pymodbus.exceptions import ModbusException
+
+from custom_components.keba_heat_pump_modbus.io_worker import (
+    PRIORITY_POLL,
+    PRIORITY_READ,
+    PRIORITY_WRITE,
+    ModbusIOWorker,
+)
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+
+
+def test_worker_serves_highest_priority_first_one_at_a_time():
+    worker = ModbusIOWorker()
+    order = []
+    active = []
+
+    def request(name):
+        async def _run():
+            active.append(name)
+            assert len(active) == 1
+            order.append(name)
+            await asyncio.sleep(0)
+            active.remove(name)
+            return name
+
+        return _run
+
+    async def scenario():
+        first = asyncio.ensure_future(worker.submit(PRIORITY_POLL, request("poll1")))
+        await asyncio.sleep(0)
+        rest = [
+            worker.submit(PRIORITY_POLL, request("poll2")),
+            worker.submit(PRIORITY_READ, request("read")),
+            worker.submit(PRIORITY_WRITE, request("write")),
+        ]
+        return [await first] + await asyncio.gather(*rest)
+
+    results = asyncio.run(scenario())
+
+    assert results == ["poll1", "poll2", "read", "write"]
+    assert order == ["poll1", "write", "read", "poll2"]
+    assert worker.stats["write"].count == 1
+    assert worker.total.count == 4
+    assert worker.stats["poll"].max_queue_wait >= worker.stats["write"].queue_wait
+
+
+def test_worker_propagates_errors_and_fails_queued_requests_on_stop():
+    worker = ModbusIOWorker()
+
+    async def boom():
+        raise ModbusException("boom")
+
+    async def scenario():
+        with pytest.raises(ModbusException, match="boom"):
+            await worker.submit(PRIORITY_POLL, boom)
+
+        gate = asyncio.Event()
+        blocked = asyncio.ensure_future(worker.submit(PRIORITY_POLL, gate.wait))
+        queued = asyncio.ensure_future(worker.submit(PRIORITY_POLL, gate.wait))
+        await asyncio.sleep(0.01)
+        assert worker.queued == 1
+        await worker.async_stop()
+        gate.set()
+        await blocked
+        with pytest.raises(ModbusException, match="stopped"):
+            await queued
+
+    asyncio.run(scenario())
+
+
+class SlowController:
+    def __init__(self):
+        self.connected = True
+        self.events = []
+
+    async def read_holding_registers(self, address, count=1):
+        self.events.append(("read", address))
+        await asyncio.sleep(0.005)
+
+        class Response:
+            registers = list(range(address, address + count))
+
+            @staticmethod
+            def isError():
+                return False
+
+        return Response()
+
+    async def write_register(self, address, value):
+        self.events.append(("write", address))
+
+        class Response:
+            @staticmethod
+            def isError():
+                return False
+
+        return Response()
+
+
+def _holding(unique_id, address):
+    return ModbusRegister(
+        unique_id=unique_id, name=unique_id, register_type="holding", address=address
+    )
+
+
+def test_write_overtakes_a_running_poll_between_requests():
+    registers = [_holding(f"r{address}", address) for address in (1, 100, 200, 300)]
+    client = KebaModbusClient(
+        "localhost", 502, 1, max_read_gap=0, write_coalesce_window=0
+    )
+    controller = SlowController()
+    client._async_client = controller
+
+    async def scenario():
+        poll = asyncio.ensure_future(client.async_read_all(registers))
+        await asyncio.sleep(0.001)
+        await client.async_write_register(_holding("w", 500), 7)
+        await poll
+
+    asyncio.run(scenario())
+
+    assert controller.events[:2] == [("read", 1), ("write", 500)]
+    assert len(controller.events) == 5
+    assert client.io.stats["write"].count == 1
+    assert client.io.stats["poll"].count == 4
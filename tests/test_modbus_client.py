@@ -538,3 +538,301 @@ def test_read_register_list_fallback_for_input_registers():
 
     assert result == [20, 21]
     assert legacy_client.read_calls == [("input", 20), ("input", 21)]
+
+
+class BlockClient:
+    """Controller that serves block reads and rejects configured addresses."""
+
+    def __init__(self, illegal=()):
+        self.illegal = set(illegal)
+        self.read_calls = []
+
+    def read_holding_registers(self, address, count=None):
+        count = count or 1
+        self.read_calls.append((address, count))
+        if any(addr in self.illegal for addr in range(address, address + count)):
+            resp = DummyResponse([], error=True)
+            resp.exception_code = 2
+            return resp
+        return DummyResponse(list(range(address, address + count)))
+
+
+def _holding(unique_id, address):
+    return ModbusRegister(
+        unique_id=unique_id,
+        name=unique_id,
+        register_type="holding",
+        address=address,
+        data_type="uint16",
+    )
+
+
+def test_read_all_reads_coalesced_blocks(monkeypatch):
+    registers = [_holding("a", 1), _holding("b", 2), _holding("c", 4), _holding("d", 51)]
+    client = KebaModbusClient("localhost", 502, 1, max_read_gap=2)
+    controller = BlockClient()
+    monkeypatch.setattr(client, "_ensure_client", lambda: controller)
+
+    result = client.read_all(registers)
+
+    assert result == {"a": 1.0, "b": 2.0, "c": 4.0, "d": 51.0}
+    assert controller.read_calls == [(1, 4), (51, 1)]
+
+
+def test_read_all_learns_illegal_gap_addresses(monkeypatch):
+    registers = [_holding("a", 1), _holding("b", 2), _holding("c", 4)]
+    client = KebaModbusClient("localhost", 502, 1, max_read_gap=2)
+    controller = BlockClient(illegal={3})
+    monkeypatch.setattr(client, "_ensure_client", lambda: controller)
+
+    first = client.read_all(registers)
+    controller.read_calls.clear()
+    second = client.read_all(registers)
+
+    assert first == second == {"a": 1.0, "b": 2.0, "c": 4.0}
+    assert ("holding", 3) in client._illegal_addresses
+    assert controller.read_calls == [(1, 2), (4, 1)]
+
+
+def test_read_all_isolates_illegal_registers(monkeypatch):
+    registers = [_holding("a", 1), _holding("bad", 2), _holding("c", 3)]
+    client = KebaModbusClient("localhost", 502, 1)
+    controller = BlockClient(illegal={2})
+    monkeypatch.setattr(client, "_ensure_client", lambda: controller)
+
+    client.read_all(registers)
+    controller.read_calls.clear()
+    result = client.read_all(registers)
+
+    assert result == {"a": 1.0, "bad": None, "c": 3.0}
+    assert controller.read_calls == [(1, 1), (2, 1), (3, 1)]
+
+
+class AsyncRecordingClient:
+    def __init__(self):
+        self.connected = True
+        self.read_calls = []
+        self.writes = []
+
+    async def read_holding_registers(self, address, count=1):
+        self.read_calls.append((address, count))
+        return DummyResponse(list(range(address, address + count)))
+
+    async def read_input_registers(self, address, count=1):
+        self.read_calls.append((address, count))
+        return DummyResponse(list(range(address, address + count)))
+
+    async def write_register(self, address, value):
+        self.writes.append((address, value))
+        return DummyResponse([value])
+
+
+def test_async_read_all_matches_sync_decoding():
+    import asyncio
+
+    registers = [_holding("a", 1), _holding("b", 2), _holding("c", 4)]
+    client = KebaModbusClient("localhost", 502, 1, max_read_gap=2)
+    controller = AsyncRecordingClient()
+    client._async_client = controller
+
+    result = asyncio.run(client.async_read_all(registers))
+
+    assert result == {"a": 1.0, "b": 2.0, "c": 4.0}
+    assert controller.read_calls == [(1, 4)]
+
+
+def test_async_write_register_encodes_and_tracks():
+    import asyncio
+
+    reg = ModbusRegister(
+        unique_id="target",
+        name="Writable",
+        register_type="holding",
+        address=7,
+        data_type="int16",
+        scale=0.1,
+    )
+    client = KebaModbusClient("localhost", 502, 1)
+    controller = AsyncRecordingClient()
+    client._async_client = controller
+
+    asyncio.run(client.async_write_register(reg, -2.5))
+
+    assert controller.writes == [(7, 0xFFE7)]
+    assert len(client._write_timestamps) == 1
+
+
+def test_async_connect_and_close():
+    import asyncio
+
+    client = KebaModbusClient("localhost", 502, 1)
+
+    asyncio.run(client.async_connect())
+    assert client._async_client is not None
+    assert client._async_client.connected is True
+
+    asyncio.run(client.async_close())
+    assert client._async_client is None
+
+
+def test_async_read_all_pipelines_blocks():
+    import asyncio
+
+    from custom_components.keba_heat_pump_modbus.pipeline import ModbusTcpPipeline
+
+    class FakePipeline(ModbusTcpPipeline):
+        def __init__(self):
+            super().__init__("localhost", 502, 1)
+            self.in_flight = 0
+            self.peak = 0
+            self.probed_with = None
+
+        @property
+        def connected(self):
+            return True
+
+        async def probe_window(self, address, register_type="holding"):
+            self.probed_with = (address, register_type)
+            self.probed = True
+            self.window = 4
+            return 4
+
+        async def read_holding_registers(self, address, count=1):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return DummyResponse(list(range(address, address + count)))
+
+    registers = [_holding("a", 1), _holding("b", 51), _holding("c", 101)]
+    client = KebaModbusClient("localhost", 502, 1, pipelining=True)
+    pipeline = FakePipeline()
+    client._async_client = pipeline
+
+    result = asyncio.run(client.async_read_all(registers))
+
+    assert result == {"a": 1.0, "b": 51.0, "c": 101.0}
+    assert pipeline.probed_with == (1, "holding")
+    assert pipeline.peak == 3
+
+
+def test_async_read_all_aborts_on_lost_connection():
+    import asyncio
+
+    from pymodbus.exceptions import ModbusIOException
+
+    from custom_components.keba_heat_pump_modbus.connection import STATE_BACKOFF
+
+    class DroppingClient(AsyncRecordingClient):
+        async def read_holding_registers(self, address, count=1):
+            self.read_calls.append((address, count))
+            raise ModbusIOException("timeout")
+
+        def close(self):
+            self.connected = False
+
+    registers = [_holding("a", 1), _holding("b", 2)]
+    client = KebaModbusClient("localhost", 502, 1)
+    controller = DroppingClient()
+    client._async_client = controller
+
+    async def scenario():
+        with pytest.raises(ModbusIOException):
+            await client.async_read_all(registers)
+        state = client.connection.state
+        await client.async_close()
+        return state
+
+    state = asyncio.run(scenario())
+
+    # One block read, no per-register retries on a dead link.
+    assert controller.read_calls == [(1, 2)]
+    assert state == STATE_BACKOFF
+    assert client._async_client is None
+
+
+def test_negotiates_unit_keyword_and_passes_unit_id():
+    class DeviceIdClient:
+        def __init__(self):
+            self.calls = []
+
+        def read_holding_registers(self, address, *, count=1, device_id=1):
+            self.calls.append((address, count, device_id))
+            return DummyResponse(list(range(address, address + count)))
+
+        def read_input_registers(self, address, *, count=1, device_id=1):
+            raise NotImplementedError
+
+        def write_register(self, address, value, *, device_id=1):
+            self.calls.append(("write", address, value, device_id))
+            return DummyResponse([value])
+
+    class SlaveClient(DeviceIdClient):
+        def read_holding_registers(self, address, count=1, slave=0):
+            self.calls.append((address, count, slave))
+            return DummyResponse(list(range(address, address + count)))
+
+    class KwargsClient(DeviceIdClient):
+        def read_holding_registers(self, address, count=1, **kwargs):
+            self.calls.append((address, count, kwargs.get("unit")))
+            return DummyResponse(list(range(address, address + count)))
+
+    reg = _holding("a", 3)
+    for transport_cls in (DeviceIdClient, SlaveClient, KwargsClient):
+        client = KebaModbusClient("localhost", 502, 7)
+        transport = transport_cls()
+
+        assert client._read_register_list(cast(Any, transport), reg) == [3]
+        assert transport.calls == [(3, 1, 7)]
+
+    client = KebaModbusClient("localhost", 502, 7)
+    transport = DeviceIdClient()
+    client._client = cast(Any, transport)
+    client.write_register(_holding("w", 9), 5)
+    assert transport.calls == [("write", 9, 5, 7)]
+
+
+def test_legacy_count_downgrade_happens_once():
+    class CountingLegacyClient(LegacyClient):
+        def __init__(self):
+            super().__init__()
+            self.rejected = 0
+
+        def read_holding_registers(self, address, count=None):
+            if count is not None:
+                self.rejected += 1
+                raise TypeError("count not supported")
+            self.read_calls.append(address)
+            return DummyResponse([address])
+
+    registers = [_holding("a", 1), _holding("b", 2)]
+    client = KebaModbusClient("localhost", 502, 1)
+    legacy_client = CountingLegacyClient()
+    client._client = cast(Any, legacy_client)
+
+    for _ in range(3):
+        assert client.read_all(registers) == {"a": 1.0, "b": 2.0}
+
+    assert legacy_client.rejected == 1
+    assert legacy_client.read_calls == [1, 2] * 3
+
+
+def test_async_read_all_stops_at_budget_in_request_order():
+    import asyncio
+
+    class SlowClient(AsyncRecordingClient):
+        async def read_holding_registers(self, address, count=1):
+            await asyncio.sleep(0.02)
+            return await super().read_holding_registers(address, count)
+
+    registers = [_holding("low", 1), _holding("mid", 200), _holding("high", 400)]
+    client = KebaModbusClient("localhost", 502, 1)
+    controller = SlowClient()
+    client._async_client = controller
+
+    # "high" was carried over by the caller, so its block goes first.
+    ordered = [registers[2], registers[0], registers[1]]
+    result = asyncio.run(client.async_read_all(ordered, budget=0.03))
+
+    assert controller.read_calls == [(400, 1), (1, 1)]
+    assert set(result) == {"high", "low"}
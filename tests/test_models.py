@@ -0,0 +1,76 @@
+import gc
+import json
+import pickle
+import sys
+import tracemalloc
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+
+REGISTER_DIR = (
+    Path(__file__).resolve().parents[1]
+    / "custom_components"
+    / "keba_heat_pump_modbus"
+    / "modbus_registers"
+)
+
+
+def _circuit_mode(circuit):
+    return ModbusRegister(
+        unique_id=f"operating_mode_circuit_{circuit}",
+        name=f"Operating Mode Circuit {circuit}",
+        register_type="holding",
+        address=100 * circuit,
+        device=f"circuit_{circuit}",
+        entity_platform="select",
+        refresh_with=[f"effective_mode_circuit_{circuit}"],
+        value_map={"0": "Standby", "1": "Auto", "2": "Day"},
+    )
+
+
+def test_registers_are_immutable_and_share_value_maps_and_strings():
+    first, second = _circuit_mode(1), _circuit_mode(2)
+
+    assert first.value_map is second.value_map
+    assert first.device is sys.intern("_".join(["circuit", "1"]))
+    assert first.refresh_with == ("effective_mode_circuit_1",)
+    with pytest.raises(FrozenInstanceError):
+        first.address = 7
+    with pytest.raises(TypeError):
+        first.value_map["3"] = "Night"
+    assert not hasattr(first, "__dict__")
+    assert first.codec is first.codec
+
+
+def test_pickled_registers_keep_sharing_after_loading():
+    registers = pickle.loads(pickle.dumps([_circuit_mode(1), _circuit_mode(2)]))
+
+    assert registers == [_circuit_mode(1), _circuit_mode(2)]
+    assert registers[0].value_map is _circuit_mode(3).value_map
+    assert registers[1].codec.option_to_raw == {"Standby": 0, "Auto": 1, "Day": 2}
+
+
+def test_bytes_per_register_for_a_large_catalog():
+    # Twenty copies of the bundled catalog stand in for the full datapoint
+    # list or several config entries.
+    texts = [path.read_text(encoding="utf-8") for path in sorted(REGISTER_DIR.glob("*.json"))]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        registers = [
+            ModbusRegister(**item)
+            for _ in range(20)
+            for text in texts
+            for item in json.loads(text)["registers"]
+        ]
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    per_register = allocated / len(registers)
+    print(f"\n{len(registers)} registers: {per_register:.0f} bytes per register")
+    assert per_register < 700
@@ -0,0 +1,200 @@
+import asyncio
+import struct
+
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.pipeline import ModbusTcpPipeline
+
+
+class FakeController:
+    """Modbus TCP responder that answers reads with address-derived words.
+
+    Words written with FC6, FC16 or FC23 are kept in ``memory`` and read
+    back instead.
+
+    ``max_outstanding`` requests are answered (optionally in reverse order);
+    anything queued beyond that is dropped, like a gateway with a tiny buffer.
+    """
+
+    def __init__(self, max_outstanding=8, reverse=False, illegal=()):
+        self.max_outstanding = max_outstanding
+        self.reverse = reverse
+        self.illegal = set(illegal)
+        self.requests = 0
+        self.memory = {}
+        self.function_codes = []
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                batch = [await self._read_frame(reader)]
+                # Collect everything the client sent back-to-back.
+                while True:
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._read_frame(reader), 0.02)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                batch = batch[: self.max_outstanding]
+                if self.reverse:
+                    batch.reverse()
+                for tid, unit, pdu in batch:
+                    writer.write(self._response(tid, unit, pdu))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    async def _read_frame(self, reader):
+        tid, _pid, length, unit = struct.unpack(">HHHB", await reader.readexactly(7))
+        pdu = await reader.readexactly(length - 1)
+        self.requests += 1
+        return tid, unit, pdu
+
+    def _store(self, address, data):
+        words = struct.unpack(f">{len(data) // 2}H", data)
+        for offset, word in enumerate(words):
+            self.memory[address + offset] = word
+
+    def _response(self, tid, unit, pdu):
+        function_code, address, count = struct.unpack(">BHH", pdu[:5])
+        self.function_codes.append(function_code)
+        if address in self.illegal:
+            body = struct.pack(">BB", function_code | 0x80, 2)
+        elif function_code == 0x06:
+            self.memory[address] = count
+            body = pdu
+        elif function_code == 0x10:
+            self._store(address, pdu[6:])
+            body = pdu[:5]
+        else:
+            if function_code == 0x17:
+                (write_address,) = struct.unpack(">H", pdu[5:7])
+                self._store(write_address, pdu[10:])
+            words = [self.memory.get(address + i, address + i) for i in range(count)]
+            body = struct.pack(f">BB{count}H", function_code, count * 2, *words)
+        return struct.pack(">HHHB", tid, 0, len(body) + 1, unit) + body
+
+
+def _run(controller, scenario):
+    async def _main():
+        port = await controller.start()
+        pipeline = ModbusTcpPipeline("127.0.0.1", port, 1, timeout=0.3)
+        assert await pipeline.connect()
+        try:
+            return await scenario(pipeline)
+        finally:
+            pipeline.close()
+            await controller.stop()
+
+    return asyncio.run(_main())
+
+
+def test_pipeline_matches_responses_and_probes_window():
+    controller = FakeController(max_outstanding=8)
+
+    async def scenario(pipeline):
+        window = await pipeline.probe_window(10)
+        responses = await asyncio.gather(
+            *(pipeline.read_holding_registers(addr, count=2) for addr in (1, 51, 101))
+        )
+        return window, [resp.registers for resp in responses]
+
+    window, registers = _run(controller, scenario)
+
+    assert window == 8
+    assert registers == [[1, 2], [51, 52], [101, 102]]
+
+
+def test_pipeline_probe_stops_at_dropped_requests():
+    controller = FakeController(max_outstanding=2)
+
+    window = _run(controller, lambda pipeline: pipeline.probe_window(10))
+
+    assert window == 2
+
+
+def test_pipeline_falls_back_when_responses_reordered():
+    controller = FakeController(reverse=True)
+
+    async def scenario(pipeline):
+        pipeline.window = 4
+        responses = await asyncio.gather(
+            *(pipeline.read_input_registers(addr) for addr in (1, 2, 3))
+        )
+        return pipeline.window, [resp.registers for resp in responses]
+
+    window, registers = _run(controller, scenario)
+
+    # Matching by transaction id still yields the right values.
+    assert registers == [[1], [2], [3]]
+    assert window == 1
+
+
+def test_pipeline_reports_exception_codes():
+    controller = FakeController(illegal={3})
+
+    async def scenario(pipeline):
+        return await pipeline.read_holding_registers(3)
+
+    response = _run(controller, scenario)
+
+    assert response.isError()
+    assert response.exception_code == 2
+
+
+def test_pipeline_writes_multiple_registers():
+    controller = FakeController()
+
+    async def scenario(pipeline):
+        written = await pipeline.write_registers(20, [7, 8])
+        read_back = await pipeline.readwrite_registers(
+            read_address=19, read_count=4, write_address=22, values=[9]
+        )
+        return written, read_back.registers
+
+    written, registers = _run(controller, scenario)
+
+    assert not written.isError()
+    assert registers == [19, 7, 8, 9]
+    assert controller.function_codes == [0x10, 0x17]
+
+
+def test_client_writes_32_bit_registers_through_the_pipeline():
+    controller = FakeController()
+    reg = ModbusRegister(
+        unique_id="energy_offset",
+        name="Energy offset",
+        register_type="holding",
+        address=30,
+        length=2,
+        data_type="int32",
+    )
+
+    async def _main():
+        port = await controller.start()
+        client = KebaModbusClient(
+            "127.0.0.1", port, 1, pipelining=True, write_coalesce_window=0
+        )
+        try:
+            await client.async_connect()
+            await client.async_write_register(reg, -2)
+            return client._multi_write_supported
+        finally:
+            await client.async_close()
+            await client._async_disconnect()
+            await controller.stop()
+
+    multi_write_supported = asyncio.run(_main())
+
+    assert controller.memory == {30: 0xFFFF, 31: 0xFFFE}
+    assert 0x06 not in controller.function_codes
+    assert multi_write_supported is not False
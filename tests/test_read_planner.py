@@ -0,0 +1,63 @@
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.read_planner import build_read_plan
+
+
+def _reg(unique_id, address, register_type="holding", length=1):
+    return ModbusRegister(
+        unique_id=unique_id,
+        name=unique_id,
+        register_type=register_type,
+        address=address,
+        length=length,
+    )
+
+
+def test_build_read_plan_merges_registers_within_gap():
+    registers = [_reg("a", 1), _reg("b", 2), _reg("c", 4), _reg("d", 51)]
+
+    plan = build_read_plan(registers, max_gap=2)
+
+    assert [(b.address, b.count) for b in plan] == [(1, 4), (51, 1)]
+    assert [r.unique_id for r in plan[0].registers] == ["a", "b", "c"]
+
+
+def test_build_read_plan_separates_register_types():
+    registers = [_reg("h", 1), _reg("i", 2, register_type="input")]
+
+    plan = build_read_plan(registers, max_gap=8)
+
+    assert [(b.register_type, b.address) for b in plan] == [
+        ("holding", 1),
+        ("input", 2),
+    ]
+
+
+def test_build_read_plan_respects_block_size_limit():
+    registers = [_reg(f"r{i}", i) for i in range(130)]
+
+    plan = build_read_plan(registers, max_gap=0, max_block_size=125)
+
+    assert [(b.address, b.count) for b in plan] == [(0, 125), (125, 5)]
+
+
+def test_build_read_plan_counts_multiword_registers():
+    registers = [_reg("wide", 10, length=2), _reg("next", 12)]
+
+    plan = build_read_plan(registers, max_gap=0)
+
+    assert [(b.address, b.count) for b in plan] == [(10, 3)]
+    assert plan[0].slice([1, 2, 3], registers[0]) == [1, 2]
+    assert plan[0].slice([1, 2, 3], registers[1]) == [3]
+
+
+def test_build_read_plan_does_not_bridge_illegal_addresses():
+    registers = [_reg("a", 1), _reg("b", 3), _reg("c", 5), _reg("d", 6)]
+
+    plan = build_read_plan(
+        registers,
+        max_gap=4,
+        illegal_addresses={("holding", 2), ("holding", 5)},
+    )
+
+    # Gap address 2 splits a/b and register c sits on a hole, so it stands alone.
+    assert [(b.address, b.count) for b in plan] == [(1, 1), (3, 1), (5, 1), (6, 1)]
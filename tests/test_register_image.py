@@ -0,0 +1,123 @@
+import asyncio
+
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.read_planner import build_read_plan
+from custom_components.keba_heat_pump_modbus.register_image import RegisterImage
+
+
+def _holding(unique_id, address, **kwargs):
+    return ModbusRegister(
+        unique_id=unique_id,
+        name=unique_id,
+        register_type="holding",
+        address=address,
+        **kwargs,
+    )
+
+
+def _count_decodes(reg):
+    calls = []
+    decode = reg.codec.decode
+
+    def counting(raw):
+        calls.append(list(raw))
+        return decode(raw)
+
+    reg.codec.decode = counting
+    return calls
+
+
+def test_store_block_reports_only_registers_whose_words_changed():
+    registers = [
+        _holding("a", 10),
+        _holding("b", 11),
+        _holding("c", 12, length=2, data_type="uint32"),
+    ]
+    (block,) = build_read_plan(registers)
+    image = RegisterImage()
+
+    assert image.store_block(block, [1, 2, 0, 3]) == {"a", "b", "c"}
+    assert image.store_block(block, [1, 2, 0, 3]) == set()
+    assert image.store_block(block, [1, 5, 0, 4]) == {"b", "c"}
+    assert dict(image) == {"a": 1.0, "b": 5.0, "c": 4.0}
+
+
+def test_values_are_decoded_lazily_and_once_per_change():
+    reg = _holding("a", 3, scale=0.5)
+    calls = _count_decodes(reg)
+    image = RegisterImage()
+
+    image.store_register(reg, [4])
+    assert calls == []
+    assert image["a"] == 2.0
+    assert image["a"] == 2.0
+    assert calls == [[4]]
+
+    assert image.store_register(reg, [4]) is False
+    assert image["a"] == 2.0
+    assert calls == [[4]]
+
+    assert image.store_register(reg, [6]) is True
+    assert image["a"] == 3.0
+    assert calls == [[4], [6]]
+
+
+def test_failed_reads_map_to_none_until_recovered():
+    reg = _holding("a", 3)
+    image = RegisterImage()
+
+    assert image.store_register(reg, [7]) is True
+    assert image.store_register(reg, None) is True
+    assert image.store_register(reg, None) is False
+    assert image["a"] is None
+    # Same words as before the failure still count as a change.
+    assert image.store_register(reg, [7]) is True
+    assert image["a"] == 7.0
+
+
+def test_short_register_response_is_kept_outside_the_image():
+    reg = _holding("a", 3, length=2, data_type="uint32")
+    image = RegisterImage()
+
+    assert image.store_register(reg, [9]) is True
+    assert image["a"] == 9.0
+    assert image.store_register(reg, [9]) is False
+    assert image.store_register(reg, [0, 9]) is True
+    assert image["a"] == 9.0
+
+
+class _StaticController:
+    def __init__(self, words):
+        self.connected = True
+        self.words = words
+
+    async def read_holding_registers(self, address, count=1):
+        class Response:
+            registers = self.words[address : address + count]
+
+            @staticmethod
+            def isError():
+                return False
+
+        return Response()
+
+
+def test_async_read_all_skips_decoding_unchanged_words():
+    registers = [_holding("a", 1), _holding("b", 2)]
+    calls = _count_decodes(registers[0])
+    client = KebaModbusClient("localhost", 502, 1)
+    controller = _StaticController([0, 10, 20])
+    client._async_client = controller
+
+    first = asyncio.run(client.async_read_all(registers))
+    assert first.changed == {"a", "b"}
+    assert first == {"a": 10.0, "b": 20.0}
+
+    controller.words = [0, 10, 21]
+    second = asyncio.run(client.async_read_all(registers))
+    assert second.changed == {"b"}
+    assert second == {"a": 10.0, "b": 21.0}
+    assert second.image is client.image
+    # "a" was decoded on first access and never again.
+    assert calls == [[10]]
@@ -0,0 +1,67 @@
+import json
+import time
+from pathlib import Path
+
+from custom_components.keba_heat_pump_modbus import register_pack
+from custom_components.keba_heat_pump_modbus.register_pack import load_register_pack
+
+REGISTER_DIR = (
+    Path(__file__).resolve().parents[1]
+    / "custom_components"
+    / "keba_heat_pump_modbus"
+    / "modbus_registers"
+)
+
+
+def _write(path, *registers):
+    path.write_text(json.dumps({"registers": list(registers)}), encoding="utf-8")
+
+
+def _register(unique_id, address):
+    return {"unique_id": unique_id, "name": unique_id, "register_type": "holding", "address": address}
+
+
+def test_pack_is_reused_until_a_source_changes(tmp_path, monkeypatch):
+    source = tmp_path / "circuit_1.json"
+    pack = tmp_path / "cache" / "registers.pack"
+    _write(source, _register("a", 1))
+
+    assert [reg.unique_id for reg in load_register_pack([str(source)], str(pack))] == ["a"]
+    assert pack.exists()
+
+    def _no_parse(_sources):
+        raise AssertionError("sources must not be parsed while the pack is current")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(register_pack, "_parse_sources", _no_parse)
+        assert [reg.address for reg in load_register_pack([str(source)], str(pack))] == [1]
+
+    _write(source, _register("a", 2), _register("b", 3))
+    assert [reg.address for reg in load_register_pack([str(source)], str(pack))] == [2, 3]
+
+    pack.write_bytes(b"not a pickle")
+    assert len(load_register_pack([str(source)], str(pack))) == 2
+
+
+def test_benchmark_setup_with_and_without_the_pack(tmp_path):
+    paths = [str(path) for path in sorted(REGISTER_DIR.glob("*.json"))]
+    pack = str(tmp_path / "registers.pack")
+    rounds = 50
+
+    def _run(pack_path):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            registers = load_register_pack(paths, pack_path)
+            for reg in registers:
+                reg.codec  # noqa: B018
+        return registers, (time.perf_counter() - start) / rounds
+
+    parsed, without_pack = _run(None)
+    load_register_pack(paths, pack)
+    cached, with_pack = _run(pack)
+
+    print(
+        f"\nregister load for {len(parsed)} registers: "
+        f"{without_pack * 1e3:.3f} ms from JSON, {with_pack * 1e3:.3f} ms from the pack"
+    )
+    assert cached == parsed
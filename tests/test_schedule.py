@@ -0,0 +1,257 @@
+import asyncio
+from datetime import timedelta
+from functools import partial
+
+import pytest
+from homeassistant.core import ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import event
+from homeassistant.helpers.storage import Store
+
+from custom_components.keba_heat_pump_modbus.const import (
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DATA_REGISTERS,
+    DATA_SCHEDULE,
+    DOMAIN,
+    SERVICE_SET_SCHEDULE,
+)
+from custom_components.keba_heat_pump_modbus.coordinator import KebaCoordinator
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.schedule import (
+    SetpointSchedule,
+    compile_transitions,
+    parse_slots,
+)
+from custom_components.keba_heat_pump_modbus.services import (
+    async_setup_services,
+    async_write_values,
+)
+from custom_components.keba_heat_pump_modbus.write_budget import WriteBudget
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri"]
+
+
+class DummyResponse:
+    def __init__(self, registers=None):
+        self.registers = registers
+
+    @staticmethod
+    def isError():
+        return False
+
+
+class Controller:
+    def __init__(self, values):
+        self.connected = True
+        self.values = dict(values)
+        self.writes = []
+
+    async def read_holding_registers(self, address, count=1):
+        return DummyResponse([self.values.get(address + i, 0) for i in range(count)])
+
+    async def write_register(self, address, value):
+        self.writes.append(("fc6", address, [value]))
+        self.values[address] = value
+        return DummyResponse()
+
+    async def write_registers(self, address, values):
+        self.writes.append(("fc16", address, list(values)))
+        for offset, value in enumerate(values):
+            self.values[address + offset] = value
+        return DummyResponse()
+
+
+class DummyServices:
+    def __init__(self):
+        self.handlers = {}
+
+    def has_service(self, domain, service):
+        return (domain, service) in self.handlers
+
+    def async_register(self, domain, service, handler, schema=None, supports_response=None):
+        self.handlers[(domain, service)] = handler
+
+
+class DummyHass:
+    def __init__(self):
+        self.data = {}
+        self.services = DummyServices()
+
+    async def async_add_executor_job(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+def _setpoint(unique_id, address):
+    return ModbusRegister(
+        unique_id=unique_id,
+        name=unique_id.title(),
+        register_type="holding",
+        address=address,
+        scale=0.1,
+        precision=1,
+        entity_platform="controls",
+        native_min_value=5,
+        native_max_value=30,
+        native_step=0.5,
+    )
+
+
+def _registers():
+    return [
+        _setpoint("day", 4),
+        _setpoint("night", 5),
+        ModbusRegister(
+            unique_id="mode",
+            name="Mode",
+            register_type="holding",
+            address=7,
+            entity_platform="select",
+            value_map={"0": "Standby", "2": "Day"},
+        ),
+    ]
+
+
+def _setup(controller, key, write_budget=None):
+    hass = DummyHass()
+    registers = _registers()
+    client = KebaModbusClient("localhost", 502, 1, max_read_gap=0)
+    client._async_client = controller
+    coordinator = KebaCoordinator(hass, client, registers, scan_interval=10)
+    entry_data = {
+        DATA_CLIENT: client,
+        DATA_COORDINATOR: coordinator,
+        DATA_REGISTERS: registers,
+    }
+    schedule = SetpointSchedule(
+        hass,
+        Store(None, 1, key),
+        registers,
+        partial(async_write_values, entry_data),
+        write_budget=write_budget,
+    )
+    entry_data[DATA_SCHEDULE] = schedule
+    hass.data[DOMAIN] = {"entry1": entry_data}
+    async_setup_services(hass)
+    return hass, coordinator, schedule
+
+
+def _set_schedule(hass, slots):
+    handler = hass.services.handlers[(DOMAIN, SERVICE_SET_SCHEDULE)]
+    return asyncio.run(handler(ServiceCall(DOMAIN, SERVICE_SET_SCHEDULE, {"slots": slots})))
+
+
+def test_transitions_merge_simultaneous_slots_and_drop_repeated_values():
+    registers = {reg.unique_id: reg for reg in _registers()}
+    slots = parse_slots(
+        [
+            {"days": WEEKDAYS, "time": "06:00", "values": {"day": 21}},
+            {"days": WEEKDAYS, "time": "06:00:00", "values": {"night": 17}},
+            {"days": WEEKDAYS, "time": "22:00", "values": {"day": 19}},
+            {"days": ["sat", "sun"], "time": "22:00", "values": {"day": 19}},
+        ],
+        registers,
+    )
+
+    transitions = compile_transitions(slots, registers)
+
+    # The weekend keeps the night value; night is always 17, so once a week.
+    assert transitions[0] == (6 * 60, {"day": 21, "night": 17})
+    assert [minute for minute, _ in transitions][-2:] == [
+        4 * 1440 + 6 * 60,
+        4 * 1440 + 22 * 60,
+    ]
+    assert sum(len(changes) for _, changes in transitions) == 11
+
+
+def test_schedule_over_the_weekly_write_budget_is_refused():
+    hass, _, schedule = _setup(Controller({}), "keba.budget.schedule")
+    every_day = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+    slots = [
+        {"days": every_day, "time": time, "values": {"day": day, "night": night}}
+        for time, day, night in (("06:00", 21, 18), ("12:00", 20, 17), ("22:00", 19, 16))
+    ]
+
+    with pytest.raises(ServiceValidationError, match="42 register writes per week"):
+        _set_schedule(hass, slots)
+    with pytest.raises(ServiceValidationError, match="slot 1: invalid day 'monday'"):
+        _set_schedule(hass, [{"days": ["monday"], "time": "06:00", "values": {"day": 21}}])
+    assert "keba.budget.schedule" not in Store.saved
+
+    assert _set_schedule(hass, slots[:2]) == {"writes_per_week": 28}
+    assert Store.saved["keba.budget.schedule"]["slots"][0]["time"] == "06:00"
+    assert schedule.writes_per_week == 28
+
+
+def test_schedule_is_checked_against_the_configured_write_budget():
+    budget = WriteBudget(per_day=5)
+    budget.record(["day"] * 20)
+    hass, _, schedule = _setup(Controller({}), "keba.limited.schedule", budget)
+    every_day = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+    twice_a_day = [
+        {"days": every_day, "time": "06:00", "values": {"day": 21}},
+        {"days": every_day, "time": "22:00", "values": {"day": 19}},
+    ]
+    both_setpoints = [
+        {"days": every_day, "time": "06:00", "values": {"day": 21, "night": 18}},
+        {"days": every_day, "time": "22:00", "values": {"day": 19, "night": 16}},
+    ]
+
+    # 35 writes a week, 20 of them already made by other writers.
+    with pytest.raises(ServiceValidationError, match="28 .* more than the budget of 15"):
+        _set_schedule(hass, both_setpoints)
+    assert _set_schedule(hass, twice_a_day) == {"writes_per_week": 14}
+
+    # Setting it again does not count the schedule's own writes twice.
+    budget.record(["day"] * 14)
+    assert _set_schedule(hass, twice_a_day) == {"writes_per_week": 14}
+    assert schedule.writes_per_week == 14
+
+
+def test_due_slot_writes_changed_registers_as_one_batch():
+    event.tracked.clear()
+    controller = Controller({4: 200, 5: 180, 7: 0})
+    hass, coordinator, schedule = _setup(controller, "keba.run.schedule")
+    schedule.async_start()
+    _set_schedule(
+        hass,
+        [
+            {
+                "days": ["mon"],
+                "time": "06:30",
+                "values": {"day": 21.5, "night": 17, "mode": "Standby"},
+            }
+        ],
+    )
+
+    assert len(event.tracked) == 1
+    action, when = event.tracked.pop()
+    assert (when.weekday(), when.hour, when.minute) == (0, 6, 30)
+
+    async def _fire():
+        coordinator.data = await coordinator._client.async_read_all(coordinator._registers)
+        await action(when)
+
+    asyncio.run(_fire())
+
+    # Mode already is Standby; day and night share one request.
+    assert controller.writes == [("fc16", 4, [215, 170])]
+    assert coordinator.data["night"] == 17
+    # The next run is a week later.
+    assert [point for _, point in event.tracked] == [when + timedelta(days=7)]
+
+
+def test_stored_schedule_drops_values_for_registers_that_are_gone():
+    Store.saved["keba.stale.schedule"] = {
+        "slots": [
+            {"days": ["mon"], "time": "06:00", "values": {"day": 21, "room_circuit_4": 20}},
+            {"days": ["mon"], "time": "07:00", "values": {"room_circuit_4": 19}},
+        ]
+    }
+    _, _, schedule = _setup(Controller({}), "keba.stale.schedule")
+
+    asyncio.run(schedule.async_load())
+
+    assert schedule.slots == [{"days": ["mon"], "time": "06:00", "values": {"day": 21}}]
+    assert schedule.writes_per_week == 1
@@ -0,0 +1,257 @@
+import asyncio
+
+import pytest
+from homeassistant.core import ServiceCall
+from homeassistant.helpers.storage import Store
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.keba_heat_pump_modbus.const import (
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DATA_PRESETS,
+    DATA_REGISTERS,
+    DOMAIN,
+    SERVICE_RESTORE_PRESET,
+    SERVICE_SAVE_PRESET,
+    SERVICE_WRITE_REGISTERS,
+)
+from custom_components.keba_heat_pump_modbus.coordinator import KebaCoordinator
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.presets import PresetStore
+from custom_components.keba_heat_pump_modbus.services import async_setup_services
+
+
+class DummyResponse:
+    def __init__(self, registers=None, error=False):
+        self.registers = registers
+        self._error = error
+
+    def isError(self):
+        return self._error
+
+
+class Controller:
+    def __init__(self, values, fail_address=None):
+        self.connected = True
+        self.values = dict(values)
+        self.requests = []
+        self.fail_address = fail_address
+
+    async def read_holding_registers(self, address, count=1):
+        self.requests.append(("read", address, count))
+        return DummyResponse([self.values.get(address + i, 0) for i in range(count)])
+
+    async def write_register(self, address, value):
+        self.requests.append(("fc6", address, [value]))
+        if address == self.fail_address:
+            return DummyResponse(error=True)
+        self.values[address] = value
+        return DummyResponse()
+
+    async def write_registers(self, address, values):
+        self.requests.append(("fc16", address, list(values)))
+        if address == self.fail_address:
+            return DummyResponse(error=True)
+        for offset, value in enumerate(values):
+            self.values[address + offset] = value
+        return DummyResponse()
+
+
+class DummyServices:
+    def __init__(self):
+        self.handlers = {}
+
+    def has_service(self, domain, service):
+        return (domain, service) in self.handlers
+
+    def async_register(self, domain, service, handler, schema=None, supports_response=None):
+        self.handlers[(domain, service)] = handler
+
+
+class DummyHass:
+    def __init__(self):
+        self.data = {}
+        self.services = DummyServices()
+
+    async def async_add_executor_job(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+def _registers():
+    return [
+        ModbusRegister(
+            unique_id="day",
+            name="Day",
+            register_type="holding",
+            address=4,
+            scale=0.1,
+            precision=1,
+            entity_platform="controls",
+            native_min_value=5,
+            native_max_value=30,
+            native_step=0.5,
+        ),
+        ModbusRegister(
+            unique_id="night",
+            name="Night",
+            register_type="holding",
+            address=5,
+            scale=0.1,
+            precision=1,
+            entity_platform="controls",
+            native_min_value=5,
+            native_max_value=30,
+            native_step=0.5,
+        ),
+        ModbusRegister(
+            unique_id="mode",
+            name="Mode",
+            register_type="holding",
+            address=7,
+            entity_platform="select",
+            value_map={"0": "Standby", "2": "Day"},
+        ),
+        ModbusRegister(unique_id="actual", name="Actual", register_type="holding", address=1),
+    ]
+
+
+def _setup(controller):
+    hass = DummyHass()
+    registers = _registers()
+    client = KebaModbusClient("localhost", 502, 1, max_read_gap=0)
+    client._async_client = controller
+    coordinator = KebaCoordinator(hass, client, registers, scan_interval=10)
+    hass.data[DOMAIN] = {
+        "entry1": {
+            DATA_CLIENT: client,
+            DATA_COORDINATOR: coordinator,
+            DATA_REGISTERS: registers,
+            DATA_PRESETS: PresetStore(Store(None, 1, "keba.services.presets")),
+        }
+    }
+    async_setup_services(hass)
+    return hass, coordinator
+
+
+async def _call(hass, coordinator, values, service=SERVICE_WRITE_REGISTERS):
+    coordinator.data = await coordinator._client.async_read_all(coordinator._registers)
+    handler = hass.services.handlers[(DOMAIN, service)]
+    data = {"values": values} if service == SERVICE_WRITE_REGISTERS else values
+    return await handler(ServiceCall(DOMAIN, service, data))
+
+
+def test_write_registers_skips_unchanged_values_and_batches_neighbours():
+    controller = Controller({4: 200, 5: 180, 7: 0})
+    hass, coordinator = _setup(controller)
+
+    response = asyncio.run(
+        _call(hass, coordinator, {"mode": "Standby", "night": 17.0, "day": 21.5})
+    )
+
+    assert response == {
+        "results": {"day": "written", "night": "written", "mode": "unchanged"}
+    }
+    writes = [request for request in controller.requests if request[0] != "read"]
+    assert writes == [("fc16", 4, [215, 170])]
+    assert coordinator.data["day"] == 21.5
+    assert not coordinator.is_pending("night")
+
+
+def test_write_registers_accepts_numbers_sent_as_text():
+    controller = Controller({4: 200, 5: 180, 7: 0})
+    hass, coordinator = _setup(controller)
+
+    with pytest.raises(ServiceValidationError, match="night: 'warm' is not a number"):
+        asyncio.run(_call(hass, coordinator, {"day": "21.5", "night": "warm"}))
+    response = asyncio.run(_call(hass, coordinator, {"day": "21.5", "mode": "Day"}))
+
+    assert response == {"results": {"day": "written", "mode": "written"}}
+    assert controller.values[4] == 215
+
+
+def test_write_registers_rejects_the_whole_set_when_one_value_is_invalid():
+    controller = Controller({4: 200, 5: 180, 7: 0})
+    hass, coordinator = _setup(controller)
+
+    with pytest.raises(ServiceValidationError) as err:
+        asyncio.run(_call(hass, coordinator, {"day": 21.3, "night": 40, "mode": "Boost"}))
+
+    message = str(err.value)
+    assert "day: 21.3 is not a multiple of the step 0.5" in message
+    assert "night: 40 is above the maximum 30" in message
+    assert "mode: invalid option 'Boost'" in message
+    with pytest.raises(ServiceValidationError, match="actual: register is read-only"):
+        asyncio.run(_call(hass, coordinator, {"actual": 1}))
+    assert all(request[0] == "read" for request in controller.requests)
+
+
+def test_write_registers_reports_partial_failures_per_register():
+    controller = Controller({4: 200, 5: 180, 7: 0}, fail_address=7)
+    hass, coordinator = _setup(controller)
+
+    response = asyncio.run(_call(hass, coordinator, {"day": 22, "mode": "Day"}))
+
+    assert response["results"]["day"] == "written"
+    assert response["results"]["mode"].startswith("error: Error writing register Mode")
+    assert coordinator.write_error("mode") is not None
+    assert controller.values[4] == 220
+
+
+def test_preset_restore_writes_only_registers_that_differ():
+    controller = Controller({1: 195, 4: 200, 5: 180, 7: 2, 9: 5})
+    hass, coordinator = _setup(controller)
+
+    saved = asyncio.run(_call(hass, coordinator, {"name": "normal"}, SERVICE_SAVE_PRESET))
+    assert saved == {"registers": 3, "skipped": {}}
+    assert Store.saved["keba.services.presets"] == {
+        "presets": {"normal": {"day": 20.0, "night": 18.0, "mode": "Day"}}
+    }
+
+    controller.values.update({4: 150, 7: 0})
+    controller.requests.clear()
+    response = asyncio.run(
+        _call(hass, coordinator, {"name": "normal"}, SERVICE_RESTORE_PRESET)
+    )
+
+    assert response == {
+        "results": {"day": "written", "night": "unchanged", "mode": "written"}
+    }
+    writes = [request for request in controller.requests if request[0] != "read"]
+    assert writes == [("fc6", 4, [200]), ("fc6", 7, [2])]
+    with pytest.raises(ServiceValidationError, match="Unknown preset"):
+        asyncio.run(_call(hass, coordinator, {"name": "vacation"}, SERVICE_RESTORE_PRESET))
+
+
+def test_preset_save_reports_values_it_cannot_restore():
+    # Night is off the 0.5 step grid, mode holds a value without an option.
+    controller = Controller({4: 200, 5: 183, 7: 1})
+    hass, coordinator = _setup(controller)
+
+    saved = asyncio.run(_call(hass, coordinator, {"name": "odd"}, SERVICE_SAVE_PRESET))
+
+    assert saved["registers"] == 1
+    assert set(saved["skipped"]) == {"night", "mode"}
+    assert "not a multiple of the step" in saved["skipped"]["night"]
+    assert Store.saved["keba.services.presets"]["presets"]["odd"] == {"day": 20.0}
+
+
+def test_preset_restore_reports_stale_values_and_writes_the_rest():
+    controller = Controller({4: 200, 5: 180, 7: 0})
+    hass, coordinator = _setup(controller)
+    presets = hass.data[DOMAIN]["entry1"][DATA_PRESETS]
+    asyncio.run(
+        presets.async_save("old", {"day": 22, "night": 45, "room_circuit_4": 20})
+    )
+
+    response = asyncio.run(_call(hass, coordinator, {"name": "old"}, SERVICE_RESTORE_PRESET))
+
+    assert response == {
+        "results": {
+            "night": "invalid: 45 is above the maximum 30",
+            "room_circuit_4": "unknown register",
+            "day": "written",
+        }
+    }
+    assert controller.values[4] == 220
+    assert controller.values[5] == 180
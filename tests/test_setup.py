@@ -31,9 +31,11 @@ def test_async_load_registers_reads_single_json_when_directory_missing(monkeypat
     monkeypatch.setattr(integration.os.path, "isdir", lambda _p: False)
 
     def fake_open(path, mode="r", encoding=None, **kwargs):  # noqa: ANN001
+        if ".pack" in path:
+            raise FileNotFoundError(path)
         assert path.endswith("modbus_registers.json")
-        return io.StringIO(
-            '{"registers": [{"unique_id": "x", "name": "X", "register_type": "input", "address": 1}]}'
+        return io.BytesIO(
+            b'{"registers": [{"unique_id": "x", "name": "X", "register_type": "input", "address": 1}]}'
         )
 
     monkeypatch.setattr("builtins.open", fake_open)
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from homeassistant.helpers.storage import Store
+
+from custom_components.keba_heat_pump_modbus.connection import (
+    STATE_BACKOFF,
+    STATE_CONNECTED,
+)
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.write_behind import (
+    WriteBehindQueue,
+    WriteQueued,
+)
+from custom_components.keba_heat_pump_modbus.write_utils import (
+    async_write_with_read_back,
+)
+
+
+class DummyResponse:
+    def __init__(self, registers=None):
+        self.registers = registers
+
+    @staticmethod
+    def isError():
+        return False
+
+
+class Controller:
+    def __init__(self, values):
+        self.connected = True
+        self.values = dict(values)
+        self.writes = []
+
+    async def read_holding_registers(self, address, count=1):
+        return DummyResponse([self.values.get(address + i, 0) for i in range(count)])
+
+    async def write_register(self, address, value):
+        self.writes.append((address, value))
+        self.values[address] = value
+        return DummyResponse()
+
+
+def _holding(address):
+    return ModbusRegister(
+        unique_id=f"r{address}", name=f"Reg {address}", register_type="holding", address=address
+    )
+
+
+def _client(queue):
+    return KebaModbusClient(
+        "localhost", 502, 1, max_read_gap=0, write_coalesce_window=0, write_behind=queue
+    )
+
+
+def test_writes_while_the_link_is_down_are_queued_last_writer_wins():
+    store = Store(None, 1, "keba.queued.write_behind")
+    client = _client(WriteBehindQueue(store))
+    client.connection.state = STATE_BACKOFF
+
+    async def scenario():
+        for value in (1, 2):
+            with pytest.raises(WriteQueued, match="queued"):
+                await client.async_write_register(_holding(4), value)
+
+    asyncio.run(scenario())
+
+    assert client.write_behind.items() == [(_holding(4), [2])]
+    assert Store.saved["keba.queued.write_behind"] == {"writes": {"r4": [2]}}
+
+
+def test_restored_queue_flushes_on_reconnect_and_skips_fresh_values():
+    registers = [_holding(4), _holding(5)]
+    Store.saved["keba.restored.write_behind"] = {"writes": {"r4": [7], "r5": [9], "gone": [1]}}
+    queue = WriteBehindQueue(Store(None, 1, "keba.restored.write_behind"))
+    asyncio.run(queue.async_load(registers))
+    client = _client(queue)
+    controller = Controller({4: 7, 5: 0})
+    client._async_client = controller
+    flushed = []
+
+    async def on_flushed(unique_ids):
+        flushed.extend(unique_ids)
+
+    queue.on_flushed = on_flushed
+
+    async def scenario():
+        client.connection._set_state(STATE_CONNECTED)
+        await client._write_behind_task
+
+    asyncio.run(scenario())
+
+    assert controller.writes == [(5, 9)]
+    assert flushed == ["r4", "r5"]
+    assert len(queue) == 0
+    assert Store.saved["keba.restored.write_behind"] == {"writes": {}}
+
+
+def test_queued_write_stays_pending_without_read_back():
+    class Coordinator:
+        def __init__(self):
+            self.pending = {}
+            self.refreshed = []
+
+        def set_pending(self, unique_id, value):
+            self.pending[unique_id] = value
+
+        def rollback(self, unique_id, reason):
+            raise AssertionError("queued write must not be rolled back")
+
+        async def async_refresh_registers(self, unique_ids):
+            self.refreshed.append(list(unique_ids))
+
+    coordinator = Coordinator()
+    client = _client(WriteBehindQueue())
+    client.connection.state = STATE_BACKOFF
+
+    asyncio.run(async_write_with_read_back(coordinator, client, _holding(4), 3, 3))
+
+    assert coordinator.pending == {"r4": 3}
+    assert coordinator.refreshed == []
+    assert len(client.write_behind) == 1
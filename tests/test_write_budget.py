@@ -0,0 +1,213 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.helpers.storage import Store
+
+from custom_components.keba_heat_pump_modbus import write_budget as budget_module
+from custom_components.keba_heat_pump_modbus.const import WRITE_WARNING_THRESHOLD
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.write_budget import (
+    WriteBudget,
+    WriteBudgetExceeded,
+)
+
+
+class Clock:
+    def __init__(self):
+        # Starts at the real time: the client's wear warning is not patched.
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(budget_module, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+class DummyResponse:
+    @staticmethod
+    def isError():
+        return False
+
+
+class WriteClient:
+    def __init__(self):
+        self.connected = True
+        self.writes = []
+
+    async def write_register(self, address, value):
+        self.writes.append((address, value))
+        return DummyResponse()
+
+
+def _holding(address):
+    return ModbusRegister(
+        unique_id=f"r{address}", name=f"Reg {address}", register_type="holding", address=address
+    )
+
+
+def test_reject_policy_fails_once_the_burst_is_used_and_refills_over_time(clock):
+    budget = WriteBudget(per_day=24, burst=2, policy="reject")
+
+    asyncio.run(budget.async_acquire(2))
+    with pytest.raises(WriteBudgetExceeded, match="24 writes per day"):
+        asyncio.run(budget.async_acquire())
+
+    clock.now += 3600  # one token per hour
+    assert budget.remaining == 1
+    asyncio.run(budget.async_acquire())
+    assert budget.remaining == 0
+
+
+def test_delay_policy_waits_briefly_for_tokens_until_closed(clock, monkeypatch):
+    # One token per second.
+    budget = WriteBudget(per_day=86400, burst=8, policy="delay")
+    slept = []
+
+    async def fake_wait_for(awaitable, timeout):
+        awaitable.close()
+        slept.append(timeout)
+        clock.now += timeout
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(budget_module.asyncio, "wait_for", fake_wait_for)
+
+    asyncio.run(budget.async_acquire(8))
+    asyncio.run(budget.async_acquire(2))
+    assert slept == [pytest.approx(2)]
+
+    # Waiting longer than the cap would hang the caller's service call.
+    with pytest.raises(WriteBudgetExceeded, match="next write possible in 8 s"):
+        asyncio.run(budget.async_acquire(8))
+    slow = WriteBudget(per_day=24, burst=2, policy="delay")
+    asyncio.run(slow.async_acquire(2))
+    with pytest.raises(WriteBudgetExceeded, match="in 3600 s"):
+        asyncio.run(slow.async_acquire())
+    assert slept == [pytest.approx(2)]
+
+    with pytest.raises(WriteBudgetExceeded, match="burst of 8"):
+        asyncio.run(budget.async_acquire(9))
+    budget.close()
+    with pytest.raises(WriteBudgetExceeded):
+        asyncio.run(budget.async_acquire())
+
+
+def test_close_ends_a_write_waiting_for_tokens(clock):
+    budget = WriteBudget(per_day=86400, burst=1, policy="delay")
+
+    async def scenario():
+        await budget.async_acquire()
+        waiting = asyncio.ensure_future(budget.async_acquire())
+        await asyncio.sleep(0)
+        budget.close()
+        with pytest.raises(WriteBudgetExceeded, match="shutdown"):
+            await waiting
+
+    asyncio.run(scenario())
+
+
+def test_budget_of_zero_only_counts_writes(clock):
+    budget = WriteBudget(per_day=0, burst=1, policy="reject")
+
+    for _ in range(5):
+        asyncio.run(budget.async_acquire())
+    budget.record(["a"])
+
+    assert not budget.limited
+    assert budget.total == 1
+
+
+def test_counts_and_tokens_survive_a_restart(clock):
+    store = Store(None, 1, "keba.entry.write_budget")
+    budget = WriteBudget(store, per_day=24, burst=5)
+    asyncio.run(budget.async_acquire(3))
+    budget.record(["a", "b", "a"])
+
+    clock.now += 3600
+    restored = WriteBudget(Store(None, 1, "keba.entry.write_budget"), per_day=24, burst=5)
+    asyncio.run(restored.async_load())
+
+    assert restored.remaining == 3
+    assert restored.total == 3
+    assert restored.per_register == {"a": 2, "b": 1}
+    assert len(restored.recent_writes()) == 3
+
+
+def test_weekly_writes_are_kept_as_hourly_counts(clock):
+    store = Store(None, 1, "keba.runaway.write_budget")
+    budget = WriteBudget(store)
+
+    for _ in range(20):
+        budget.record([f"r{index}" for index in range(50)])
+    clock.now += 3600
+    budget.record(["r0"])
+
+    assert budget.total == 1001
+    assert budget.recent_count == 1001
+    assert len(budget.recent_writes()) == WRITE_WARNING_THRESHOLD + 1
+    assert len(Store.saved["keba.runaway.write_budget"]["recent"]) == 2
+
+    # A bucket expires once its whole hour has left the window.
+    clock.now += 7 * 24 * 3600
+    assert budget.recent_count == 1
+    clock.now += 3600
+    assert budget.recent_count == 0
+
+
+def test_client_spends_tokens_and_seeds_the_wear_warning_from_storage(clock):
+    budget = WriteBudget(per_day=24, burst=2, policy="reject")
+    budget.record(["old"])
+    client = KebaModbusClient(
+        "localhost", 502, 1, write_coalesce_window=0, write_budget=budget
+    )
+    controller = WriteClient()
+    client._async_client = controller
+
+    asyncio.run(client.async_write_register(_holding(4), 1))
+    asyncio.run(client.async_write_register(_holding(5), 2))
+    with pytest.raises(WriteBudgetExceeded):
+        asyncio.run(client.async_write_register(_holding(6), 3))
+
+    assert controller.writes == [(4, 1), (5, 2)]
+    assert budget.per_register == {"old": 1, "r4": 1, "r5": 1}
+    assert len(client._write_timestamps) == 3
+
+
+def test_client_splits_runs_to_the_burst_and_refunds_failed_writes(clock):
+    class BatchClient(WriteClient):
+        def __init__(self, fail=False):
+            super().__init__()
+            self.fail = fail
+
+        async def write_registers(self, address, values):
+            if self.fail:
+                return SimpleNamespace(isError=lambda: True)
+            self.writes.append((address, list(values)))
+            return DummyResponse()
+
+    budget = WriteBudget(per_day=24, burst=3, policy="reject")
+    client = KebaModbusClient(
+        "localhost", 502, 1, write_coalesce_window=0, write_budget=budget
+    )
+    failing = BatchClient(fail=True)
+    client._async_client = failing
+
+    errors = asyncio.run(client.async_write_registers([(_holding(4), 1), (_holding(5), 2)]))
+    assert all("Error writing register" in str(err) for err in errors.values())
+    assert budget.remaining == 3
+
+    controller = BatchClient()
+    client._async_client = controller
+    errors = asyncio.run(
+        client.async_write_registers([(_holding(address), address) for address in range(4, 7)])
+    )
+    assert errors == {"r4": None, "r5": None, "r6": None}
+    assert controller.writes == [(4, [4, 5, 6])]
+    assert client._writes._max_registers == 3
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from pymodbus.exceptions import ModbusException
+
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+from custom_components.keba_heat_pump_modbus.write_coalescer import group_runs
+
+
+class DummyResponse:
+    def __init__(self, error=False, exception_code=None):
+        self._error = error
+        self.exception_code = exception_code
+
+    def isError(self):
+        return self._error
+
+
+class MultiWriteClient:
+    def __init__(self, multi_error_code=None, fail_address=None):
+        self.connected = True
+        self.requests = []
+        self.multi_error_code = multi_error_code
+        self.fail_address = fail_address
+
+    async def write_register(self, address, value):
+        self.requests.append(("fc6", address, [value]))
+        return DummyResponse(error=address == self.fail_address)
+
+    async def write_registers(self, address, values):
+        self.requests.append(("fc16", address, list(values)))
+        if self.multi_error_code is not None:
+            return DummyResponse(error=True, exception_code=self.multi_error_code)
+        return DummyResponse(error=address == self.fail_address)
+
+
+def _holding(address, **kwargs):
+    return ModbusRegister(
+        unique_id=f"r{address}",
+        name=f"Reg {address}",
+        register_type="holding",
+        address=address,
+        **kwargs,
+    )
+
+
+async def _write_together(client, writes):
+    return await asyncio.gather(
+        *(client.async_write_register(reg, value) for reg, value in writes),
+        return_exceptions=True,
+    )
+
+
+def test_group_runs_merges_contiguous_addresses_only():
+    writes = [(_holding(6), [3]), (_holding(4), [1]), (_holding(5), [2]), (_holding(9), [4])]
+
+    runs = group_runs(writes)
+
+    assert [[reg.address for reg, _ in run] for run in runs] == [[4, 5, 6], [9]]
+    assert len(group_runs(writes, max_registers=2)) == 3
+
+
+def test_concurrent_writes_to_neighbouring_registers_use_one_fc16_request():
+    client = KebaModbusClient("localhost", 502, 1, write_coalesce_window=0.01)
+    controller = MultiWriteClient()
+    client._async_client = controller
+
+    results = asyncio.run(
+        _write_together(
+            client,
+            [(_holding(5), 2), (_holding(4), 1), (_holding(6), 3), (_holding(605), 7)],
+        )
+    )
+
+    assert results == [None, None, None, None]
+    assert controller.requests == [("fc16", 4, [1, 2, 3]), ("fc6", 605, [7])]
+    # Every register still counts toward the write-wear warning.
+    assert len(client._write_timestamps) == 4
+
+
+def test_latest_value_for_an_address_wins_within_the_window():
+    client = KebaModbusClient("localhost", 502, 1, write_coalesce_window=0.01)
+    controller = MultiWriteClient()
+    client._async_client = controller
+
+    asyncio.run(_write_together(client, [(_holding(4), 1), (_holding(4), 8)]))
+
+    assert controller.requests == [("fc6", 4, [8])]
+
+
+def test_failed_run_fails_only_its_own_writes():
+    client = KebaModbusClient("localhost", 502, 1, write_coalesce_window=0.01)
+    controller = MultiWriteClient(fail_address=4)
+    client._async_client = controller
+
+    results = asyncio.run(
+        _write_together(client, [(_holding(4), 1), (_holding(5), 2), (_holding(9), 3)])
+    )
+
+    assert isinstance(results[0], ModbusException)
+    assert results[1] is results[0]
+    assert results[2] is None
+    assert len(client._write_timestamps) == 1
+
+
+def test_illegal_function_falls_back_to_single_writes_for_good():
+    client = KebaModbusClient("localhost", 502, 1, write_coalesce_window=0.01)
+    controller = MultiWriteClient(multi_error_code=0x01)
+    client._async_client = controller
+
+    asyncio.run(_write_together(client, [(_holding(4), 1), (_holding(5), 2)]))
+    asyncio.run(_write_together(client, [(_holding(4), 3), (_holding(5), 4)]))
+
+    assert controller.requests == [
+        ("fc16", 4, [1, 2]),
+        ("fc6", 4, [1]),
+        ("fc6", 5, [2]),
+        ("fc6", 4, [3]),
+        ("fc6", 5, [4]),
+    ]
+
+
+def test_invalid_value_is_rejected_before_it_is_queued():
+    client = KebaModbusClient("localhost", 502, 1, write_coalesce_window=0.01)
+    client._async_client = MultiWriteClient()
+
+    with pytest.raises(ModbusException):
+        asyncio.run(client.async_write_register(_holding(4), -1))
+    assert client._writes.pending == 0
+
+
+def test_32_bit_register_is_written_atomically_even_without_multi_write_support():
+    client = KebaModbusClient("localhost", 502, 1, write_coalesce_window=0.01)
+    controller = MultiWriteClient()
+    client._async_client = controller
+    client._multi_write_supported = False
+    wide = _holding(10, length=2, data_type="uint32")
+
+    asyncio.run(_write_together(client, [(wide, 0x10002), (_holding(12), 5)]))
+
+    assert controller.requests == [("fc16", 10, [1, 2]), ("fc6", 12, [5])]
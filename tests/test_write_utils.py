@@ -1,9 +1,13 @@
 import asyncio
 from typing import Any, cast
 
+import pytest
+
 from custom_components.keba_heat_pump_modbus.models import ModbusRegister
 from custom_components.keba_heat_pump_modbus.write_utils import (
+    DebounceScheduler,
     DebouncedRegisterWriter,
+    async_write_with_read_back,
     values_equal,
 )
 
@@ -28,18 +32,44 @@ def test_values_equal_handles_types_and_precision():
 class _DummyCoordinator:
     def __init__(self):
         self.refresh_called = False
+        self.pending = {}
+        self.errors = {}
 
     async def async_request_refresh(self):
         self.refresh_called = True
 
+    async def async_refresh_registers(self, unique_ids):
+        self.refresh_called = True
+        for unique_id in unique_ids:
+            self.pending.pop(unique_id, None)
+
+    def set_pending(self, unique_id, value):
+        self.pending[unique_id] = value
+
+    def clear_pending(self, unique_id):
+        self.pending.pop(unique_id, None)
+
+    def rollback(self, unique_id, reason):
+        self.pending.pop(unique_id, None)
+        self.errors[unique_id] = reason
+
 
 class _DummyClient:
     def __init__(self):
         self.writes: list[tuple[ModbusRegister, object]] = []
+        self.batches: list[list[str]] = []
 
     def write_register(self, reg: ModbusRegister, value):
         self.writes.append((reg, value))
 
+    async def async_write_register(self, reg: ModbusRegister, value):
+        self.writes.append((reg, value))
+
+    async def async_write_registers(self, writes):
+        self.batches.append([reg.unique_id for reg, _ in writes])
+        self.writes.extend(writes)
+        return {reg.unique_id: None for reg, _ in writes}
+
 
 class _DummyHassNoCreateTask:
     async def async_add_executor_job(self, func, *args, **kwargs):
@@ -51,6 +81,12 @@ class _DummyHassWithCreateTask(_DummyHassNoCreateTask):
         return asyncio.create_task(coro)
 
 
+def _scheduler(hass, coordinator, client, delay):
+    return DebounceScheduler(
+        hass, cast(Any, coordinator), cast(Any, client), delay
+    )
+
+
 def test_debounced_writer_delay_zero_writes_immediately():
     hass = cast(Any, _DummyHassNoCreateTask())
     coordinator = _DummyCoordinator()
@@ -69,12 +105,11 @@ def test_debounced_writer_delay_zero_writes_immediately():
         return current
 
     writer = DebouncedRegisterWriter(
-        hass=hass,
         coordinator=cast(Any, coordinator),
         client=cast(Any, client),
         reg=reg,
         current_value=current_value,
-        delay=0,
+        scheduler=_scheduler(hass, coordinator, client, 0),
     )
 
     async def _run():
@@ -111,12 +146,11 @@ def test_debounced_writer_cancel_prevents_delayed_write():
         return current
 
     writer = DebouncedRegisterWriter(
-        hass=hass,
         coordinator=cast(Any, coordinator),
         client=cast(Any, client),
         reg=reg,
         current_value=current_value,
-        delay=0.05,
+        scheduler=_scheduler(hass, coordinator, client, 0.05),
     )
 
     async def _run():
@@ -149,12 +183,11 @@ def test_debounced_writer_uses_hass_async_create_task_when_available():
         return 0
 
     writer = DebouncedRegisterWriter(
-        hass=hass,
         coordinator=cast(Any, coordinator),
         client=cast(Any, client),
         reg=reg,
         current_value=current_value,
-        delay=0.01,
+        scheduler=_scheduler(hass, coordinator, client, 0.01),
     )
 
     async def _run():
@@ -163,3 +196,90 @@ def test_debounced_writer_uses_hass_async_create_task_when_available():
         assert client.writes == [(reg, 3)]
 
     asyncio.run(_run())
+
+
+def test_write_with_read_back_rolls_back_failed_writes():
+    class _FailingClient(_DummyClient):
+        async def async_write_register(self, reg, value):
+            raise RuntimeError("link down")
+
+    coordinator = _DummyCoordinator()
+    reg = ModbusRegister(
+        unique_id="w", name="Writable", register_type="holding", address=1
+    )
+
+    async def _run():
+        await async_write_with_read_back(
+            cast(Any, coordinator), cast(Any, _FailingClient()), reg, 3, "Three"
+        )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_run())
+    assert coordinator.pending == {}
+    assert coordinator.errors == {"w": "link down"}
+    assert coordinator.refresh_called is False
+
+
+def test_debounced_writer_publishes_pending_value_until_cancelled():
+    coordinator = _DummyCoordinator()
+    client = _DummyClient()
+    reg = ModbusRegister(
+        unique_id="w", name="Writable", register_type="holding", address=1
+    )
+    writer = DebouncedRegisterWriter(
+        coordinator=cast(Any, coordinator),
+        client=cast(Any, client),
+        reg=reg,
+        current_value=lambda: 0,
+        scheduler=_scheduler(_DummyHassNoCreateTask(), coordinator, client, 0.05),
+    )
+
+    async def _run():
+        await writer.schedule(4)
+        assert coordinator.pending == {"w": 4}
+        # Moving back to the controller's value drops the queued write.
+        await writer.schedule(0)
+        assert coordinator.pending == {}
+        await asyncio.sleep(0.08)
+
+    asyncio.run(_run())
+    assert not writer._scheduler.is_pending("w")
+
+
+def test_debounced_writers_of_one_entry_share_a_single_flush():
+    coordinator = _DummyCoordinator()
+    client = _DummyClient()
+    hass = cast(Any, _DummyHassNoCreateTask())
+    registers = [
+        ModbusRegister(
+            unique_id=f"w{address}", name=f"W{address}", register_type="holding", address=address
+        )
+        for address in (5, 4, 6)
+    ]
+    scheduler = _scheduler(hass, coordinator, client, 0.1)
+    writers = [
+        DebouncedRegisterWriter(
+            coordinator=cast(Any, coordinator),
+            client=cast(Any, client),
+            reg=reg,
+            current_value=lambda: 0,
+            scheduler=scheduler,
+        )
+        for reg in registers
+    ]
+
+    async def _run():
+        for value in (1, 2):
+            for writer in writers:
+                await writer.schedule(value)
+                await asyncio.sleep(0.01)
+        writers[2].cancel()
+        await asyncio.sleep(0.05)
+        # Every change pushed the shared deadline back.
+        assert client.batches == []
+        await asyncio.sleep(0.1)
+
+    asyncio.run(_run())
+    assert client.batches == [["w4", "w5"]]
+    assert [value for _, value in client.writes] == [2, 2]
+    assert coordinator.pending == {}
@@ -0,0 +1,113 @@
+import asyncio
+
+from custom_components.keba_heat_pump_modbus.coordinator import KebaCoordinator
+from custom_components.keba_heat_pump_modbus.modbus_client import KebaModbusClient
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister
+
+
+class DummyResponse:
+    def __init__(self, registers=None, error=False, exception_code=None):
+        self.registers = registers
+        self._error = error
+        self.exception_code = exception_code
+
+    def isError(self):
+        return self._error
+
+
+class WriteReadController:
+    def __init__(self, values, fc23_error_code=None):
+        self.connected = True
+        self.values = dict(values)
+        self.requests = []
+        self.fc23_error_code = fc23_error_code
+
+    async def read_holding_registers(self, address, count=1):
+        self.requests.append(("read", address, count))
+        return DummyResponse([self.values.get(address + i, 0) for i in range(count)])
+
+    async def write_register(self, address, value):
+        self.requests.append(("fc6", address, [value]))
+        self.values[address] = value
+        return DummyResponse()
+
+    async def readwrite_registers(self, read_address, read_count, write_address, values):
+        self.requests.append(("fc23", read_address, read_count, write_address, list(values)))
+        if self.fc23_error_code is not None:
+            return DummyResponse(error=True, exception_code=self.fc23_error_code)
+        for offset, value in enumerate(values):
+            self.values[write_address + offset] = value
+        return DummyResponse(
+            [self.values.get(read_address + i, 0) for i in range(read_count)]
+        )
+
+
+class DummyHass:
+    async def async_add_executor_job(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+def _registers():
+    return [
+        ModbusRegister(
+            unique_id="effective", name="Effective", register_type="holding", address=2
+        ),
+        ModbusRegister(
+            unique_id="setpoint",
+            name="Setpoint",
+            register_type="holding",
+            address=4,
+            refresh_with=["effective"],
+        ),
+    ]
+
+
+def _client(controller):
+    client = KebaModbusClient(
+        "localhost", 502, 1, write_coalesce_window=0, write_verify=True
+    )
+    client._async_client = controller
+    return client
+
+
+def test_write_and_dependent_read_back_share_one_fc23_request():
+    registers = _registers()
+    controller = WriteReadController({2: 20, 4: 19})
+    client = _client(controller)
+    client.plan_reads(registers)
+    coordinator = KebaCoordinator(DummyHass(), client, registers, scan_interval=10)
+
+    async def scenario():
+        await client.async_write_register(registers[1], 21)
+        await coordinator.async_refresh_registers(["setpoint"])
+
+    asyncio.run(scenario())
+
+    assert controller.requests == [("fc23", 2, 3, 4, [21])]
+    assert coordinator.data["setpoint"] == 21
+    assert coordinator.data["effective"] == 20
+    assert client.take_verified(["setpoint", "effective"]) == {}
+
+
+def test_illegal_function_falls_back_to_write_then_read_for_good():
+    registers = _registers()
+    controller = WriteReadController({2: 20, 4: 19}, fc23_error_code=0x01)
+    client = _client(controller)
+    client.plan_reads(registers)
+    coordinator = KebaCoordinator(DummyHass(), client, registers, scan_interval=10)
+
+    async def scenario():
+        for value in (21, 22):
+            await client.async_write_register(registers[1], value)
+            await coordinator.async_refresh_registers(["setpoint"])
+
+    asyncio.run(scenario())
+
+    assert [request[0] for request in controller.requests] == [
+        "fc23",
+        "fc6",
+        "read",
+        "fc6",
+        "read",
+    ]
+    assert coordinator.data["setpoint"] == 22
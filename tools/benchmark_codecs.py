@@ -0,0 +1,182 @@
+"""
+Benchmark register decoding: the old per-call ``data_type`` dispatch against the
+compiled per-register codecs, and per-register slicing against ``BlockDecoder``
+for whole block responses.
+
+Random raw words are generated for every bundled register; all decoders must
+agree on every value before the timings are printed.
+
+Usage:
+    python tools/benchmark_codecs.py [--rounds 200] [--seed 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister  # noqa: E402
+from custom_components.keba_heat_pump_modbus.read_planner import (  # noqa: E402
+    build_read_plan,
+)
+
+REGISTER_DIR = ROOT / "custom_components" / "keba_heat_pump_modbus" / "modbus_registers"
+
+
+def load_registers() -> list[ModbusRegister]:
+    registers: list[ModbusRegister] = []
+    for path in sorted(REGISTER_DIR.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        registers.extend(ModbusRegister(**item) for item in data["registers"])
+    return registers
+
+
+def legacy_decode(raw: list[int], reg: ModbusRegister):
+    """The decoder as it was before codecs were compiled per register."""
+    if not raw:
+        return None
+
+    def to_int16(v: int) -> int:
+        return v - 0x10000 if v & 0x8000 else v
+
+    if reg.data_type == "int16":
+        val = to_int16(raw[0])
+    elif reg.data_type == "uint16":
+        val = int(raw[0])
+    elif reg.data_type in ("int32", "uint32", "float32"):
+        if len(raw) < 2:
+            base = raw[0]
+            val = to_int16(base) if reg.data_type == "int32" else int(base)
+        else:
+            combined = (raw[0] << 16) | raw[1]
+            if reg.data_type == "int32":
+                val = struct.unpack(">i", combined.to_bytes(4, "big", signed=False))[0]
+            elif reg.data_type == "uint32":
+                val = combined
+            else:
+                val = struct.unpack(">f", combined.to_bytes(4, "big", signed=False))[0]
+    elif reg.data_type == "boolean":
+        val = bool(raw[0])
+    else:
+        val = raw[0]
+
+    numeric = val
+    if isinstance(val, (int, float)):
+        try:
+            numeric = (float(val) * reg.scale) + reg.offset
+        except Exception:  # noqa: BLE001
+            numeric = val
+
+    if reg.value_map is not None:
+        key = str(int(val)) if isinstance(val, (int, float)) else str(val)
+        mapped = reg.value_map.get(key)
+        if mapped is not None:
+            return mapped
+
+    if isinstance(numeric, float) and reg.precision is not None:
+        numeric = round(numeric, reg.precision)
+
+    return numeric
+
+
+def _random_words(reg: ModbusRegister, rng: random.Random) -> list[int]:
+    if reg.value_map and rng.random() < 0.5:
+        key = rng.choice(list(reg.value_map))
+        if key.isdigit():
+            return [0] * (reg.length - 1) + [int(key)]
+    return [rng.randrange(0x10000) for _ in range(reg.length)]
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b and type(a) is type(b)
+
+
+def _time(samples, decode) -> float:
+    start = time.perf_counter_ns()
+    for raw, reg in samples:
+        decode(raw, reg)
+    return (time.perf_counter_ns() - start) / len(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    registers = load_registers()
+    samples = [
+        (_random_words(reg, rng), reg)
+        for _ in range(args.rounds)
+        for reg in registers
+    ]
+
+    for raw, reg in samples:
+        expected = legacy_decode(raw, reg)
+        actual = reg.codec.decode(raw)
+        if not _same(expected, actual):
+            raise SystemExit(
+                f"Mismatch for {reg.unique_id} {raw}: {expected!r} != {actual!r}"
+            )
+
+    legacy = min(_time(samples, legacy_decode) for _ in range(3))
+    compiled = min(
+        _time(samples, lambda raw, reg: reg.codec.decode(raw)) for _ in range(3)
+    )
+    print(f"{len(registers)} registers, {len(samples)} decodes")
+    print(f"legacy decode   {legacy:8.0f} ns/register")
+    print(f"compiled codec  {compiled:8.0f} ns/register  ({legacy / compiled:.1f}x)")
+
+    blocks = build_read_plan(registers, max_gap=64)
+    responses = [
+        (block, [rng.randrange(0x10000) for _ in range(block.count)])
+        for _ in range(args.rounds)
+        for block in blocks
+    ]
+    for block, words in responses:
+        per_register = {
+            reg.unique_id: reg.codec.decode(block.slice(words, reg))
+            for reg in block.registers
+        }
+        bulk = block.decoder.decode(words)
+        if any(not _same(per_register[key], bulk[key]) for key in per_register):
+            raise SystemExit(f"Bulk mismatch in block at {block.address}")
+
+    def _time_blocks(decode) -> float:
+        start = time.perf_counter_ns()
+        for block, words in responses:
+            decode(block, words)
+        decoded = args.rounds * len(registers)
+        return (time.perf_counter_ns() - start) / decoded
+
+    sliced = min(
+        _time_blocks(
+            lambda block, words: {
+                reg.unique_id: reg.codec.decode(block.slice(words, reg))
+                for reg in block.registers
+            }
+        )
+        for _ in range(3)
+    )
+    bulk = min(
+        _time_blocks(lambda block, words: block.decoder.decode(words)) for _ in range(3)
+    )
+    print(f"{len(blocks)} blocks (max_gap=64)")
+    print(f"sliced decode   {sliced:8.0f} ns/register")
+    print(f"block decoder   {bulk:8.0f} ns/register  ({sliced / bulk:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Benchmark executor-wrapped vs. native asyncio polling of KebaModbusClient.
+
+A small Modbus TCP responder with an artificial round-trip time runs in a
+background thread. Several clients (one per simulated heat pump) then poll the
+bundled register set concurrently, once through ``read_all`` on a thread pool
+(what the integration used to do) and once through ``async_read_all``.
+
+Usage:
+    python tools/benchmark_modbus_client.py [--pumps 4] [--cycles 5] [--rtt 0.015]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from custom_components.keba_heat_pump_modbus.modbus_client import (  # noqa: E402
+    KebaModbusClient,
+)
+from custom_components.keba_heat_pump_modbus.models import ModbusRegister  # noqa: E402
+
+REGISTER_DIR = ROOT / "custom_components" / "keba_heat_pump_modbus" / "modbus_registers"
+
+
+def load_registers() -> list[ModbusRegister]:
+    registers: list[ModbusRegister] = []
+    for path in sorted(REGISTER_DIR.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        registers.extend(ModbusRegister(**item) for item in data["registers"])
+    return registers
+
+
+class FakeKebaServer:
+    """Answers FC3/FC4/FC6/FC16 with address-derived values after ``rtt`` seconds."""
+
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+        self.port = 0
+        self._ready = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def start(self) -> None:
+        threading.Thread(target=self._run, daemon=True).start()
+        self._ready.wait()
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _handle(self, reader, writer) -> None:
+        lock = asyncio.Lock()
+        try:
+            while True:
+                header = await reader.readexactly(7)
+                tid, _pid, length, unit = struct.unpack(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                asyncio.create_task(self._respond(writer, lock, tid, unit, pdu))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    async def _respond(self, writer, lock, tid: int, unit: int, pdu: bytes) -> None:
+        await asyncio.sleep(self.rtt)
+        function_code = pdu[0]
+        if function_code in (3, 4):
+            address, count = struct.unpack(">HH", pdu[1:5])
+            words = [(address + i) & 0xFFFF for i in range(count)]
+            body = struct.pack(f">BB{count}H", function_code, count * 2, *words)
+        elif function_code == 6:
+            body = pdu[:5]
+        elif function_code == 16:
+            body = pdu[:5]
+        else:
+            body = struct.pack(">BB", function_code | 0x80, 1)
+        async with lock:
+            writer.write(struct.pack(">HHHB", tid, 0, len(body) + 1, unit) + body)
+            await writer.drain()
+
+
+async def _sample_threads(stop: asyncio.Event) -> int:
+    peak = threading.active_count()
+    while not stop.is_set():
+        peak = max(peak, threading.active_count())
+        await asyncio.sleep(0.001)
+    return peak
+
+
+async def bench_executor(clients, registers, cycles: int, workers: int):
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=workers))
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_threads(stop))
+    latencies = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(loop.run_in_executor(None, c.read_all, registers) for c in clients)
+        )
+        latencies.append(time.perf_counter() - start)
+    stop.set()
+    return latencies, await sampler
+
+
+async def bench_native(clients, registers, cycles: int):
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_threads(stop))
+    latencies = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        await asyncio.gather(*(c.async_read_all(registers) for c in clients))
+        latencies.append(time.perf_counter() - start)
+    stop.set()
+    return latencies, await sampler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pumps", type=int, default=4)
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--rtt", type=float, default=0.015)
+    parser.add_argument("--gap", type=int, default=0, help="max_read_gap for planning")
+    parser.add_argument("--workers", type=int, default=2, help="executor threads")
+    args = parser.parse_args()
+
+    server = FakeKebaServer(args.rtt)
+    server.start()
+    registers = load_registers()
+
+    def make_clients():
+        return [
+            KebaModbusClient("127.0.0.1", server.port, 1, max_read_gap=args.gap)
+            for _ in range(args.pumps)
+        ]
+
+    baseline_threads = threading.active_count()
+    sync_clients = make_clients()
+    ex_lat, ex_peak = asyncio.run(
+        bench_executor(sync_clients, registers, args.cycles, args.workers)
+    )
+    for client in sync_clients:
+        client.close()
+
+    async def _native():
+        clients = make_clients()
+        try:
+            return await bench_native(clients, registers, args.cycles)
+        finally:
+            for client in clients:
+                await client.async_close()
+
+    na_lat, na_peak = asyncio.run(_native())
+    server.stop()
+
+    print(
+        f"{len(registers)} registers, {args.pumps} pumps, rtt={args.rtt * 1000:.0f} ms, "
+        f"{len(sync_clients[0].plan_reads(registers))} requests per poll"
+    )
+    for label, lat, peak in (
+        (f"executor ({args.workers} workers)", ex_lat, ex_peak),
+        ("native asyncio", na_lat, na_peak),
+    ):
+        print(
+            f"{label:<22} mean {sum(lat) / len(lat) * 1000:8.1f} ms/cycle  "
+            f"max {max(lat) * 1000:8.1f} ms  extra threads {peak - baseline_threads}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -112,6 +112,7 @@ def main(xls_path: str, json_path: str) -> None:
                 "entity_category": None,
                 "enabled_default": True,
                 "entity_platform": "sensor",
+                "poll_tier": "normal",
                 "value_map": None,
             }
         )